@@ -0,0 +1,119 @@
+"""Measure the event loop cost of fanning coordinator updates out to entities.
+
+Sets up a fleet of config entries with all per-phase sensors against
+stubbed agents, then pushes synthetic snapshots in which the given share
+of numeric values changed. Reports per poll of the whole fleet the update
+latency, the part of it spent in the entity listeners, the states written
+and the allocated memory.
+
+Run from the repository root with Home Assistant installed:
+
+    python benchmarks/bench_fanout.py --entries 50 --polls 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+import tracemalloc
+
+from fleet import StubApi, async_create_hass, create_entries, stub_api
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.entity import Entity
+
+from custom_components.eaton_ups.coordinator import SnmpCoordinator
+
+COUNTERS = {"listeners": 0.0, "writes": 0}
+
+
+def instrument() -> None:
+    """Count the time in the entity listeners and the states written."""
+    update_listeners = SnmpCoordinator.async_update_listeners
+    write_ha_state = Entity.async_write_ha_state
+
+    def async_update_listeners(self: SnmpCoordinator) -> None:
+        start = time.perf_counter()
+        update_listeners(self)
+        COUNTERS["listeners"] += time.perf_counter() - start
+
+    def async_write_ha_state(self: Entity) -> None:
+        COUNTERS["writes"] += 1
+        write_ha_state(self)
+
+    SnmpCoordinator.async_update_listeners = async_update_listeners
+    Entity.async_write_ha_state = async_write_ha_state
+
+
+async def poll(entries: list[ConfigEntry]) -> None:
+    """Advance every agent and refresh every coordinator once."""
+    for entry in entries:
+        stub_api(entry).poll()
+    await asyncio.gather(*(entry.runtime_data.async_refresh() for entry in entries))
+
+
+async def measure(entries: list[ConfigEntry], polls: int) -> dict:
+    """Return the per poll latency, listener time, writes and allocations."""
+    COUNTERS.update(listeners=0.0, writes=0)
+    cpu = time.thread_time()
+    for _ in range(polls):
+        await poll(entries)
+    cpu = time.thread_time() - cpu
+    listeners, writes = COUNTERS["listeners"], COUNTERS["writes"]
+
+    allocated = 0
+    tracemalloc.start()
+    for _ in range(polls):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        await poll(entries)
+        allocated += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+
+    return {
+        "cpu": cpu / polls,
+        "listeners": listeners / polls,
+        "writes": writes / polls,
+        "allocated": allocated / polls,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the benchmark for every change ratio."""
+    instrument()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_create_hass(config_dir)
+        entries = create_entries(args.entries)
+        await asyncio.gather(
+            *(hass.config_entries.async_add(entry) for entry in entries)
+        )
+        entities = len(hass.states.async_all())
+
+        print(f"{args.entries} entries, {entities} entities, {args.polls} poll(s)")
+        print(
+            f"{'changed':>8}{'cpu ms/poll':>13}{'listeners ms':>14}"
+            f"{'writes/poll':>13}{'alloc KiB/poll':>16}"
+        )
+        for change_ratio in args.change_ratios:
+            StubApi.change_ratio = change_ratio
+            await poll(entries)
+            result = await measure(entries, args.polls)
+            print(
+                f"{change_ratio:>8.0%}{result['cpu'] * 1000:>13.2f}"
+                f"{result['listeners'] * 1000:>14.2f}{result['writes']:>13.0f}"
+                f"{result['allocated'] / 1024:>16.1f}"
+            )
+
+        await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=50)
+    parser.add_argument("--polls", type=int, default=20)
+    parser.add_argument(
+        "--change-ratios", type=float, nargs="+", default=[0.0, 0.1, 0.5, 1.0]
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,166 @@
+"""Compare event loop busy time of the SNMP execution modes.
+
+Starts a local SNMPv3 agent (SHA-512/AES-256) on its own thread and polls it
+with a number of simulated devices, first with all SNMP processing on the
+event loop and then on the shared worker thread. The CPU time consumed by
+the event loop thread is reported together with the worst loop lag.
+
+Run from the repository root with Home Assistant installed:
+
+    python benchmarks/bench_loop_busy.py --devices 50 --rounds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+import sys
+import threading
+import time
+
+from pysnmp.carrier.asyncio.dgram import udp
+from pysnmp.entity import config, engine
+from pysnmp.entity.rfc3413 import cmdrsp, context
+from pysnmp.hlapi.asyncio import SnmpEngine
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.eaton_ups.api import SnmpApi  # noqa: E402
+from custom_components.eaton_ups.const import (  # noqa: E402
+    ATTR_AUTH_KEY,
+    ATTR_AUTH_PROTOCOL,
+    ATTR_HOST,
+    ATTR_PORT,
+    ATTR_PRIV_KEY,
+    ATTR_PRIV_PROTOCOL,
+    ATTR_USERNAME,
+    ATTR_VERSION,
+    AuthProtocol,
+    PrivProtocol,
+    SnmpVersion,
+)
+from custom_components.eaton_ups.coordinator import BASE_OIDS  # noqa: E402
+from custom_components.eaton_ups.worker import SnmpWorker  # noqa: E402
+
+USERNAME = "bench"
+AUTH_KEY = "bench-auth-key"
+PRIV_KEY = "bench-priv-key"
+
+
+def start_agent(port: int) -> None:
+    """Start an SNMPv3 agent answering on localhost in a daemon thread."""
+    ready = threading.Event()
+
+    def run() -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        snmp_engine = engine.SnmpEngine()
+        config.add_transport(
+            snmp_engine,
+            udp.DOMAIN_NAME,
+            udp.UdpTransport().open_server_mode(("127.0.0.1", port)),
+        )
+        config.add_v3_user(
+            snmp_engine,
+            USERNAME,
+            config.USM_AUTH_HMAC384_SHA512,
+            AUTH_KEY,
+            config.USM_PRIV_CFB256_AES,
+            PRIV_KEY,
+        )
+        config.add_vacm_user(snmp_engine, 3, USERNAME, "authPriv", (1, 3, 6), (1, 3, 6))
+        snmp_context = context.SnmpContext(snmp_engine)
+        cmdrsp.GetCommandResponder(snmp_engine, snmp_context)
+        cmdrsp.NextCommandResponder(snmp_engine, snmp_context)
+        cmdrsp.BulkCommandResponder(snmp_engine, snmp_context)
+        snmp_engine.transport_dispatcher.job_started(1)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+    threading.Thread(target=run, daemon=True).start()
+    ready.wait()
+
+
+async def create_apis(
+    count: int, port: int, snmp_engine: SnmpEngine, worker: SnmpWorker | None
+) -> list[SnmpApi]:
+    """Create an api per simulated device."""
+    data = {
+        ATTR_HOST: "127.0.0.1",
+        ATTR_PORT: port,
+        ATTR_VERSION: SnmpVersion.V3,
+        ATTR_USERNAME: USERNAME,
+        ATTR_AUTH_PROTOCOL: AuthProtocol.SHA_512,
+        ATTR_AUTH_KEY: AUTH_KEY,
+        ATTR_PRIV_PROTOCOL: PrivProtocol.AES_256,
+        ATTR_PRIV_KEY: PRIV_KEY,
+    }
+    apis = []
+    for _ in range(count):
+        api = SnmpApi(snmp_engine)
+        if worker is not None:
+            api.use_worker(worker)
+        await api.configure(data, 5, 1)
+        apis.append(api)
+    return apis
+
+
+async def measure(apis: list[SnmpApi], oids: list[str], rounds: int) -> dict:
+    """Poll all apis and measure the event loop thread."""
+    lag = 0.0
+    running = True
+
+    async def ticker() -> None:
+        nonlocal lag
+        while running:
+            start = time.monotonic()
+            await asyncio.sleep(0.01)
+            lag = max(lag, time.monotonic() - start - 0.01)
+
+    tick = asyncio.create_task(ticker())
+    cpu = time.thread_time()
+    wall = time.monotonic()
+    for _ in range(rounds):
+        await asyncio.gather(*(api.get(list(oids)) for api in apis))
+    cpu = time.thread_time() - cpu
+    wall = time.monotonic() - wall
+    running = False
+    await tick
+
+    return {"cpu": cpu, "wall": wall, "lag": lag}
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the benchmark for both execution modes."""
+    start_agent(args.port)
+    oids = list(BASE_OIDS)
+
+    snmp_engine = SnmpEngine()
+    worker = SnmpWorker()
+    worker.start()
+    modes = {
+        "loop": await create_apis(args.devices, args.port, snmp_engine, None),
+        "thread": await create_apis(args.devices, args.port, worker.snmpEngine, worker),
+    }
+
+    print(f"{args.devices} device(s), {args.rounds} round(s), {len(oids)} OID(s)")
+    print(f"{'mode':<8}{'loop cpu s':>12}{'wall s':>10}{'max lag ms':>12}")
+    for mode, apis in modes.items():
+        await measure(apis, oids, 1)
+        result = await measure(apis, oids, args.rounds)
+        print(
+            f"{mode:<8}{result['cpu']:>12.3f}{result['wall']:>10.3f}"
+            f"{result['lag'] * 1000:>12.1f}"
+        )
+
+    snmp_engine.close_dispatcher()
+    worker.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--port", type=int, default=16161)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,110 @@
+"""Measure the import and setup time of the integration.
+
+Imports the integration and its config flow, which Home Assistant
+preloads with it, in fresh interpreters with the Home Assistant modules
+they use already loaded. Reports the import time of the integration and
+of pysnmp, which is deferred until the first entry is set up. Then sets
+up fleets of config entries against stubbed agents and reports the time
+from async_setup_entry until their entities are added.
+
+Run from the repository root with Home Assistant installed:
+
+    python benchmarks/bench_startup.py --entries 1 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import time
+
+from fleet import async_create_hass, create_entries
+
+ROOT = Path(__file__).resolve().parents[1]
+
+IMPORT_SCRIPT = f"""
+import sys
+import time
+
+sys.path.insert(0, {str(ROOT)!r})
+
+import homeassistant.components.binary_sensor
+import homeassistant.components.button
+import homeassistant.components.http
+import homeassistant.components.recorder.statistics
+import homeassistant.components.sensor
+import homeassistant.components.switch
+import homeassistant.helpers.selector
+import homeassistant.helpers.update_coordinator
+
+start = time.perf_counter()
+import custom_components.eaton_ups.binary_sensor
+import custom_components.eaton_ups.config_flow
+import custom_components.eaton_ups.sensor
+imported = time.perf_counter()
+from custom_components.eaton_ups.api import load_pysnmp
+load_pysnmp()
+print(imported - start, time.perf_counter() - imported)
+"""
+
+
+def measure_import(repeat: int) -> tuple[float, float]:
+    """Return the best import time of the integration and of pysnmp."""
+    results = [
+        tuple(
+            map(
+                float,
+                subprocess.run(
+                    [sys.executable, "-c", IMPORT_SCRIPT],
+                    capture_output=True,
+                    check=True,
+                    text=True,
+                ).stdout.split(),
+            )
+        )
+        for _ in range(repeat)
+    ]
+    return min(result[0] for result in results), min(result[1] for result in results)
+
+
+async def measure_setup(count: int) -> tuple[float, int]:
+    """Return the seconds to set up the entries and the entities added."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_create_hass(config_dir)
+        entries = create_entries(count)
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(hass.config_entries.async_add(entry) for entry in entries)
+        )
+        elapsed = time.perf_counter() - start
+        entities = len(hass.states.async_all())
+        await hass.async_stop(force=True)
+    return elapsed, entities
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    integration, pysnmp = measure_import(args.repeat)
+    print(f"import (best of {args.repeat})")
+    print(f"{'integration ms':>16}{'pysnmp ms':>12}")
+    print(f"{integration * 1000:>16.1f}{pysnmp * 1000:>12.1f}")
+    print()
+
+    print(f"{'entries':>8}{'entities':>10}{'setup ms':>10}{'ms/entry':>10}")
+    for count in args.entries:
+        elapsed, entities = await measure_setup(count)
+        print(
+            f"{count:>8}{entities:>10}{elapsed * 1000:>10.1f}"
+            f"{elapsed * 1000 / count:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, nargs="+", default=[1, 100])
+    parser.add_argument("--repeat", type=int, default=5)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,70 @@
+"""Measure the per-poll cost of building the request var-binds.
+
+Compares building and MIB-resolving fresh ObjectType instances for every
+poll with reusing the cached instances of SnmpApi. Reports CPU time and
+peak allocated memory per poll of the coordinator's base OIDs.
+
+Run from the repository root with Home Assistant installed:
+
+    python benchmarks/bench_var_binds.py --polls 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+
+from pysnmp.hlapi.asyncio import SnmpEngine
+from pysnmp.hlapi.v3arch.asyncio.cmdgen import VB_PROCESSOR
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.eaton_ups.api import SnmpApi, load_pysnmp  # noqa: E402
+from custom_components.eaton_ups.coordinator import BASE_OIDS  # noqa: E402
+
+
+def poll(snmp_engine: SnmpEngine, build, polls: int) -> tuple[float, float]:
+    """Return CPU seconds and peak allocated bytes per poll."""
+    cpu = time.process_time()
+    for _ in range(polls):
+        VB_PROCESSOR.make_varbinds(snmp_engine.cache, build(BASE_OIDS))
+    cpu = time.process_time() - cpu
+
+    allocated = 0
+    tracemalloc.start()
+    for _ in range(polls):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        VB_PROCESSOR.make_varbinds(snmp_engine.cache, build(BASE_OIDS))
+        allocated += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+    return cpu / polls, allocated / polls
+
+
+def main(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    load_pysnmp()
+    snmp_engine = SnmpEngine()
+    api = SnmpApi(snmp_engine)
+    modes = {
+        "fresh": SnmpApi.construct_object_types,
+        "cached": api.object_types,
+    }
+
+    for build in modes.values():
+        poll(snmp_engine, build, 1)
+
+    print(f"{args.polls} poll(s) of {len(BASE_OIDS)} OID(s)")
+    print(f"{'mode':<8}{'cpu us/poll':>14}{'alloc B/poll':>14}")
+    for mode, build in modes.items():
+        cpu, allocated = poll(snmp_engine, build, args.polls)
+        print(f"{mode:<8}{cpu * 1e6:>14.1f}{allocated:>14.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=1000)
+    main(parser.parse_args())
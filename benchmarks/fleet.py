@@ -0,0 +1,198 @@
+"""Simulated fleet of Eaton UPS config entries for the benchmarks.
+
+Sets up a Home Assistant instance in a temporary config directory with
+only the registries and platforms the integration needs, and config
+entries whose agents are answered by ``StubApi`` without any network.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import random
+import sys
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant import loader
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.config_entries import SOURCE_USER, ConfigEntries, ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    area_registry as ar,
+    category_registry as cr,
+    device_registry as dr,
+    entity,
+    entity_registry as er,
+    floor_registry as fr,
+    issue_registry as ir,
+    label_registry as lr,
+    translation,
+)
+from homeassistant.setup import async_setup_component
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import custom_components.eaton_ups as integration  # noqa: E402
+from custom_components.eaton_ups.api import SnmpApi, async_load_pysnmp  # noqa: E402
+from custom_components.eaton_ups.const import (  # noqa: E402
+    ATTR_COMMUNITY,
+    ATTR_HOST,
+    ATTR_NAME,
+    ATTR_PORT,
+    ATTR_VERSION,
+    DOMAIN,
+    SNMP_OID_ALARMS,
+    SNMP_OID_BATTERY_LAST_REPLACED,
+    SNMP_OID_IDENT_FIRMWARE_VERSION,
+    SNMP_OID_IDENT_PART_NUMBER,
+    SNMP_OID_IDENT_PRODUCT_NAME,
+    SNMP_OID_IDENT_SERIAL_NUMBER,
+    SNMP_OID_IDENT_SYSTEM_NAME,
+    SNMP_OID_INPUT_NUM_PHASES,
+    SNMP_OID_OUTPUT_NUM_PHASES,
+    SNMP_OID_RECEPTACLES,
+    SNMP_OID_SYSTEM_UPTIME,
+    SnmpVersion,
+)
+from custom_components.eaton_ups.descriptions import SENSORS  # noqa: E402
+
+PHASES = 3
+RECEPTACLES = 2
+
+# Raw value of every other OID, a valid member of all value enums.
+DEFAULT_VALUE = 2
+
+# Prefixes of the OIDs with plain numeric values that may change per poll.
+NUMERIC_PREFIXES = tuple(
+    description.value_oid.replace("index", "")
+    for description in SENSORS
+    if not description.derived
+    and description.converter is None
+    and description.device_class != SensorDeviceClass.ENUM
+)
+
+
+class StubApi(SnmpApi):
+    """Answer every request from synthetic values without network traffic.
+
+    Every poll changes the numeric values of the given share of OIDs, all
+    other values stay the same.
+    """
+
+    change_ratio = 0.0
+
+    def __init__(self, snmpEngine: Any = None) -> None:
+        """Init the StubApi."""
+        super().__init__(snmpEngine)
+        self._serial_number = ""
+        self._uptime = 0
+        self._random = random.Random(0)
+        self._values: dict[str, Any] = {}
+
+    async def setup(self, entry: ConfigEntry) -> None:
+        """Setup the StubApi."""
+        await async_load_pysnmp()
+        self._serial_number = entry.unique_id
+        self._values = {
+            SNMP_OID_IDENT_SYSTEM_NAME: entry.title,
+            SNMP_OID_IDENT_PRODUCT_NAME: "Eaton 9PX",
+            SNMP_OID_IDENT_PART_NUMBER: "9PX6KIRTN",
+            SNMP_OID_IDENT_SERIAL_NUMBER: self._serial_number,
+            SNMP_OID_IDENT_FIRMWARE_VERSION: "3.1.0",
+            SNMP_OID_INPUT_NUM_PHASES: PHASES,
+            SNMP_OID_OUTPUT_NUM_PHASES: PHASES,
+            SNMP_OID_RECEPTACLES: RECEPTACLES,
+            SNMP_OID_ALARMS: 0,
+            SNMP_OID_BATTERY_LAST_REPLACED: "01/01/2024",
+        }
+
+    def poll(self) -> None:
+        """Advance the agent to its next snapshot."""
+        self._uptime += 6000
+        for oid, value in self._values.items():
+            if (
+                isinstance(value, int)
+                and oid.startswith(NUMERIC_PREFIXES)
+                and self._random.random() < self.change_ratio
+            ):
+                self._values[oid] = value + 1
+
+    def value(self, oid: str) -> Any:
+        """Return the current value of an OID."""
+        if oid == SNMP_OID_SYSTEM_UPTIME:
+            return self._uptime
+        return self._values.setdefault(oid, DEFAULT_VALUE)
+
+    async def _get(self, oids) -> dict:
+        """Get data for given OIDs from the stub."""
+        return {oid: self.value(oid) for oid in oids}
+
+    async def _get_bulk(self, oids, count, start_from=1) -> list:
+        """Get table data for given OIDs from the stub."""
+        return [
+            {f"{oid}{row}": self.value(f"{oid}{row}") for oid in oids}
+            for row in range(1, count + 1)
+        ]
+
+    async def walk(self, oids, max_rows=0) -> dict:
+        """Walk the stub, which has no environment probes."""
+        return {}
+
+
+async def async_create_hass(config_dir: str) -> HomeAssistant:
+    """Create a Home Assistant instance able to set up the integration."""
+    hass = HomeAssistant(config_dir)
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    entity.async_setup(hass)
+    await asyncio.gather(
+        ar.async_load(hass),
+        cr.async_load(hass),
+        dr.async_load(hass),
+        er.async_load(hass),
+        fr.async_load(hass),
+        ir.async_load(hass),
+        lr.async_load(hass),
+        translation.async_setup(hass),
+    )
+    hass.config_entries = ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    # The metrics view is off, the HTTP server is not needed.
+    hass.config.components.add("http")
+    await async_setup_component(hass, "sensor", {})
+    await async_setup_component(hass, "binary_sensor", {})
+    await async_setup_component(hass, "button", {})
+    await async_setup_component(hass, "switch", {})
+    integration.SnmpApi = StubApi
+    return hass
+
+
+def create_entries(count: int) -> list[ConfigEntry]:
+    """Create config entries of simulated agents."""
+    return [
+        ConfigEntry(
+            data={
+                ATTR_NAME: f"UPS {index}",
+                ATTR_HOST: f"10.0.{index // 256}.{index % 256}",
+                ATTR_PORT: 161,
+                ATTR_VERSION: SnmpVersion.V2C,
+                ATTR_COMMUNITY: "public",
+            },
+            discovery_keys=MappingProxyType({}),
+            domain=DOMAIN,
+            minor_version=1,
+            options={},
+            source=SOURCE_USER,
+            subentries_data=None,
+            title=f"UPS {index}",
+            unique_id=f"SN{index:06d}",
+            version=1,
+        )
+        for index in range(count)
+    ]
+
+
+def stub_api(entry: ConfigEntry) -> StubApi:
+    """Return the stub behind the coordinator of a loaded entry."""
+    return entry.runtime_data._api
@@ -2,31 +2,105 @@
 
 from __future__ import annotations
 
-from homeassistant.components.snmp import async_get_snmp_engine
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers.typing import ConfigType
 
-from .api import SnmpApi
-from .const import PLATFORMS
+from .api import SnmpApi, async_get_engine
+from .capture import SnmpCapture, SnmpReplayApi
+from .const import (
+    ATTR_CAPTURE,
+    ATTR_EXECUTION_MODE,
+    ATTR_METRICS,
+    ATTR_PROXY_PORT,
+    ATTR_REPLAY_FILE,
+    ATTR_REPLAY_SPEED,
+    ATTR_STATISTICS,
+    DOMAIN,
+    PLATFORMS,
+    ExecutionMode,
+)
 from .coordinator import SnmpCoordinator
+from .metrics import async_register_metrics_view
+from .services import async_setup_services
+from .statistics import SnmpStatistics
+from .worker import async_get_worker, async_release_worker
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Eaton UPS services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Eaton UPS from a config entry."""
-    snmpEngine = await async_get_snmp_engine(hass)
-    api = SnmpApi(snmpEngine)
+    if entry.options.get(ATTR_REPLAY_FILE):
+        api = SnmpReplayApi(
+            hass.config.path(entry.options[ATTR_REPLAY_FILE]),
+            entry.options.get(ATTR_REPLAY_SPEED, 1.0),
+        )
+    elif entry.options.get(ATTR_EXECUTION_MODE) == ExecutionMode.THREAD:
+        worker = await async_get_worker(hass)
+        api = SnmpApi(worker.snmpEngine)
+        api.use_worker(worker)
+        entry.async_on_unload(lambda: async_release_worker(hass, worker))
+    else:
+        api = SnmpApi(await async_get_engine(hass))
+    if entry.options.get(ATTR_CAPTURE):
+        api.start_capture(
+            SnmpCapture(hass.config.path(f"{DOMAIN}_{entry.entry_id}.jsonl"))
+        )
     await api.setup(entry)
     coordinator = SnmpCoordinator(hass=hass, api=api)
+    if isinstance(api, SnmpReplayApi) and api.speed > 0:
+        coordinator.update_interval /= api.speed
     await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = coordinator
 
+    if entry.options.get(ATTR_METRICS):
+        async_register_metrics_view(hass)
+
+    if entry.options.get(ATTR_STATISTICS):
+        statistics = SnmpStatistics(hass, coordinator)
+        await statistics.async_load()
+        entry.async_on_unload(coordinator.async_add_listener(statistics.async_record))
+        entry.async_on_unload(statistics.async_flush)
+
+    if entry.options.get(ATTR_PROXY_PORT):
+        from .responder import SnmpResponder
+
+        responder = SnmpResponder(hass, coordinator)
+        await responder.async_start()
+        entry.async_on_unload(responder.close)
+
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply a changed configuration to a config entry.
+
+    Changed connection settings are swapped into the running coordinator,
+    changed options reload the entry. Other updates, like a new title, need
+    neither.
+    """
+    coordinator: SnmpCoordinator = entry.runtime_data
+    if entry.options == coordinator.options:
+        if entry.data != coordinator.config_data:
+            await coordinator.async_reconfigure()
+        return
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
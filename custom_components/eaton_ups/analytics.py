@@ -0,0 +1,270 @@
+"""Battery aging analytics of the Eaton UPS discharge history."""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    BATTERY_FADE_MIN_DAYS,
+    BATTERY_REFERENCE_LOAD,
+    DERIVED_BATTERY_CAPACITY_TREND,
+    DERIVED_BATTERY_HEALTH,
+    DERIVED_BATTERY_REFERENCE_RUNTIME,
+    DERIVED_BATTERY_TIME_TO_EMPTY,
+    DISCHARGE_MAX_EVENTS,
+    DISCHARGE_MAX_SAMPLES,
+    DISCHARGE_MIN_DROP,
+    DISCHARGE_MIN_DURATION,
+    DOMAIN,
+    SNMP_OID_BATTERY_CAPACITY,
+    SNMP_OID_BATTERY_REMAINING,
+    SNMP_OID_BATTERY_TEST_STATUS,
+    SNMP_OID_OUTPUT_LOAD,
+    SNMP_OID_OUTPUT_NUM_PHASES,
+    SNMP_OID_OUTPUT_SOURCE,
+    TIME_TO_EMPTY_TIME_CONSTANT,
+    BatteryTestStatus,
+    OutputSource,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import SnmpCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+SECONDS_PER_DAY = 86400
+
+# Bound of the exponents, far beyond any plausible runtime or fade.
+MAX_EXPONENT = 50.0
+
+
+def bounded(exponent: float) -> float:
+    """Clamp an exponent, so its power cannot overflow."""
+    return max(-MAX_EXPONENT, min(MAX_EXPONENT, exponent))
+
+
+def is_discharging(data: dict) -> bool:
+    """Return if the battery supplies the output, on an outage or a test."""
+    return (
+        data.get(SNMP_OID_OUTPUT_SOURCE) == OutputSource.battery.value
+        or data.get(SNMP_OID_BATTERY_TEST_STATUS) == BatteryTestStatus.in_progress.value
+    )
+
+
+def mean_load(data: dict, values: dict) -> float | None:
+    """Return the mean load of the output phases in percent."""
+    loads = []
+    for index in range(1, data.get(SNMP_OID_OUTPUT_NUM_PHASES, 0) + 1):
+        load = values.get(SNMP_OID_OUTPUT_LOAD.replace("index", str(index)))
+        if isinstance(load, int | float):
+            loads.append(load)
+    return sum(loads) / len(loads) if loads else None
+
+
+def summarize_discharge(samples: list[list[float]]) -> list[float] | None:
+    """Reduce the samples of a discharge to its start, mean load and runtime.
+
+    The runtime is the time a full battery would last at the mean load,
+    extrapolated from the least squares slope of the capacity.
+    """
+    import numpy as np
+
+    started, load, capacity = np.asarray(samples, dtype=float).T
+    if (
+        started[-1] - started[0] < DISCHARGE_MIN_DURATION
+        or capacity.max() - capacity.min() < DISCHARGE_MIN_DROP
+    ):
+        return None
+    slope = np.polyfit(started - started[0], capacity, 1)[0]
+    if slope >= 0 or load.mean() <= 0:
+        return None
+    return [float(started[0]), float(load.mean()), float(-100 / slope)]
+
+
+def fit_aging(events: list[list[float]], now: float) -> dict[str, float | None]:
+    """Fit the runtime of all discharges against their load and age.
+
+    The model log(runtime) = a + e * log(load) + b * days is solved in one
+    least squares step, e describes how runtime shrinks with load and b
+    how the effective capacity fades over time. With discharges at only
+    one load, runtime is assumed inversely proportional to the load. The
+    fade is only fitted once the discharges span enough days.
+    """
+    import numpy as np
+
+    started, load, runtime = np.asarray(events, dtype=float).T
+    days = (started - started[0]) / SECONDS_PER_DAY
+    log_load = np.log(load)
+    log_runtime = np.log(runtime)
+    reference = math.log(BATTERY_REFERENCE_LOAD)
+    fit_fade = np.ptp(days) >= BATTERY_FADE_MIN_DAYS
+
+    fade = None
+    if len(events) >= 3 and np.ptp(log_load) > 0.2:
+        columns = [np.ones_like(days), log_load]
+        if fit_fade:
+            columns.append(days)
+        coefficients, *_ = np.linalg.lstsq(np.column_stack(columns), log_runtime)
+        offset, exponent = coefficients[:2]
+        if fit_fade:
+            fade = coefficients[2]
+    else:
+        exponent = -1.0
+        normalized = log_runtime - exponent * log_load
+        if fit_fade:
+            fade, offset = np.polyfit(days, normalized, 1)
+        else:
+            offset = float(normalized.mean())
+
+    elapsed = (now - started[0]) / SECONDS_PER_DAY
+    runtime_now = offset + exponent * reference + (fade or 0.0) * elapsed
+    return {
+        DERIVED_BATTERY_REFERENCE_RUNTIME: round(math.exp(bounded(runtime_now))),
+        DERIVED_BATTERY_HEALTH: None
+        if fade is None
+        else round(100 * math.exp(bounded(fade * elapsed)), 1),
+        DERIVED_BATTERY_CAPACITY_TREND: None
+        if fade is None
+        else round(100 * math.expm1(bounded(fade * 365)), 1),
+    }
+
+
+def analyze(
+    events: list[list[float]], samples: list[list[float]], now: float
+) -> tuple[list[list[float]], dict[str, float | None] | None]:
+    """Add a finished discharge to the events and fit them again."""
+    if samples and (event := summarize_discharge(samples)) is not None:
+        events = [*events, event][-DISCHARGE_MAX_EVENTS:]
+    return events, fit_aging(events, now) if events else None
+
+
+class TimeToEmptyEstimator:
+    """Estimate the time to empty from the discharge rate per load percent.
+
+    The capacity only changes in whole percents, so the rate is measured
+    between two changes over the load integrated since the previous one
+    and smoothed with a time based exponential average. Every sample costs
+    O(1), and the estimate follows a load change with the next sample.
+    The estimate of the card seeds the rate until the first change.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the estimator."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the current discharge."""
+        self._rate: float | None = None
+        self._anchor: tuple[float, float] | None = None
+        self._previous: float | None = None
+        self._load_seconds = 0.0
+
+    def update(
+        self, now: float, capacity: float, load: float, remaining: Any
+    ) -> int | None:
+        """Add a sample and return the seconds until the battery is empty."""
+        if self._rate is None and isinstance(remaining, int | float) and remaining:
+            self._rate = capacity / remaining / max(load, 1.0)
+
+        if self._anchor is None:
+            self._anchor = (now, capacity)
+        else:
+            self._load_seconds += load * (now - self._previous)
+            started, anchor_capacity = self._anchor
+            if capacity < anchor_capacity and self._load_seconds > 0:
+                observed = (anchor_capacity - capacity) / self._load_seconds
+                if self._rate is None:
+                    self._rate = observed
+                else:
+                    alpha = 1 - math.exp(-(now - started) / TIME_TO_EMPTY_TIME_CONSTANT)
+                    self._rate += alpha * (observed - self._rate)
+                self._anchor = (now, capacity)
+                self._load_seconds = 0.0
+        self._previous = now
+
+        if not self._rate or load <= 0:
+            return None
+        return round(capacity / (self._rate * load))
+
+
+class BatteryAnalytics:
+    """Collect discharge curves and fit the battery aging in the executor.
+
+    Samples are only kept while the battery discharges, each one also
+    updates the time to empty. When the discharge ends it is reduced to one
+    event and all events are fitted again, the results become derived
+    values of the coordinator on its next update.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator: SnmpCoordinator) -> None:
+        """Initialize the analytics."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}.{coordinator.config_entry.entry_id}.battery",
+        )
+        self._events: list[list[float]] = []
+        self._samples: list[list[float]] = []
+        self.results: dict[str, float | None] = {
+            DERIVED_BATTERY_REFERENCE_RUNTIME: None,
+            DERIVED_BATTERY_HEALTH: None,
+            DERIVED_BATTERY_CAPACITY_TREND: None,
+            DERIVED_BATTERY_TIME_TO_EMPTY: None,
+        }
+        self._estimator = TimeToEmptyEstimator()
+
+    async def async_load(self) -> None:
+        """Load the stored discharge events and fit them."""
+        if (stored := await self._store.async_load()) is not None:
+            self._events = stored["events"]
+        if self._events:
+            await self._async_analyze([])
+
+    def record(self, data: dict, values: dict) -> None:
+        """Add the values of a poll to the current discharge."""
+        if is_discharging(data):
+            load = mean_load(data, values)
+            capacity = data.get(SNMP_OID_BATTERY_CAPACITY)
+            if load is None or not isinstance(capacity, int | float):
+                return
+            if len(self._samples) < DISCHARGE_MAX_SAMPLES:
+                self._samples.append([time.time(), load, capacity])
+            self.results[DERIVED_BATTERY_TIME_TO_EMPTY] = self._estimator.update(
+                time.monotonic(), capacity, load, data.get(SNMP_OID_BATTERY_REMAINING)
+            )
+            return
+
+        self.results[DERIVED_BATTERY_TIME_TO_EMPTY] = None
+        self._estimator.reset()
+        if self._samples:
+            samples, self._samples = self._samples, []
+            self._coordinator.config_entry.async_create_background_task(
+                self._hass,
+                self._async_analyze(samples),
+                f"{DOMAIN} battery analytics",
+            )
+
+    async def _async_analyze(self, samples: list[list[float]]) -> None:
+        """Fit the discharge events in the executor."""
+        try:
+            events, results = await self._hass.async_add_executor_job(
+                analyze, self._events, samples, time.time()
+            )
+        except (ValueError, ArithmeticError) as err:
+            _LOGGER.debug("Battery analytics failed: %s", err)
+            return
+        if events is not self._events:
+            self._events = events
+            self._store.async_delay_save(lambda: {"events": self._events}, 60)
+        if results is not None:
+            self.results.update(results)
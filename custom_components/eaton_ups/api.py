@@ -2,50 +2,173 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
 import logging
+import time
+from typing import TYPE_CHECKING, Any
 
 from pysnmp.error import PySnmpError
-import pysnmp.hlapi.asyncio as hlapi
-from pysnmp.hlapi.asyncio import SnmpEngine
+from pysnmp.proto import errind
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
 
 from .const import (
     ATTR_AUTH_KEY,
     ATTR_AUTH_PROTOCOL,
     ATTR_COMMUNITY,
     ATTR_HOST,
+    ATTR_HOSTS,
     ATTR_PORT,
     ATTR_PRIV_KEY,
     ATTR_PRIV_PROTOCOL,
     ATTR_USERNAME,
     ATTR_VERSION,
+    SNMP_FAILOVER_RETRIES,
+    SNMP_FAILOVER_TIMEOUT,
+    SNMP_MAX_REPETITIONS,
+    SNMP_OID_EATON_ENTERPRISE,
+    SNMP_OID_IDENT_OBJECT_ID,
+    SNMP_OID_IDENT_PRODUCT_NAME,
+    SNMP_OID_IDENT_PRODUCT_NAME_XUPS,
+    SNMP_OID_IDENT_SERIAL_NUMBER,
+    SNMP_OID_IDENT_SERIAL_NUMBER_XUPS,
+    SNMP_OID_IDENT_SYSTEM_NAME,
     SNMP_PORT_DEFAULT,
+    SNMP_WALK_MAX_ROWS,
     AuthProtocol,
+    MibProfile,
     PrivProtocol,
     SnmpVersion,
 )
 
-AUTH_MAP = {
-    AuthProtocol.NO_AUTH: hlapi.USM_AUTH_NONE,
-    AuthProtocol.MD5: hlapi.USM_AUTH_HMAC96_MD5,
-    AuthProtocol.SHA: hlapi.USM_AUTH_HMAC96_SHA,
-    AuthProtocol.SHA_224: hlapi.USM_AUTH_HMAC128_SHA224,
-    AuthProtocol.SHA_256: hlapi.USM_AUTH_HMAC192_SHA256,
-    AuthProtocol.SHA_384: hlapi.USM_AUTH_HMAC256_SHA384,
-    AuthProtocol.SHA_512: hlapi.USM_AUTH_HMAC384_SHA512,
-}
-
-PRIV_MAP = {
-    PrivProtocol.NO_PRIV: hlapi.USM_PRIV_NONE,
-    PrivProtocol.AES: hlapi.USM_PRIV_CFB128_AES,
-    PrivProtocol.AES_192: hlapi.USM_PRIV_CFB192_AES,
-    PrivProtocol.AES_256: hlapi.USM_PRIV_CFB256_AES,
-}
+if TYPE_CHECKING:
+    import pysnmp.hlapi.asyncio as hlapi
+    from pysnmp.hlapi.asyncio import SnmpEngine
+
+    from .capture import SnmpCapture
+    from .worker import SnmpWorker
+
+AUTH_MAP: dict[AuthProtocol, Any] = {}
+
+PRIV_MAP: dict[PrivProtocol, Any] = {}
+
+AUTH_ERRORS = (
+    errind.AuthenticationError,
+    errind.AuthenticationFailure,
+    errind.DecryptionError,
+    errind.UnknownSecurityName,
+    errind.UnknownUserName,
+    errind.UnsupportedSecurityLevel,
+    errind.WrongDigest,
+)
+
+IDENTITY_OIDS = [
+    SNMP_OID_IDENT_OBJECT_ID,
+    SNMP_OID_IDENT_SYSTEM_NAME,
+    SNMP_OID_IDENT_PRODUCT_NAME,
+    SNMP_OID_IDENT_PRODUCT_NAME_XUPS,
+    SNMP_OID_IDENT_SERIAL_NUMBER,
+    SNMP_OID_IDENT_SERIAL_NUMBER_XUPS,
+]
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def load_pysnmp() -> None:
+    """Import the pysnmp high level API and build the protocol maps.
+
+    The import takes longer than the rest of the integration together, so
+    it is deferred until the first agent is configured and shared by all
+    entries.
+    """
+    global hlapi
+    import pysnmp.hlapi.asyncio as hlapi
+
+    PRIV_MAP.update(
+        {
+            PrivProtocol.NO_PRIV: hlapi.USM_PRIV_NONE,
+            PrivProtocol.AES: hlapi.USM_PRIV_CFB128_AES,
+            PrivProtocol.AES_192: hlapi.USM_PRIV_CFB192_AES,
+            PrivProtocol.AES_256: hlapi.USM_PRIV_CFB256_AES,
+        }
+    )
+    AUTH_MAP.update(
+        {
+            AuthProtocol.NO_AUTH: hlapi.USM_AUTH_NONE,
+            AuthProtocol.MD5: hlapi.USM_AUTH_HMAC96_MD5,
+            AuthProtocol.SHA: hlapi.USM_AUTH_HMAC96_SHA,
+            AuthProtocol.SHA_224: hlapi.USM_AUTH_HMAC128_SHA224,
+            AuthProtocol.SHA_256: hlapi.USM_AUTH_HMAC192_SHA256,
+            AuthProtocol.SHA_384: hlapi.USM_AUTH_HMAC256_SHA384,
+            AuthProtocol.SHA_512: hlapi.USM_AUTH_HMAC384_SHA512,
+        }
+    )
+
+
+async def async_load_pysnmp() -> None:
+    """Load pysnmp in the executor, unless an earlier entry loaded it."""
+    if not AUTH_MAP:
+        await asyncio.get_running_loop().run_in_executor(None, load_pysnmp)
+
+
+async def async_get_engine(hass: HomeAssistant) -> SnmpEngine:
+    """Return the SNMP engine shared with the SNMP integration.
+
+    Its helper module imports the pysnmp high level API, so it is only
+    imported once pysnmp was loaded in the executor.
+    """
+    await async_load_pysnmp()
+    from homeassistant.components.snmp import async_get_snmp_engine
+
+    return await async_get_snmp_engine(hass)
+
+
+class SnmpAuthError(RuntimeError):
+    """Error to indicate the agent rejected the credentials."""
+
+
+class SnmpTimeoutError(RuntimeError):
+    """Error to indicate the agent did not answer in time."""
+
+
+def detect_profile(data: Mapping[str, Any]) -> MibProfile | None:
+    """Detect the MIB profile from the identity data of an agent."""
+    if data.get(SNMP_OID_IDENT_PRODUCT_NAME) is not None or str(
+        data.get(SNMP_OID_IDENT_OBJECT_ID, "")
+    ).startswith(SNMP_OID_EATON_ENTERPRISE + "."):
+        return MibProfile.XUPS
+    if data.get(SNMP_OID_IDENT_PRODUCT_NAME_XUPS) is not None:
+        return MibProfile.RFC1628
+    return None
+
+
+def get_serial_number(data: Mapping[str, Any]) -> str | None:
+    """Return the serial number from the identity data of an agent."""
+    serial_number = data.get(
+        SNMP_OID_IDENT_SERIAL_NUMBER, data.get(SNMP_OID_IDENT_SERIAL_NUMBER_XUPS)
+    )
+    return None if serial_number is None else str(serial_number)
+
+
+@dataclass
+class SnmpAgent:
+    """One of the agent addresses answering for the same UPS."""
+
+    host: str
+    target: hlapi.UdpTransportTarget | hlapi.Udp6TransportTarget
+    srtt: float | None = None
+    failed: bool = False
+    other_device: bool = False
+
+    def observe(self, rtt: float) -> None:
+        """Update the smoothed round trip time (RFC 6298)."""
+        self.srtt = rtt if self.srtt is None else 0.875 * self.srtt + 0.125 * rtt
+        self.failed = False
+
+
 class SnmpApi:
     """Provide an api for Eaton UPS."""
 
@@ -56,52 +179,226 @@ class SnmpApi:
     def __init__(self, snmpEngine: SnmpEngine) -> None:
         """Init the SnmpApi."""
         self._snmpEngine = snmpEngine
+        self._capture: SnmpCapture | None = None
+        self._worker: SnmpWorker | None = None
+        self._object_types: dict[tuple[str, ...], list[hlapi.ObjectType]] = {}
+        self._agents: list[SnmpAgent] = []
 
     async def setup(self, entry: ConfigEntry) -> None:
         """Setup the SnmpApi."""
         try:
-            self._target = await hlapi.UdpTransportTarget.create(
-                (
-                    entry.data.get(ATTR_HOST),
-                    entry.data.get(ATTR_PORT, SNMP_PORT_DEFAULT),
-                ),
-                10,
-            )
-        except PySnmpError:
+            await self.configure(entry.data)
+        except PySnmpError as err:
+            _LOGGER.error("Invalid SNMP host: %s", err)
+
+    async def configure(
+        self,
+        data: Mapping[str, Any],
+        timeout: float = 10,
+        retries: int = 5,
+        security_name: str | None = None,
+    ) -> None:
+        """Configure target and credentials from the given config data.
+
+        With additional agent addresses every agent gets a short timeout, so
+        a dead one fails over to the next before the poll times out.
+        """
+        await async_load_pysnmp()
+        hosts = list(dict.fromkeys([data.get(ATTR_HOST), *data.get(ATTR_HOSTS, [])]))
+        port = data.get(ATTR_PORT, SNMP_PORT_DEFAULT)
+        if len(hosts) > 1:
+            timeout = min(timeout, SNMP_FAILOVER_TIMEOUT)
+            retries = min(retries, SNMP_FAILOVER_RETRIES)
+        self._target = await __class__.create_target(hosts[0], port, timeout, retries)
+        self._agents = [SnmpAgent(hosts[0], self._target)]
+        for host in hosts[1:]:
             try:
-                self._target = await hlapi.Udp6TransportTarget.create(
-                    (
-                        entry.data.get(ATTR_HOST),
-                        entry.data.get(ATTR_PORT, SNMP_PORT_DEFAULT),
-                    ),
-                    10,
-                )
+                target = await __class__.create_target(host, port, timeout, retries)
             except PySnmpError as err:
-                _LOGGER.error("Invalid SNMP host: %s", err)
-                return
+                _LOGGER.error("Invalid SNMP host %s: %s", host, err)
+                continue
+            self._agents.append(SnmpAgent(host, target))
+        self._version = data.get(ATTR_VERSION)
+        self._credentials = __class__.create_credentials(data, security_name)
 
-        self._version = entry.data.get(ATTR_VERSION)
-        if self._version == SnmpVersion.V1:
-            self._credentials = hlapi.CommunityData(
-                entry.data.get(ATTR_COMMUNITY), mpModel=0
+    @staticmethod
+    async def create_target(
+        host: str, port: int, timeout: float = 10, retries: int = 5
+    ) -> hlapi.UdpTransportTarget | hlapi.Udp6TransportTarget:
+        """Create an IPv4 or IPv6 transport target for the given host."""
+        try:
+            return await hlapi.UdpTransportTarget.create((host, port), timeout, retries)
+        except PySnmpError:
+            return await hlapi.Udp6TransportTarget.create(
+                (host, port), timeout, retries
+            )
+
+    @staticmethod
+    def create_credentials(
+        data: Mapping[str, Any], security_name: str | None = None
+    ) -> hlapi.CommunityData | hlapi.UsmUserData | None:
+        """Create the credentials for the configured SNMP version."""
+        version = data.get(ATTR_VERSION)
+        if version in (SnmpVersion.V1, SnmpVersion.V2C):
+            return hlapi.CommunityData(
+                data.get(ATTR_COMMUNITY),
+                mpModel=0 if version == SnmpVersion.V1 else 1,
             )
-        elif self._version == SnmpVersion.V3:
-            self._credentials = hlapi.UsmUserData(
-                entry.data.get(ATTR_USERNAME),
-                entry.data.get(ATTR_AUTH_KEY),
-                entry.data.get(ATTR_PRIV_KEY),
-                AUTH_MAP.get(entry.data.get(ATTR_AUTH_PROTOCOL, AuthProtocol.NO_AUTH)),
-                PRIV_MAP.get(entry.data.get(ATTR_PRIV_PROTOCOL, PrivProtocol.NO_PRIV)),
+        if version == SnmpVersion.V3:
+            return hlapi.UsmUserData(
+                data.get(ATTR_USERNAME),
+                data.get(ATTR_AUTH_KEY),
+                data.get(ATTR_PRIV_KEY),
+                AUTH_MAP.get(data.get(ATTR_AUTH_PROTOCOL, AuthProtocol.NO_AUTH)),
+                PRIV_MAP.get(data.get(ATTR_PRIV_PROTOCOL, PrivProtocol.NO_PRIV)),
+                securityName=security_name,
             )
+        return None
 
     @staticmethod
     def construct_object_types(list_of_oids):
         """Prepare desired objects from list of OIDs."""
         return [hlapi.ObjectType(hlapi.ObjectIdentity(oid)) for oid in list_of_oids]
 
-    async def get(self, oids) -> dict:
-        """Get data for given OIDs in a single call."""
+    def object_types(self, list_of_oids) -> list[hlapi.ObjectType]:
+        """Return the cached objects for the list of OIDs.
+
+        The objects are resolved against the MIB on their first request and
+        pysnmp skips the resolution for already resolved objects, so a cached
+        list is reused until the list of OIDs changes.
+        """
+        key = tuple(list_of_oids)
+        object_types = self._object_types.get(key)
+        if object_types is None:
+            object_types = __class__.construct_object_types(list_of_oids)
+            self._object_types[key] = object_types
+        return object_types
+
+    def use_worker(self, worker: SnmpWorker) -> None:
+        """Run all requests on the given worker thread and its engine."""
+        self._worker = worker
+        self._snmpEngine = worker.snmpEngine
+
+    async def _execute(self, coro):
+        """Run a request coroutine on the worker or the current loop."""
+        if self._worker is None:
+            return await coro
+        return await self._worker.async_run(coro)
+
+    @property
+    def failover(self) -> bool:
+        """Return if several agents answer for the UPS."""
+        return len(self._agents) > 1
+
+    def _route(self) -> list[SnmpAgent]:
+        """Return the agents in the order to try, the fastest one first.
+
+        Agents that timed out are only tried after all others, agents of
+        another device not at all.
+        """
+        return sorted(
+            (agent for agent in self._agents if not agent.other_device),
+            key=lambda agent: (agent.failed, agent.srtt or 0.0),
+        )
+
+    async def _send(self, request: Callable[[], Awaitable[Any]]) -> Any:
+        """Send a request to the fastest agent, failing over on timeouts."""
+        if not self.failover:
+            return await self._execute(request())
+
+        agents = self._route()
+        for agent in agents:
+            self._target = agent.target
+            try:
+                result = await self._execute(request())
+            except SnmpTimeoutError:
+                if agent is agents[-1]:
+                    raise
+                if not agent.failed:
+                    _LOGGER.info("Agent %s timed out, failing over", agent.host)
+                agent.failed = True
+                continue
+            agent.failed = False
+            return result
+        raise SnmpTimeoutError("No agent to send the request to")
+
+    async def probe_agents(self, serial_number: Any) -> None:
+        """Measure the round trip time of every agent.
+
+        The agents are asked for the serial number of their UPS, an agent
+        reporting another one than the entry is not used.
+        """
+
+        async def probe(agent: SnmpAgent) -> None:
+            start = time.monotonic()
+            try:
+                identity = await self._execute(
+                    self._get(
+                        [
+                            SNMP_OID_IDENT_SERIAL_NUMBER,
+                            SNMP_OID_IDENT_SERIAL_NUMBER_XUPS,
+                        ],
+                        agent.target,
+                    )
+                )
+            except RuntimeError as err:
+                _LOGGER.debug("Probe of agent %s failed: %s", agent.host, err)
+                agent.failed = True
+                return
+            agent.observe(time.monotonic() - start)
+            reported = get_serial_number(identity)
+            other_device = serial_number is not None and reported != str(serial_number)
+            if other_device and not agent.other_device:
+                _LOGGER.warning(
+                    "Agent %s answers for another UPS: %s", agent.host, reported
+                )
+            agent.other_device = other_device
+
+        await asyncio.gather(*(probe(agent) for agent in self._agents))
+        _LOGGER.debug(
+            "Agent round trip times: %s",
+            {agent.host: agent.srtt for agent in self._agents},
+        )
+
+    def start_capture(self, capture: SnmpCapture) -> None:
+        """Record every request and its response to the given capture."""
+        self._capture = capture
+
+    async def get(self, oids, cache: bool = True) -> dict:
+        """Get data for given OIDs in a single call.
+
+        Without ``cache`` the objects are resolved again and not kept, for
+        lists of OIDs chosen by others that may never be requested again.
+        """
+        if self._capture is None:
+            return await self._send(lambda: self._get(oids, cache=cache))
+
+        requested = list(oids)
+        start = time.monotonic()
+        try:
+            items = await self._send(lambda: self._get(oids, cache=cache))
+        except RuntimeError as err:
+            await self._capture.async_record(
+                "get", time.monotonic() - start, oids=requested, error=str(err)
+            )
+            raise
+        await self._capture.async_record(
+            "get",
+            time.monotonic() - start,
+            oids=requested,
+            dropped=[oid for oid in requested if oid not in oids],
+            result=items,
+        )
+        return items
+
+    async def _get(self, oids, target=None, cache=True) -> dict:
+        """Get data for given OIDs from the agent."""
         while len(oids):
+            object_types = (
+                self.object_types(oids)
+                if cache
+                else __class__.construct_object_types(oids)
+            )
             _LOGGER.debug("Get OID(s) %s", oids)
 
             (
@@ -112,28 +409,99 @@ class SnmpApi:
             ) = await hlapi.get_cmd(
                 self._snmpEngine,
                 self._credentials,
-                self._target,
+                target or self._target,
                 hlapi.ContextData(),
-                *__class__.construct_object_types(oids),
+                *object_types,
             )
 
             if error_index:
                 _LOGGER.debug("Remove error index %d", error_index - 1)
+                self._object_types.pop(tuple(oids), None)
                 oids.pop(error_index - 1)
                 continue
 
+            if isinstance(error_indication, AUTH_ERRORS):
+                raise SnmpAuthError(f"Got SNMP auth error: {error_indication}")
+
+            if isinstance(error_indication, errind.RequestTimedOut):
+                raise SnmpTimeoutError(f"Got SNMP timeout: {error_indication}")
+
             if error_indication or error_status:
                 raise RuntimeError(
                     f"Got SNMP error: {error_indication} {error_status} {error_index}"
                 )
 
             items = {}
-            for var_bind in var_binds:
+            for oid, var_bind in zip(list(oids), var_binds, strict=False):
+                if __class__.is_missing(var_bind[1]):
+                    _LOGGER.debug("Remove missing OID %s", oid)
+                    self._object_types.pop(tuple(oids), None)
+                    oids.remove(oid)
+                    continue
                 items[str(var_bind[0])] = __class__.cast(var_bind[1])
             return items
 
         return {}
 
+    async def set(self, values: Mapping[str, Any]) -> dict:
+        """Set the given OIDs in a single SET request."""
+        if self._capture is None:
+            return await self._send(lambda: self._set(values))
+
+        start = time.monotonic()
+        try:
+            items = await self._send(lambda: self._set(values))
+        except RuntimeError as err:
+            await self._capture.async_record(
+                "set",
+                time.monotonic() - start,
+                oids=list(values),
+                values=list(values.values()),
+                error=str(err),
+            )
+            raise
+        await self._capture.async_record(
+            "set",
+            time.monotonic() - start,
+            oids=list(values),
+            values=list(values.values()),
+            result=items,
+        )
+        return items
+
+    async def _set(self, values: Mapping[str, Any]) -> dict:
+        """Set the given OIDs on the agent."""
+        _LOGGER.debug("Set OID(s) %s", values)
+
+        (
+            error_indication,
+            error_status,
+            error_index,
+            var_binds,
+        ) = await hlapi.set_cmd(
+            self._snmpEngine,
+            self._credentials,
+            self._target,
+            hlapi.ContextData(),
+            *(
+                hlapi.ObjectType(hlapi.ObjectIdentity(oid), __class__.encode(value))
+                for oid, value in values.items()
+            ),
+        )
+
+        if isinstance(error_indication, AUTH_ERRORS):
+            raise SnmpAuthError(f"Got SNMP auth error: {error_indication}")
+
+        if isinstance(error_indication, errind.RequestTimedOut):
+            raise SnmpTimeoutError(f"Got SNMP timeout: {error_indication}")
+
+        if error_indication or error_status:
+            raise RuntimeError(
+                f"Got SNMP error: {error_indication} {error_status} {error_index}"
+            )
+
+        return {str(var_bind[0]): __class__.cast(var_bind[1]) for var_bind in var_binds}
+
     async def get_bulk(
         self,
         oids,
@@ -141,9 +509,50 @@ class SnmpApi:
         start_from=1,
     ) -> list:
         """Get table data for given OIDs with defined rown count."""
+        if self._capture is None:
+            return await self._send(lambda: self._get_bulk(oids, count, start_from))
+
+        start = time.monotonic()
+        try:
+            result = await self._send(lambda: self._get_bulk(oids, count, start_from))
+        except RuntimeError as err:
+            await self._capture.async_record(
+                "bulk",
+                time.monotonic() - start,
+                oids=oids,
+                count=count,
+                start_from=start_from,
+                error=str(err),
+            )
+            raise
+        await self._capture.async_record(
+            "bulk",
+            time.monotonic() - start,
+            oids=oids,
+            count=count,
+            start_from=start_from,
+            result=result,
+        )
+        return result
+
+    async def _get_bulk(
+        self,
+        oids,
+        count,
+        start_from=1,
+    ) -> list:
+        """Get table data for given OIDs from the agent.
+
+        The first ``start_from`` OIDs are non-repeaters, the remaining OIDs
+        are table columns read for up to ``count`` rows. Further requests are
+        only sent for columns the agent did not return completely.
+        """
         _LOGGER.debug("Get %s bulk OID(s) %s", count, oids)
         result = []
-        var_binds = __class__.construct_object_types(oids)
+        columns = list(oids[start_from:])
+        rows = dict.fromkeys(columns, 0)
+        non_repeaters = start_from
+        var_binds = self.object_types(oids)
         for _i in range(count):
             (
                 error_indication,
@@ -155,25 +564,62 @@ class SnmpApi:
                 self._credentials,
                 self._target,
                 hlapi.ContextData(),
-                start_from,
-                count,
+                non_repeaters,
+                min(count, SNMP_MAX_REPETITIONS),
                 *var_binds,
             )
 
-            if not error_indication and not error_indication:
-                items = {}
-                for var_bind in var_bind_table:
-                    items[str(var_bind[0])] = __class__.cast(var_bind[1])
-                result.append(items)
-            else:
+            if isinstance(error_indication, AUTH_ERRORS):
+                raise SnmpAuthError(f"Got SNMP auth error: {error_indication}")
+
+            if isinstance(error_indication, errind.RequestTimedOut):
+                raise SnmpTimeoutError(f"Got SNMP timeout: {error_indication}")
+
+            if error_indication or error_status:
                 raise RuntimeError(
                     f"Got SNMP error: {error_indication} {error_status} {error_index}"
                 )
 
-            var_binds = var_bind_table
+            items = {}
+            last = {}
+            for position, var_bind in enumerate(var_bind_table):
+                oid = str(var_bind[0])
+                if position < non_repeaters:
+                    if not __class__.is_missing(var_bind[1]):
+                        items[oid] = __class__.cast(var_bind[1])
+                    continue
+                if not columns:
+                    break
+                column = columns[(position - non_repeaters) % len(columns)]
+                if (
+                    rows[column] >= count
+                    or not oid.startswith(column)
+                    or __class__.is_missing(var_bind[1])
+                ):
+                    rows[column] = count
+                    continue
+                items[oid] = __class__.cast(var_bind[1])
+                rows[column] += 1
+                last[column] = var_bind
+            result.append(items)
+
+            columns = [
+                column for column in columns if rows[column] < count and column in last
+            ]
+            if not columns:
+                break
+            non_repeaters = 0
+            var_binds = [hlapi.ObjectType(last[column][0]) for column in columns]
 
         return result
 
+    async def walk(self, oids, max_rows=SNMP_WALK_MAX_ROWS) -> dict:
+        """Walk the given table columns until they end."""
+        data = {}
+        for result in await self.get_bulk(oids, max_rows, 0):
+            data.update(result)
+        return data
+
     async def get_bulk_auto(
         self,
         oids,
@@ -185,6 +631,20 @@ class SnmpApi:
             oids, await self.get([count_oid])[count_oid], start_from
         )
 
+    @staticmethod
+    def encode(value):
+        """Encode a value to set into its SNMP type."""
+        if isinstance(value, int):
+            return hlapi.Integer32(value)
+        return hlapi.OctetString(str(value))
+
+    @staticmethod
+    def is_missing(value) -> bool:
+        """Return if the agent answered that an OID does not exist."""
+        return isinstance(
+            value, hlapi.NoSuchObject | hlapi.NoSuchInstance | hlapi.EndOfMibView
+        )
+
     @staticmethod
     def cast(value):
         """Cast returned value into correct type."""
@@ -0,0 +1,44 @@
+"""Support for Eaton UPS buttons."""
+
+from __future__ import annotations
+
+from homeassistant.components.button import ButtonEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .coordinator import SnmpCoordinator
+from .descriptions import BUTTONS, SnmpButtonEntityDescription
+from .entity import SnmpEntity, async_add_described_entities
+
+# Presses on several buttons run in parallel to be set in one request.
+PARALLEL_UPDATES = 0
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the buttons."""
+    async_add_described_entities(entry, BUTTONS, SnmpButtonEntity, async_add_entities)
+
+
+class SnmpButtonEntity(SnmpEntity, ButtonEntity):
+    """Representation of a Eaton UPS button."""
+
+    entity_description: SnmpButtonEntityDescription
+
+    def __init__(
+        self,
+        coordinator: SnmpCoordinator,
+        description: SnmpButtonEntityDescription,
+        index: str = "",
+    ) -> None:
+        """Initialize a Eaton UPS button."""
+        super().__init__(coordinator, description, index)
+        self._set_oid = description.set_oid.replace("index", index)
+
+    async def async_press(self) -> None:
+        """Set the OID of the button."""
+        await self.coordinator.async_set(
+            {self._set_oid: self.entity_description.set_value}, [self._value_oid]
+        )
@@ -0,0 +1,130 @@
+"""Capture and replay of Eaton UPS SNMP traffic."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict, deque
+import json
+import logging
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+
+from .api import SnmpApi
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SnmpCapture:
+    """Append-only capture of SNMP requests and their decoded responses.
+
+    Every request is written as one compact JSON line with the wall clock
+    time ``t`` it was sent, the request duration ``d`` and the operation
+    ``op``.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Init the SnmpCapture."""
+        self._path = path
+
+    async def async_record(self, op: str, duration: float, **fields: Any) -> None:
+        """Append a request and its response to the capture file."""
+        start = time.time() - duration
+        line = json.dumps(
+            {"t": round(start, 3), "d": round(duration, 4), "op": op, **fields},
+            separators=(",", ":"),
+        )
+        await asyncio.get_running_loop().run_in_executor(None, self._write, line)
+
+    def _write(self, line: str) -> None:
+        """Append a line to the capture file."""
+        with open(self._path, "a", encoding="utf-8") as file:
+            file.write(line + "\n")
+
+
+class SnmpReplayApi(SnmpApi):
+    """Provide an api answering from a capture file instead of the network.
+
+    Requests are matched by operation and OIDs in recorded order. With a
+    speed of 1 the recorded timeline and latencies are reproduced, higher
+    values accelerate the replay and 0 answers immediately.
+    """
+
+    def __init__(self, path: str, speed: float = 1.0) -> None:
+        """Init the SnmpReplayApi."""
+        super().__init__(None)
+        self._path = path
+        self._speed = speed
+        self._records: dict[tuple, deque[dict]] = defaultdict(deque)
+        self._first: float | None = None
+        self._start = 0.0
+
+    @property
+    def speed(self) -> float:
+        """Return the replay speed."""
+        return self._speed
+
+    async def setup(self, entry: ConfigEntry) -> None:
+        """Setup the SnmpReplayApi."""
+        self._records = await asyncio.get_running_loop().run_in_executor(
+            None, self._load
+        )
+        self._start = time.monotonic()
+
+    def _load(self) -> dict[tuple, deque[dict]]:
+        """Load the capture file indexed by request."""
+        records: dict[tuple, deque[dict]] = defaultdict(deque)
+        with open(self._path, encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if self._first is None:
+                    self._first = record["t"]
+                records[__class__.key(record["op"], record["oids"])].append(record)
+        _LOGGER.debug("Loaded %d request(s) from %s", len(records), self._path)
+        return records
+
+    @staticmethod
+    def key(op: str, oids: list[str]) -> tuple:
+        """Return the lookup key of a request."""
+        return (op, tuple(oids))
+
+    async def _replay(self, op: str, oids: list[str]) -> dict[str, Any]:
+        """Return the next recorded response for the request."""
+        records = self._records.get(__class__.key(op, oids))
+        if not records:
+            raise RuntimeError(f"No recorded response for {op} {oids}")
+
+        record = records.popleft()
+        if self._speed > 0:
+            offset = (record["t"] - self._first) / self._speed
+            delay = self._start + offset - time.monotonic()
+            await asyncio.sleep(max(delay, 0) + record["d"] / self._speed)
+
+        if "error" in record:
+            raise RuntimeError(record["error"])
+        return record
+
+    async def _get(self, oids, cache=True) -> dict:
+        """Get data for given OIDs from the capture."""
+        record = await self._replay("get", oids)
+        for oid in record.get("dropped", []):
+            oids.remove(oid)
+        return record["result"]
+
+    async def _get_bulk(
+        self,
+        oids,
+        count,
+        start_from=1,
+    ) -> list:
+        """Get table data for given OIDs from the capture."""
+        record = await self._replay("bulk", oids)
+        return record["result"]
+
+    async def _set(self, values) -> dict:
+        """Set the given OIDs on the capture."""
+        record = await self._replay("set", list(values))
+        return record["result"]
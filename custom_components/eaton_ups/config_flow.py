@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
+from ipaddress import ip_address, ip_network
+import time
+from typing import Any
+
 import voluptuous as vol
 from voluptuous.schema_builder import Schema
 
 from homeassistant import config_entries
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
@@ -21,23 +27,178 @@ from homeassistant.helpers.selector import (
 )
 from homeassistant.helpers.typing import ConfigType
 
+from .api import (
+    IDENTITY_OIDS,
+    SnmpApi,
+    SnmpAuthError,
+    async_get_engine,
+    detect_profile,
+    get_serial_number,
+)
 from .const import (
     ATTR_AUTH_KEY,
     ATTR_AUTH_PROTOCOL,
+    ATTR_CAPTURE,
     ATTR_COMMUNITY,
+    ATTR_DEADBAND,
+    ATTR_DEADBAND_MODE,
+    ATTR_EXECUTION_MODE,
     ATTR_HOST,
+    ATTR_HOSTS,
+    ATTR_MAX_SILENCE,
+    ATTR_METRICS,
     ATTR_NAME,
+    ATTR_NETWORK,
     ATTR_PORT,
     ATTR_PRIV_KEY,
     ATTR_PRIV_PROTOCOL,
+    ATTR_PROFILE,
+    ATTR_PROXY_ADDRESS,
+    ATTR_PROXY_COMMUNITY,
+    ATTR_PROXY_MAX_AGE,
+    ATTR_PROXY_PORT,
+    ATTR_REPLAY_FILE,
+    ATTR_REPLAY_SPEED,
+    ATTR_SERIAL_NUMBER,
+    ATTR_STATISTICS,
     ATTR_USERNAME,
     ATTR_VERSION,
+    DEADBAND_DEFAULT,
     DOMAIN,
+    MAX_SILENCE_DEFAULT,
+    PROXY_ADDRESS_DEFAULT,
+    PROXY_COMMUNITY_DEFAULT,
+    PROXY_MAX_AGE_DEFAULT,
+    SCAN_MAX_ADDRESSES,
     SNMP_PORT_DEFAULT,
+    SNMP_PROBE_TIMEOUT,
     AuthProtocol,
+    DeadbandMode,
+    ExecutionMode,
     PrivProtocol,
+    SensorClass,
     SnmpVersion,
 )
+from .discovery import DiscoveredAgent, SubnetScanner
+
+
+@dataclass
+class ProbeResult:
+    """Result of a successful connectivity probe."""
+
+    data: ConfigType
+    identity: dict[str, Any]
+    latency: float
+
+    @property
+    def serial_number(self) -> str | None:
+        """Return the serial number reported by the agent."""
+        return get_serial_number(self.identity)
+
+    @property
+    def security(self) -> str:
+        """Return a description of the working credentials."""
+        if self.data[ATTR_VERSION] == SnmpVersion.V3:
+            return f"{self.data[ATTR_AUTH_PROTOCOL]} / {self.data[ATTR_PRIV_PROTOCOL]}"
+        return "community"
+
+
+def get_probe_candidates(data: ConfigType) -> list[ConfigType]:
+    """Return the connection settings to probe, the configured ones first."""
+    candidates = [data]
+    if data[ATTR_VERSION] in (SnmpVersion.V1, SnmpVersion.V2C):
+        candidates.extend(
+            {**data, ATTR_VERSION: version}
+            for version in (SnmpVersion.V2C, SnmpVersion.V1)
+            if version != data[ATTR_VERSION]
+        )
+    elif data[ATTR_VERSION] == SnmpVersion.V3:
+        auth_protocols = [AuthProtocol.NO_AUTH]
+        if data.get(ATTR_AUTH_KEY):
+            auth_protocols = [e for e in AuthProtocol if e != AuthProtocol.NO_AUTH]
+        priv_protocols = [PrivProtocol.NO_PRIV]
+        if data.get(ATTR_AUTH_KEY) and data.get(ATTR_PRIV_KEY):
+            priv_protocols = [e for e in PrivProtocol if e != PrivProtocol.NO_PRIV]
+        candidates.extend(
+            {**data, ATTR_AUTH_PROTOCOL: auth, ATTR_PRIV_PROTOCOL: priv}
+            for auth in auth_protocols
+            for priv in priv_protocols
+            if auth != data.get(ATTR_AUTH_PROTOCOL)
+            or priv != data.get(ATTR_PRIV_PROTOCOL)
+        )
+    return candidates
+
+
+async def probe_candidate(
+    hass: HomeAssistant, data: ConfigType, security_name: str | None = None
+) -> ProbeResult:
+    """Query the identity of the agent with the given connection settings."""
+    api = SnmpApi(await async_get_engine(hass))
+    await api.configure(data, SNMP_PROBE_TIMEOUT, 0, security_name)
+
+    start = time.monotonic()
+    identity = await api.get(list(IDENTITY_OIDS))
+    return ProbeResult(data, identity, time.monotonic() - start)
+
+
+async def validate_input(hass: HomeAssistant, data: ConfigType) -> ProbeResult:
+    """Probe all candidate settings concurrently and return the working one."""
+    candidates = get_probe_candidates(data)
+    results = await asyncio.gather(
+        *(
+            probe_candidate(hass, candidate, f"{DOMAIN}-probe-{index}")
+            for index, candidate in enumerate(candidates)
+        ),
+        return_exceptions=True,
+    )
+
+    auth_failed = False
+    for result in results:
+        if isinstance(result, ProbeResult):
+            if not result.identity:
+                continue
+            profile = detect_profile(result.identity)
+            if profile is None:
+                raise UnsupportedDevice
+            result.data = {**result.data, ATTR_PROFILE: profile}
+            result.data[ATTR_HOSTS] = await validate_hosts(hass, result)
+            return result
+        if isinstance(result, SnmpAuthError):
+            auth_failed = True
+
+    if auth_failed:
+        raise InvalidAuth
+    raise CannotConnect
+
+
+async def validate_hosts(hass: HomeAssistant, probe: ProbeResult) -> list[str]:
+    """Return the additional agent addresses of the probed UPS.
+
+    Unreachable addresses are kept to fail over to later, an address that
+    answers for another UPS is rejected.
+    """
+    hosts = [
+        host
+        for host in dict.fromkeys(probe.data.get(ATTR_HOSTS, []))
+        if host and host != probe.data[ATTR_HOST]
+    ]
+    results = await asyncio.gather(
+        *(
+            probe_candidate(
+                hass, {**probe.data, ATTR_HOST: host}, f"{DOMAIN}-probe-host-{index}"
+            )
+            for index, host in enumerate(hosts)
+        ),
+        return_exceptions=True,
+    )
+    for result in results:
+        if (
+            isinstance(result, ProbeResult)
+            and result.identity
+            and result.serial_number != probe.serial_number
+        ):
+            raise OtherDevice
+    return hosts
 
 
 def get_host_schema_config(data: ConfigType) -> Schema:
@@ -46,6 +207,9 @@ def get_host_schema_config(data: ConfigType) -> Schema:
         {
             vol.Required(ATTR_NAME, default=data.get(ATTR_NAME)): cv.string,
             vol.Required(ATTR_HOST, default=data.get(ATTR_HOST)): cv.string,
+            vol.Optional(ATTR_HOSTS, default=data.get(ATTR_HOSTS, [])): TextSelector(
+                TextSelectorConfig(multiple=True)
+            ),
             vol.Required(
                 ATTR_PORT, default=data.get(ATTR_PORT, SNMP_PORT_DEFAULT)
             ): cv.port,
@@ -66,6 +230,9 @@ def get_host_schema_options(data: ConfigType) -> Schema:
     return vol.Schema(
         {
             vol.Required(ATTR_HOST, default=data.get(ATTR_HOST)): cv.string,
+            vol.Optional(ATTR_HOSTS, default=data.get(ATTR_HOSTS, [])): TextSelector(
+                TextSelectorConfig(multiple=True)
+            ),
             vol.Required(
                 ATTR_PORT, default=data.get(ATTR_PORT, SNMP_PORT_DEFAULT)
             ): cv.port,
@@ -81,6 +248,116 @@ def get_host_schema_options(data: ConfigType) -> Schema:
     )
 
 
+def get_scan_schema(data: ConfigType) -> Schema:
+    """Return the scan schema for config flow."""
+    return vol.Schema(
+        {
+            vol.Required(ATTR_NETWORK, default=data.get(ATTR_NETWORK)): cv.string,
+            vol.Required(
+                ATTR_PORT, default=data.get(ATTR_PORT, SNMP_PORT_DEFAULT)
+            ): cv.port,
+            vol.Required(
+                ATTR_VERSION, default=data.get(ATTR_VERSION) or SnmpVersion.V1
+            ): SelectSelector(
+                SelectSelectorConfig(
+                    options=[SnmpVersion.V1, SnmpVersion.V2C],
+                    mode=SelectSelectorMode.DROPDOWN,
+                )
+            ),
+            vol.Required(ATTR_COMMUNITY, default=data.get(ATTR_COMMUNITY)): cv.string,
+        }
+    )
+
+
+def get_performance_schema(data: ConfigType) -> Schema:
+    """Return the performance schema for options flow."""
+    return vol.Schema(
+        {
+            vol.Required(
+                ATTR_EXECUTION_MODE,
+                default=data.get(ATTR_EXECUTION_MODE, ExecutionMode.LOOP),
+            ): SelectSelector(
+                SelectSelectorConfig(
+                    options=[e.value for e in ExecutionMode],
+                    mode=SelectSelectorMode.DROPDOWN,
+                    translation_key=ATTR_EXECUTION_MODE,
+                )
+            ),
+            vol.Required(ATTR_METRICS, default=data.get(ATTR_METRICS, False)): bool,
+        }
+    )
+
+
+def get_proxy_schema(data: ConfigType) -> Schema:
+    """Return the proxy schema for options flow."""
+    return vol.Schema(
+        {
+            vol.Required(
+                ATTR_PROXY_ADDRESS,
+                default=data.get(ATTR_PROXY_ADDRESS, PROXY_ADDRESS_DEFAULT),
+            ): cv.string,
+            vol.Required(
+                ATTR_PROXY_PORT, default=data.get(ATTR_PROXY_PORT, 0)
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=65535)),
+            vol.Required(
+                ATTR_PROXY_COMMUNITY,
+                default=data.get(ATTR_PROXY_COMMUNITY, PROXY_COMMUNITY_DEFAULT),
+            ): cv.string,
+            vol.Required(
+                ATTR_PROXY_MAX_AGE,
+                default=data.get(ATTR_PROXY_MAX_AGE, PROXY_MAX_AGE_DEFAULT),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        }
+    )
+
+
+def get_recorder_schema(data: ConfigType) -> Schema:
+    """Return the recorder schema for options flow."""
+    schema = {
+        vol.Required(
+            ATTR_DEADBAND_MODE,
+            default=data.get(ATTR_DEADBAND_MODE, DeadbandMode.ABSOLUTE),
+        ): SelectSelector(
+            SelectSelectorConfig(
+                options=[e.value for e in DeadbandMode],
+                mode=SelectSelectorMode.DROPDOWN,
+                translation_key=ATTR_DEADBAND_MODE,
+            )
+        ),
+    }
+    schema[vol.Required(ATTR_STATISTICS, default=data.get(ATTR_STATISTICS, False))] = (
+        bool
+    )
+    for sensor_class in SensorClass:
+        deadband = f"{sensor_class}_{ATTR_DEADBAND}"
+        max_silence = f"{sensor_class}_{ATTR_MAX_SILENCE}"
+        schema[vol.Required(deadband, default=data.get(deadband, DEADBAND_DEFAULT))] = (
+            vol.All(vol.Coerce(float), vol.Range(min=0))
+        )
+        schema[
+            vol.Required(
+                max_silence, default=data.get(max_silence, MAX_SILENCE_DEFAULT)
+            )
+        ] = vol.All(vol.Coerce(int), vol.Range(min=0))
+    return vol.Schema(schema)
+
+
+def get_debug_schema(data: ConfigType) -> Schema:
+    """Return the debug schema for options flow."""
+    return vol.Schema(
+        {
+            vol.Required(ATTR_CAPTURE, default=data.get(ATTR_CAPTURE, False)): bool,
+            vol.Optional(
+                ATTR_REPLAY_FILE,
+                description={"suggested_value": data.get(ATTR_REPLAY_FILE)},
+            ): cv.string,
+            vol.Required(
+                ATTR_REPLAY_SPEED, default=data.get(ATTR_REPLAY_SPEED, 1.0)
+            ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        }
+    )
+
+
 def get_v1_schema(data: ConfigType) -> Schema:
     """Return the v1 schema."""
     return vol.Schema(
@@ -131,17 +408,19 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Init the ConfigFlow."""
         self.data: ConfigType = {}
+        self.probe: ProbeResult | None = None
+        self.scan_task: asyncio.Task[list[DiscoveredAgent]] | None = None
 
     async def async_step_user(self, user_input: ConfigType | None = None) -> FlowResult:
         """Handle the initial step."""
-        return await self.async_step_host(host_input=user_input)
+        return self.async_show_menu(step_id="user", menu_options=["host", "scan"])
 
     async def async_step_host(self, host_input: ConfigType | None = None) -> FlowResult:
         """Handle the host step."""
         if host_input is not None:
             self.data = host_input
 
-            if host_input[ATTR_VERSION] == SnmpVersion.V1:
+            if host_input[ATTR_VERSION] in (SnmpVersion.V1, SnmpVersion.V2C):
                 return await self.async_step_v1()
 
             if host_input[ATTR_VERSION] == SnmpVersion.V3:
@@ -153,26 +432,180 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_v1(self, v1_input: ConfigType | None = None) -> FlowResult:
         """Handle the v1 step."""
-        if v1_input is None:
-            return self.async_show_form(
-                step_id="v1", data_schema=get_v1_schema(self.data)
-            )
+        errors: dict[str, str] = {}
+        if v1_input is not None:
+            self.data.update(v1_input)
+            errors = await self._async_probe()
+            if not errors:
+                return await self.async_step_probe()
 
-        self.data.update(v1_input)
-
-        return self.async_create_entry(title=self.data[ATTR_NAME], data=self.data)
+        return self.async_show_form(
+            step_id="v1", data_schema=get_v1_schema(self.data), errors=errors
+        )
 
     async def async_step_v3(self, v3_input: ConfigType | None = None) -> FlowResult:
         """Handle the v3 step."""
-        if v3_input is None:
+        errors: dict[str, str] = {}
+        if v3_input is not None:
+            self.data.update(v3_input)
+            errors = await self._async_probe()
+            if not errors:
+                return await self.async_step_probe()
+
+        return self.async_show_form(
+            step_id="v3", data_schema=get_v3_schema(self.data), errors=errors
+        )
+
+    async def async_step_probe(
+        self, probe_input: ConfigType | None = None
+    ) -> FlowResult:
+        """Show the probe result before creating the entry."""
+        if probe_input is None:
             return self.async_show_form(
-                step_id="v3", data_schema=get_v3_schema(self.data)
+                step_id="probe",
+                description_placeholders={
+                    "version": self.probe.data[ATTR_VERSION],
+                    "security": self.probe.security,
+                    "latency": f"{self.probe.latency * 1000:.0f}",
+                    "profile": self.probe.data[ATTR_PROFILE],
+                },
             )
 
-        self.data.update(v3_input)
+        return self.async_create_entry(title=self.data[ATTR_NAME], data=self.probe.data)
+
+    async def async_step_scan(self, scan_input: ConfigType | None = None) -> FlowResult:
+        """Handle the scan step."""
+        errors: dict[str, str] = {}
+        if scan_input is not None:
+            self.data = scan_input
+            try:
+                network = ip_network(scan_input[ATTR_NETWORK], strict=False)
+            except ValueError:
+                errors[ATTR_NETWORK] = "invalid_network"
+            else:
+                if network.num_addresses > SCAN_MAX_ADDRESSES:
+                    errors[ATTR_NETWORK] = "network_too_large"
+                else:
+                    scanner = SubnetScanner(
+                        await async_get_engine(self.hass), scan_input
+                    )
+                    self.scan_task = self.hass.async_create_task(
+                        scanner.async_scan(network)
+                    )
+                    return await self.async_step_scan_progress()
+
+        return self.async_show_form(
+            step_id="scan", data_schema=get_scan_schema(self.data), errors=errors
+        )
+
+    async def async_step_scan_progress(
+        self, user_input: ConfigType | None = None
+    ) -> FlowResult:
+        """Wait for the scan to finish."""
+        if not self.scan_task.done():
+            return self.async_show_progress(
+                step_id="scan_progress",
+                progress_action="scan",
+                progress_task=self.scan_task,
+            )
+
+        return self.async_show_progress_done(next_step_id="scan_done")
+
+    async def async_step_scan_done(
+        self, user_input: ConfigType | None = None
+    ) -> FlowResult:
+        """Start a discovery flow for every new agent found by the scan."""
+        agents = self.scan_task.result()
+        configured = set(self._async_current_ids(include_ignore=True))
+        for entry in self._async_current_entries():
+            configured.add(entry.data.get(ATTR_HOST))
+            configured.update(entry.data.get(ATTR_HOSTS, []))
+        # Legacy entries without a unique ID would match agents without a serial.
+        configured.discard(None)
+
+        new_agents = [
+            agent
+            for agent in agents
+            if agent.serial_number not in configured and agent.host not in configured
+        ]
+        # Network cards of the same UPS become one entry failing over between them.
+        devices: dict[str, list[DiscoveredAgent]] = {}
+        for agent in new_agents:
+            devices.setdefault(agent.serial_number or agent.host, []).append(agent)
+        for agent, *others in devices.values():
+            self.hass.async_create_task(
+                self.hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": config_entries.SOURCE_INTEGRATION_DISCOVERY},
+                    data={
+                        **self.data,
+                        ATTR_NAME: agent.name,
+                        ATTR_HOST: agent.host,
+                        ATTR_HOSTS: [other.host for other in others],
+                        ATTR_PROFILE: agent.profile,
+                        ATTR_SERIAL_NUMBER: agent.serial_number,
+                    },
+                )
+            )
+
+        return self.async_abort(
+            reason="scan_complete",
+            description_placeholders={
+                "found": str(len(agents)),
+                "new": str(len(new_agents)),
+            },
+        )
+
+    async def async_step_integration_discovery(
+        self, discovery_info: ConfigType
+    ) -> FlowResult:
+        """Handle an agent found by a subnet scan."""
+        serial_number = discovery_info.pop(ATTR_SERIAL_NUMBER)
+        if serial_number is not None:
+            await self.async_set_unique_id(serial_number)
+            self._abort_if_unique_id_configured()
+        self._async_abort_entries_match({ATTR_HOST: discovery_info[ATTR_HOST]})
+
+        self.data = {
+            key: value for key, value in discovery_info.items() if key != ATTR_NETWORK
+        }
+        self.context["title_placeholders"] = {
+            "name": self.data[ATTR_NAME],
+            "host": self.data[ATTR_HOST],
+        }
+        return await self.async_step_discovery_confirm()
+
+    async def async_step_discovery_confirm(
+        self, user_input: ConfigType | None = None
+    ) -> FlowResult:
+        """Confirm adding a discovered agent."""
+        if user_input is None:
+            return self.async_show_form(
+                step_id="discovery_confirm",
+                description_placeholders=self.context["title_placeholders"],
+            )
 
         return self.async_create_entry(title=self.data[ATTR_NAME], data=self.data)
 
+    async def _async_probe(self) -> dict[str, str]:
+        """Probe the agent and return the errors to show."""
+        try:
+            self.probe = await validate_input(self.hass, self.data)
+        except CannotConnect:
+            return {"base": "cannot_connect"}
+        except InvalidAuth:
+            return {"base": "invalid_auth"}
+        except UnsupportedDevice:
+            return {"base": "unsupported_device"}
+        except OtherDevice:
+            return {"base": "other_device"}
+
+        if self.probe.serial_number is not None:
+            await self.async_set_unique_id(self.probe.serial_number)
+            self._abort_if_unique_id_configured()
+
+        return {}
+
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -188,17 +621,77 @@ class OptionsFlow(config_entries.OptionsFlow):
     def __init__(self, entry: ConfigEntry) -> None:
         """Initialize Eaton UPS options flow."""
         self.data = dict(entry.data)
+        self.options = dict(entry.options)
 
     async def async_step_init(self, user_input: ConfigType | None = None) -> FlowResult:
         """Manage the options."""
-        return await self.async_step_host(host_input=user_input)
+        return self.async_show_menu(
+            step_id="init",
+            menu_options=["host", "performance", "recorder", "proxy", "debug"],
+        )
+
+    async def async_step_performance(
+        self, performance_input: ConfigType | None = None
+    ) -> FlowResult:
+        """Handle the performance step."""
+        if performance_input is not None:
+            self.options.update(performance_input)
+            return self.async_create_entry(title="", data=self.options)
+
+        return self.async_show_form(
+            step_id="performance", data_schema=get_performance_schema(self.options)
+        )
+
+    async def async_step_proxy(
+        self, proxy_input: ConfigType | None = None
+    ) -> FlowResult:
+        """Handle the proxy step."""
+        errors = {}
+        if proxy_input is not None:
+            try:
+                ip_address(proxy_input[ATTR_PROXY_ADDRESS])
+            except ValueError:
+                errors[ATTR_PROXY_ADDRESS] = "invalid_address"
+            else:
+                self.options.update(proxy_input)
+                return self.async_create_entry(title="", data=self.options)
+
+        return self.async_show_form(
+            step_id="proxy",
+            data_schema=get_proxy_schema(proxy_input or self.options),
+            errors=errors,
+        )
+
+    async def async_step_recorder(
+        self, recorder_input: ConfigType | None = None
+    ) -> FlowResult:
+        """Handle the recorder step."""
+        if recorder_input is not None:
+            self.options.update(recorder_input)
+            return self.async_create_entry(title="", data=self.options)
+
+        return self.async_show_form(
+            step_id="recorder", data_schema=get_recorder_schema(self.options)
+        )
+
+    async def async_step_debug(
+        self, debug_input: ConfigType | None = None
+    ) -> FlowResult:
+        """Handle the debug step."""
+        if debug_input is not None:
+            self.options.update(debug_input)
+            return self.async_create_entry(title="", data=self.options)
+
+        return self.async_show_form(
+            step_id="debug", data_schema=get_debug_schema(self.options)
+        )
 
     async def async_step_host(self, host_input: ConfigType | None = None) -> FlowResult:
         """Handle the host step."""
         if host_input is not None:
             self.data.update(host_input)
 
-            if host_input[ATTR_VERSION] == SnmpVersion.V1:
+            if host_input[ATTR_VERSION] in (SnmpVersion.V1, SnmpVersion.V2C):
                 return await self.async_step_v1()
 
             if host_input[ATTR_VERSION] == SnmpVersion.V3:
@@ -210,29 +703,51 @@ class OptionsFlow(config_entries.OptionsFlow):
 
     async def async_step_v1(self, v1_input: ConfigType | None = None) -> FlowResult:
         """Handle the v1 step."""
-        if v1_input is None:
-            return self.async_show_form(
-                step_id="v1", data_schema=get_v1_schema(self.data)
-            )
-
-        self.data.update(v1_input)
-
-        self.hass.config_entries.async_update_entry(self.config_entry, data=self.data)
+        errors: dict[str, str] = {}
+        if v1_input is not None:
+            self.data.update(v1_input)
+            errors = await self._async_probe()
+            if not errors:
+                return self._async_update_entry()
 
-        return self.async_create_entry(title="", data={})
+        return self.async_show_form(
+            step_id="v1", data_schema=get_v1_schema(self.data), errors=errors
+        )
 
     async def async_step_v3(self, v3_input: ConfigType | None = None) -> FlowResult:
         """Handle the v3 step."""
-        if v3_input is None:
-            return self.async_show_form(
-                step_id="v3", data_schema=get_v3_schema(self.data)
-            )
+        errors: dict[str, str] = {}
+        if v3_input is not None:
+            self.data.update(v3_input)
+            errors = await self._async_probe()
+            if not errors:
+                return self._async_update_entry()
 
-        self.data.update(v3_input)
+        return self.async_show_form(
+            step_id="v3", data_schema=get_v3_schema(self.data), errors=errors
+        )
 
+    async def _async_probe(self) -> dict[str, str]:
+        """Probe the agent and return the errors to show."""
+        try:
+            probe = await validate_input(self.hass, self.data)
+        except CannotConnect:
+            return {"base": "cannot_connect"}
+        except InvalidAuth:
+            return {"base": "invalid_auth"}
+        except UnsupportedDevice:
+            return {"base": "unsupported_device"}
+        except OtherDevice:
+            return {"base": "other_device"}
+
+        self.data = probe.data
+        return {}
+
+    def _async_update_entry(self) -> FlowResult:
+        """Store the probed settings in the config entry."""
         self.hass.config_entries.async_update_entry(self.config_entry, data=self.data)
 
-        return self.async_create_entry(title="", data={})
+        return self.async_create_entry(title="", data=self.options)
 
 
 class CannotConnect(HomeAssistantError):
@@ -241,3 +756,11 @@ class CannotConnect(HomeAssistantError):
 
 class InvalidAuth(HomeAssistantError):
     """Error to indicate there is invalid auth."""
+
+
+class UnsupportedDevice(HomeAssistantError):
+    """Error to indicate the agent is no supported UPS."""
+
+
+class OtherDevice(HomeAssistantError):
+    """Error to indicate an additional address answers for another UPS."""
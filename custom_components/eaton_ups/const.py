@@ -12,11 +12,14 @@ MANUFACTURER = "Eaton"
 
 PLATFORMS = [
     Platform.BINARY_SENSOR,
+    Platform.BUTTON,
     Platform.SENSOR,
+    Platform.SWITCH,
 ]
 
 ATTR_NAME = "name"
 ATTR_HOST = "host"
+ATTR_HOSTS = "hosts"
 ATTR_PORT = "port"
 ATTR_VERSION = "version"
 ATTR_COMMUNITY = "community"
@@ -25,12 +28,41 @@ ATTR_AUTH_PROTOCOL = "auth_protocol"
 ATTR_AUTH_KEY = "auth_key"
 ATTR_PRIV_PROTOCOL = "priv_protocol"
 ATTR_PRIV_KEY = "priv_key"
+ATTR_PROFILE = "profile"
+ATTR_NETWORK = "network"
+ATTR_SERIAL_NUMBER = "serial_number"
+ATTR_CAPTURE = "capture"
+ATTR_REPLAY_FILE = "replay_file"
+ATTR_REPLAY_SPEED = "replay_speed"
+ATTR_EXECUTION_MODE = "execution_mode"
+ATTR_DEADBAND = "deadband"
+ATTR_DEADBAND_MODE = "deadband_mode"
+ATTR_MAX_SILENCE = "max_silence"
+ATTR_METRICS = "metrics"
+ATTR_STATISTICS = "statistics"
+ATTR_DELAY = "delay"
+ATTR_RESTART_DELAY = "restart_delay"
+ATTR_PROXY_ADDRESS = "proxy_address"
+ATTR_PROXY_PORT = "proxy_port"
+ATTR_PROXY_COMMUNITY = "proxy_community"
+ATTR_PROXY_MAX_AGE = "proxy_max_age"
+
+DATA_WORKER = f"{DOMAIN}_worker"
+DATA_METRICS = f"{DOMAIN}_metrics"
+
+METRICS_URL = f"/api/{DOMAIN}/metrics"
+
+DERIVED_BATTERY_HEALTH = "battery_health"
+DERIVED_BATTERY_CAPACITY_TREND = "battery_capacity_trend"
+DERIVED_BATTERY_REFERENCE_RUNTIME = "battery_reference_runtime"
+DERIVED_BATTERY_TIME_TO_EMPTY = "battery_time_to_empty"
 
 
 class SnmpVersion(StrEnum):
     """Enum with snmp versions."""
 
     V1 = "1"
+    V2C = "2c"
     V3 = "3"
 
 
@@ -55,11 +87,99 @@ class PrivProtocol(StrEnum):
     AES_256 = "aes256"
 
 
+class ExecutionMode(StrEnum):
+    """Enum with execution modes for SNMP processing."""
+
+    LOOP = "loop"
+    THREAD = "thread"
+
+
+class DeadbandMode(StrEnum):
+    """Enum with deadband modes for sensor updates."""
+
+    ABSOLUTE = "absolute"
+    PERCENT = "percent"
+
+
+class SensorClass(StrEnum):
+    """Enum with sensor classes sharing update filter settings."""
+
+    VOLTAGE = "voltage"
+    CURRENT = "current"
+    WATTS = "watts"
+    LOAD = "load"
+    REMAINING = "remaining"
+
+
+class MibProfile(StrEnum):
+    """Enum with supported mib profiles."""
+
+    XUPS = "xups"
+    RFC1628 = "rfc1628"
+
+
 SNMP_API_CLIENT = "snmp_api_client"
 
 SNMP_PORT_DEFAULT = 161
 
+SNMP_PROBE_TIMEOUT = 2
+
+SNMP_FAILOVER_TIMEOUT = 3
+SNMP_FAILOVER_RETRIES = 1
+SNMP_AGENT_PROBE_INTERVAL = 300
+
+SNMP_MAX_REPETITIONS = 25
+SNMP_WALK_MAX_ROWS = 64
+
+DEADBAND_DEFAULT = 0.0
+MAX_SILENCE_DEFAULT = 900
+STATISTICS_CHUNK_SIZE = 24
+PROXY_ADDRESS_DEFAULT = "127.0.0.1"
+PROXY_COMMUNITY_DEFAULT = "public"
+PROXY_MAX_AGE_DEFAULT = 60
+
+BATTERY_REFERENCE_LOAD = 50
+BATTERY_FADE_MIN_DAYS = 30
+DISCHARGE_MIN_DURATION = 120
+DISCHARGE_MIN_DROP = 5
+DISCHARGE_MAX_SAMPLES = 4096
+DISCHARGE_MAX_EVENTS = 100
+DISCHARGE_POLL_INTERVAL = 10
+TIME_TO_EMPTY_TIME_CONSTANT = 120
+
+SNMP_SET_BATCH_WINDOW = 0.1
+SNMP_CONFIRM_DELAYS = (1, 2, 4, 8)
+
+SNMP_BACKOFF_MAX = 900
+SNMP_STALE_AFTER = 900
+
+GROUP_BASE = "base"
+GROUP_INPUT = "input"
+GROUP_OUTPUT = "output"
+GROUP_ALARMS = "alarms"
+GROUP_ENVIRONMENT = "environment"
+GROUP_RECEPTACLES = "receptacles"
+
+EVENT_ALARM = f"{DOMAIN}_alarm"
+
+SERVICE_SHUTDOWN = "shutdown"
+SERVICE_CANCEL_SHUTDOWN = "cancel_shutdown"
+
+ATTRIBUTES_ALARMS = "alarms"
+ATTRIBUTES_BATTERY = "battery"
+
+SCAN_MAX_ADDRESSES = 4096
+SCAN_MAX_IN_FLIGHT = 64
+SCAN_TIME_BUDGET = 120
+SCAN_TIMEOUT_MIN = 0.3
+SCAN_TIMEOUT_MAX = 3.0
+
+SNMP_OID_EATON_ENTERPRISE = "1.3.6.1.4.1.534"
+SNMP_OID_UPS_MIB = "1.3.6.1.2.1.33"
+
 SNMP_OID_IDENT_SYSTEM_NAME = "1.3.6.1.2.1.1.1.0"
+SNMP_OID_IDENT_OBJECT_ID = "1.3.6.1.2.1.1.2.0"
+SNMP_OID_SYSTEM_UPTIME = "1.3.6.1.2.1.1.3.0"
 SNMP_OID_IDENT_PRODUCT_NAME = "1.3.6.1.4.1.534.1.1.2.0"
 SNMP_OID_IDENT_PRODUCT_NAME_XUPS = "1.3.6.1.2.1.33.1.1.2.0"
 SNMP_OID_IDENT_FIRMWARE_VERSION = "1.3.6.1.4.1.534.1.1.3.0"
@@ -78,8 +198,12 @@ SNMP_OID_BATTERY_FAILURE = "1.3.6.1.4.1.534.1.2.7.0"
 SNMP_OID_BATTERY_NOT_PRESENT = "1.3.6.1.4.1.534.1.2.8.0"
 SNMP_OID_BATTERY_AGED = "1.3.6.1.4.1.534.1.2.9.0"
 SNMP_OID_BATTERY_LOW_CAPACITY = "1.3.6.1.4.1.534.1.2.10.0"
+SNMP_OID_BATTERY_TEST = "1.3.6.1.4.1.534.1.8.1.0"
 SNMP_OID_BATTERY_TEST_STATUS = "1.3.6.1.4.1.534.1.8.2.0"
 
+SNMP_OID_CONTROL_OUTPUT_OFF_DELAY = "1.3.6.1.4.1.534.1.9.1.0"
+SNMP_OID_CONTROL_OUTPUT_ON_DELAY = "1.3.6.1.4.1.534.1.9.2.0"
+
 SNMP_OID_INPUT_NUM_PHASES = "1.3.6.1.4.1.534.1.3.3.0"
 SNMP_OID_INPUT_PHASE = "1.3.6.1.4.1.534.1.3.4.1.1.index"
 SNMP_OID_INPUT_VOLTAGE = "1.3.6.1.4.1.534.1.3.4.1.2.index"
@@ -99,6 +223,24 @@ SNMP_OID_OUTPUT_LOAD = "1.3.6.1.4.1.534.1.4.4.1.8.index"
 SNMP_OID_OUTPUT_SOURCE = "1.3.6.1.4.1.534.1.4.5.0"
 SNMP_OID_OUTPUT_STATUS = "1.3.6.1.4.1.534.1.4.10.0"
 
+SNMP_OID_ENV_AMBIENT_TEMP = "1.3.6.1.4.1.534.1.6.1.0"
+SNMP_OID_ENV_AMBIENT_HUMIDITY = "1.3.6.1.4.1.534.1.6.4.0"
+
+SNMP_OID_SENSOR_NAME = "1.3.6.1.4.1.534.6.8.1.1.2.1.1.index"
+SNMP_OID_SENSOR_TEMPERATURE = "1.3.6.1.4.1.534.6.8.1.2.5.1.3.index"
+SNMP_OID_SENSOR_HUMIDITY = "1.3.6.1.4.1.534.6.8.1.3.5.1.3.index"
+
+SNMP_OID_RECEPTACLES = "1.3.6.1.4.1.534.1.12.1.0"
+SNMP_OID_RECEPTACLE_STATUS = "1.3.6.1.4.1.534.1.12.2.1.2.index"
+SNMP_OID_RECEPTACLE_OFF_DELAY = "1.3.6.1.4.1.534.1.12.2.1.3.index"
+SNMP_OID_RECEPTACLE_ON_DELAY = "1.3.6.1.4.1.534.1.12.2.1.4.index"
+
+SNMP_OID_ALARMS = "1.3.6.1.4.1.534.1.7.1.0"
+SNMP_OID_ALARM_ID = "1.3.6.1.4.1.534.1.7.2.1.1.index"
+SNMP_OID_ALARM_DESCR = "1.3.6.1.4.1.534.1.7.2.1.2.index"
+SNMP_OID_ALARM_TIME = "1.3.6.1.4.1.534.1.7.2.1.3.index"
+SNMP_OID_WELL_KNOWN_ALARMS = "1.3.6.1.4.1.534.1.7"
+
 
 class YesNo(Enum):
     """Mapping for yes/no."""
@@ -120,6 +262,12 @@ class AbmStatus(Enum):
     check_battery = 8
 
 
+class BatteryTest(Enum):
+    """Values for Battery Test."""
+
+    start_test = 1
+
+
 class BatteryTestStatus(Enum):
     """Values for Battery Test Status."""
 
@@ -178,3 +326,53 @@ class OutputStatus(Enum):
     output_not_protected = 2
     output_protected = 3
     output_powered_no_continuity = 4
+
+
+class ReceptacleStatus(Enum):
+    """Values for Receptacle Status."""
+
+    on = 1
+    off = 2
+    pending_off = 3
+    pending_on = 4
+    unknown = 5
+
+
+class WellKnownAlarm(Enum):
+    """Values for the XUPS well known alarms."""
+
+    on_battery = 3
+    low_battery = 4
+    utility_power_restored = 5
+    return_from_low_battery = 6
+    output_overload = 7
+    internal_failure = 8
+    battery_discharged = 9
+    inverter_failure = 10
+    on_bypass = 11
+    bypass_not_available = 12
+    output_off = 13
+    input_failure = 14
+    building_alarm = 15
+    shutdown_imminent = 16
+    on_inverter = 17
+    breaker_open = 20
+    battery_bad = 23
+    output_off_as_requested = 24
+    diagnostic_test_failed = 25
+    communications_lost = 26
+    shutdown_pending = 27
+    test_in_progress = 28
+    ambient_temp_bad = 29
+    loss_of_redundancy = 30
+    temp_bad = 31
+    charger_failed = 32
+    fan_failure = 33
+    fuse_failure = 34
+    power_switch_bad = 35
+    module_failure = 36
+    on_alternate_power_source = 37
+    alt_power_not_available = 38
+    notice_condition = 39
+    remote_temp_bad = 40
+    remote_humidity_bad = 41
@@ -2,26 +2,46 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import timedelta
+from functools import partial
 import logging
+import time
+from typing import Any
 
+from homeassistant.const import ATTR_BATTERY_LEVEL
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import SnmpApi
+from .analytics import BatteryAnalytics, is_discharging
+from .api import SnmpApi, SnmpTimeoutError
 from .const import (
+    ATTR_HOST,
+    ATTRIBUTES_ALARMS,
+    ATTRIBUTES_BATTERY,
+    DISCHARGE_POLL_INTERVAL,
     DOMAIN,
-    SNMP_OID_BATTERY_ABM_STATUS,
-    SNMP_OID_BATTERY_AGED,
+    EVENT_ALARM,
+    GROUP_ALARMS,
+    GROUP_BASE,
+    GROUP_ENVIRONMENT,
+    GROUP_INPUT,
+    GROUP_OUTPUT,
+    GROUP_RECEPTACLES,
+    MANUFACTURER,
+    SNMP_AGENT_PROBE_INTERVAL,
+    SNMP_BACKOFF_MAX,
+    SNMP_CONFIRM_DELAYS,
+    SNMP_OID_ALARM_DESCR,
+    SNMP_OID_ALARM_ID,
+    SNMP_OID_ALARM_TIME,
+    SNMP_OID_ALARMS,
     SNMP_OID_BATTERY_CAPACITY,
-    SNMP_OID_BATTERY_CURRENT,
-    SNMP_OID_BATTERY_FAILURE,
-    SNMP_OID_BATTERY_LAST_REPLACED,
-    SNMP_OID_BATTERY_LOW_CAPACITY,
-    SNMP_OID_BATTERY_NOT_PRESENT,
-    SNMP_OID_BATTERY_REMAINING,
-    SNMP_OID_BATTERY_TEST_STATUS,
-    SNMP_OID_BATTERY_VOLTAGE,
     SNMP_OID_IDENT_FIRMWARE_VERSION,
     SNMP_OID_IDENT_FIRMWARE_VERSION_XUPS,
     SNMP_OID_IDENT_PART_NUMBER,
@@ -30,27 +50,161 @@ from .const import (
     SNMP_OID_IDENT_SERIAL_NUMBER,
     SNMP_OID_IDENT_SERIAL_NUMBER_XUPS,
     SNMP_OID_IDENT_SYSTEM_NAME,
-    SNMP_OID_INPUT_CURRENT,
-    SNMP_OID_INPUT_NAME,
     SNMP_OID_INPUT_NUM_PHASES,
-    SNMP_OID_INPUT_PHASE,
-    SNMP_OID_INPUT_SOURCE,
-    SNMP_OID_INPUT_STATUS,
-    SNMP_OID_INPUT_VOLTAGE,
-    SNMP_OID_INPUT_WATTS,
-    SNMP_OID_OUTPUT_CURRENT,
-    SNMP_OID_OUTPUT_LOAD,
-    SNMP_OID_OUTPUT_NAME,
     SNMP_OID_OUTPUT_NUM_PHASES,
-    SNMP_OID_OUTPUT_PHASE,
-    SNMP_OID_OUTPUT_SOURCE,
-    SNMP_OID_OUTPUT_STATUS,
-    SNMP_OID_OUTPUT_VOLTAGE,
-    SNMP_OID_OUTPUT_WATTS,
+    SNMP_OID_RECEPTACLES,
+    SNMP_OID_SYSTEM_UPTIME,
+    SNMP_OID_WELL_KNOWN_ALARMS,
+    SNMP_SET_BATCH_WINDOW,
+    SNMP_STALE_AFTER,
+    WellKnownAlarm,
 )
+from .descriptions import DESCRIPTIONS, SnmpEntityDescriptionMixin
 
 _LOGGER = logging.getLogger(__name__)
 
+IDENT_OIDS = [
+    SNMP_OID_IDENT_SYSTEM_NAME,
+    SNMP_OID_IDENT_PRODUCT_NAME,
+    SNMP_OID_IDENT_PRODUCT_NAME_XUPS,
+    SNMP_OID_IDENT_PART_NUMBER,
+    SNMP_OID_IDENT_SERIAL_NUMBER,
+    SNMP_OID_IDENT_SERIAL_NUMBER_XUPS,
+    SNMP_OID_IDENT_FIRMWARE_VERSION,
+    SNMP_OID_IDENT_FIRMWARE_VERSION_XUPS,
+]
+
+TABLES = {
+    GROUP_INPUT: SNMP_OID_INPUT_NUM_PHASES,
+    GROUP_OUTPUT: SNMP_OID_OUTPUT_NUM_PHASES,
+    GROUP_RECEPTACLES: SNMP_OID_RECEPTACLES,
+}
+
+BASE_OIDS = list(
+    dict.fromkeys(
+        [
+            SNMP_OID_SYSTEM_UPTIME,
+            *TABLES.values(),
+            SNMP_OID_ALARMS,
+            *(
+                description.value_oid
+                for description in DESCRIPTIONS
+                if description.count_oid is None
+                and not description.discovered
+                and not description.derived
+            ),
+        ]
+    )
+)
+
+TABLE_COLUMNS = {
+    group: (
+        list(
+            dict.fromkeys(
+                description.name_oid
+                for description in DESCRIPTIONS
+                if description.count_oid == count_oid and description.name_oid
+            )
+        ),
+        list(
+            dict.fromkeys(
+                description.value_oid
+                for description in DESCRIPTIONS
+                if description.count_oid == count_oid
+            )
+        ),
+    )
+    for group, count_oid in TABLES.items()
+}
+
+PROBES = [description for description in DESCRIPTIONS if description.discovered]
+
+
+@dataclass(frozen=True)
+class DeviceIdentity:
+    """Identity of the device behind an agent, built once per identity read."""
+
+    identifier: Any
+    name: str | None
+    model: str | None
+    serial_number: str | None
+    sw_version: str | None
+    device_info: DeviceInfo
+
+    @classmethod
+    def from_data(cls, data: dict, host: str | None) -> DeviceIdentity:
+        """Create the identity from the identity OIDs of an agent."""
+        serial_number = data.get(
+            SNMP_OID_IDENT_SERIAL_NUMBER, data.get(SNMP_OID_IDENT_SERIAL_NUMBER_XUPS)
+        )
+        identifier = host if serial_number is None else serial_number
+        name = data.get(
+            SNMP_OID_IDENT_SYSTEM_NAME,
+            data.get(
+                SNMP_OID_IDENT_PRODUCT_NAME, data.get(SNMP_OID_IDENT_PRODUCT_NAME_XUPS)
+            ),
+        )
+        model = data.get(SNMP_OID_IDENT_PART_NUMBER)
+        sw_version = data.get(
+            SNMP_OID_IDENT_FIRMWARE_VERSION,
+            data.get(SNMP_OID_IDENT_FIRMWARE_VERSION_XUPS),
+        )
+        return cls(
+            identifier=identifier,
+            name=name,
+            model=model,
+            serial_number=serial_number,
+            sw_version=sw_version,
+            device_info=DeviceInfo(
+                identifiers={(DOMAIN, identifier)},
+                manufacturer=MANUFACTURER,
+                model=model,
+                name=name,
+                serial_number=serial_number,
+                sw_version=sw_version,
+            ),
+        )
+
+
+@dataclass
+class RequestGroup:
+    """State of a group of OIDs requested together."""
+
+    name: str
+    oids: set[str] = field(default_factory=set)
+    last_success: float | None = None
+    failures: int = 0
+    next_attempt: float = 0.0
+    error: str | None = None
+
+    def due(self, now: float) -> bool:
+        """Return if the group should be requested."""
+        return now >= self.next_attempt
+
+    def age(self, now: float) -> float | None:
+        """Return the seconds since the last successful request."""
+        if self.last_success is None:
+            return None
+        return now - self.last_success
+
+    def succeeded(self, now: float, oids: set[str]) -> None:
+        """Record a successful request."""
+        self.oids = oids
+        self.last_success = now
+        self.failures = 0
+        self.next_attempt = 0.0
+        self.error = None
+
+    def failed(self, now: float, interval: float, error: Exception) -> None:
+        """Record a failed request and back off exponentially."""
+        self.failures += 1
+        self.next_attempt = (
+            now
+            + min(SNMP_BACKOFF_MAX, interval * 2 ** (self.failures - 1))
+            - interval / 2
+        )
+        self.error = str(error)
+
 
 class SnmpCoordinator(DataUpdateCoordinator):
     """Data update coordinator."""
@@ -64,79 +218,521 @@ class SnmpCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=60),
         )
         self._api = api
+        self.options = dict(self.config_entry.options)
+        self.config_data = dict(self.config_entry.data)
 
-        self._baseOIDs = [
-            SNMP_OID_IDENT_SYSTEM_NAME,
-            SNMP_OID_IDENT_PRODUCT_NAME,
-            SNMP_OID_IDENT_PRODUCT_NAME_XUPS,
-            SNMP_OID_IDENT_PART_NUMBER,
-            SNMP_OID_IDENT_SERIAL_NUMBER,
-            SNMP_OID_IDENT_SERIAL_NUMBER_XUPS,
-            SNMP_OID_IDENT_FIRMWARE_VERSION,
-            SNMP_OID_IDENT_FIRMWARE_VERSION_XUPS,
-            SNMP_OID_INPUT_NUM_PHASES,
-            SNMP_OID_INPUT_SOURCE,
-            SNMP_OID_INPUT_STATUS,
-            SNMP_OID_OUTPUT_NUM_PHASES,
-            SNMP_OID_OUTPUT_SOURCE,
-            SNMP_OID_OUTPUT_STATUS,
-            SNMP_OID_BATTERY_REMAINING,
-            SNMP_OID_BATTERY_VOLTAGE,
-            SNMP_OID_BATTERY_CURRENT,
-            SNMP_OID_BATTERY_CAPACITY,
-            SNMP_OID_BATTERY_ABM_STATUS,
-            SNMP_OID_BATTERY_LAST_REPLACED,
-            SNMP_OID_BATTERY_FAILURE,
-            SNMP_OID_BATTERY_NOT_PRESENT,
-            SNMP_OID_BATTERY_AGED,
-            SNMP_OID_BATTERY_LOW_CAPACITY,
-            SNMP_OID_BATTERY_TEST_STATUS,
-        ]
+        self._identOIDs = list(IDENT_OIDS)
+        self._baseOIDs = list(BASE_OIDS)
+        self._rows: dict[str, int] = {}
+        self._static_rows: dict[str, int] = {}
+        self._identity: dict | None = None
+        self._identity_due = True
+        self.identity = DeviceIdentity.from_data(
+            {}, self.config_entry.data.get(ATTR_HOST)
+        )
+        self._uptime: tuple[int, float] | None = None
+        self._next_probe = 0.0
 
-    async def _update_data(self) -> dict:
-        """Fetch the latest data from the source."""
-        try:
-            data = await self._api.get(self._baseOIDs)
+        self.alarms: dict[int, str] | None = None
+        self.probes: dict[str, list[str]] = {}
+        self.changed_oids: set[str] = set()
+        self.version = 0
+        self.poll_duration: float | None = None
+        self.polled_at: float | None = None
+        self.values: dict[str, Any] = {}
+        self.battery = BatteryAnalytics(hass, self)
+        self._interval: timedelta | None = None
+        self._lock = asyncio.Lock()
+        self._pending_values: dict[str, Any] = {}
+        self._pending_confirm: set[str] = set()
+        self._set_batch: asyncio.Future[None] | None = None
+        self._stale_refresh: asyncio.Task[None] | None = None
+        self.attributes: dict[str, dict] = {
+            ATTRIBUTES_ALARMS: {"alarms": []},
+            ATTRIBUTES_BATTERY: {},
+        }
 
-            if self.data is None:
-                self.data = data
-            else:
-                self.data.update(data)
+        self.groups = {
+            name: RequestGroup(name)
+            for name in (
+                GROUP_BASE,
+                GROUP_INPUT,
+                GROUP_OUTPUT,
+                GROUP_RECEPTACLES,
+                GROUP_ALARMS,
+            )
+        }
 
-            input_count = self.data.get(SNMP_OID_INPUT_NUM_PHASES, 0)
-            if input_count > 0:
-                for result in await self._api.get_bulk(
-                    [
-                        SNMP_OID_INPUT_PHASE.replace("index", ""),
-                        SNMP_OID_INPUT_VOLTAGE.replace("index", ""),
-                        SNMP_OID_INPUT_CURRENT.replace("index", ""),
-                        SNMP_OID_INPUT_WATTS.replace("index", ""),
-                        SNMP_OID_INPUT_NAME.replace("index", ""),
-                    ],
-                    input_count,
-                ):
-                    self.data.update(result)
+    def age(self, oid: str) -> float | None:
+        """Return the seconds since the value of the OID was last read."""
+        now = time.monotonic()
+        for group in self.groups.values():
+            if oid in group.oids:
+                return group.age(now)
+        return None
+
+    def is_stale(self, oid: str) -> bool:
+        """Return if the value of the OID is older than allowed."""
+        age = self.age(oid)
+        return age is not None and age > SNMP_STALE_AFTER
+
+    def _rebooted(self, uptime: int, now: float) -> bool:
+        """Return if the agent restarted since the previous sysUpTime sample.
+
+        sysUpTime counts hundredths of a second, a value well below the one
+        expected from the time elapsed since the previous sample means the
+        counter was reset.
+        """
+        if self._uptime is None:
+            return False
+        previous, then = self._uptime
+        elapsed = (now - then) * 100
+        return uptime < previous + elapsed * 0.9 - 1000
+
+    async def _update_identity(self) -> dict:
+        """Fetch the identity OIDs."""
+        data = await self._api.get(self._identOIDs)
+        if self._identity != data:
+            identity = DeviceIdentity.from_data(
+                data, self.config_entry.data.get(ATTR_HOST)
+            )
+            if self._identity is not None:
+                _LOGGER.info("Agent identity changed: %s", data)
+                if identity.identifier != self.identity.identifier:
+                    self.hass.config_entries.async_schedule_reload(
+                        self.config_entry.entry_id
+                    )
+                self._update_device(identity)
+            self.identity = identity
+        self._identity = data
+        self._identity_due = False
+        return data
 
-            output_count = self.data.get(SNMP_OID_OUTPUT_NUM_PHASES, 0)
-            if output_count > 0:
+    def _update_device(self, identity: DeviceIdentity) -> None:
+        """Update the device registry entry from a changed identity."""
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get_device(
+            identifiers={(DOMAIN, self.identity.identifier)}
+        )
+        if device is None:
+            return
+        device_registry.async_update_device(
+            device.id, model=identity.model, sw_version=identity.sw_version
+        )
+
+    def _reset(self) -> None:
+        """Forget everything learned about the agent."""
+        self._identOIDs = list(IDENT_OIDS)
+        self._baseOIDs = list(BASE_OIDS)
+        self._static_rows.clear()
+        self._identity_due = True
+        self._next_probe = 0.0
+
+    async def async_reconfigure(self) -> None:
+        """Swap the target and credentials of the agent in place.
+
+        The identity is read again with the new settings, a different device
+        behind them reloads the entry. The swap waits for a running poll or
+        confirmation, which may be in the middle of a multi-request read.
+        """
+        async with self._lock:
+            await self._api.setup(self.config_entry)
+            self.config_data = dict(self.config_entry.data)
+            self._reset()
+            self._uptime = None
+        for group in self.groups.values():
+            group.next_attempt = 0.0
+        await self.async_request_refresh()
+
+    async def _update_base(self) -> dict:
+        """Fetch the scalar OIDs, and the identity after an agent restart."""
+        data = await self._api.get(self._baseOIDs)
+
+        now = time.monotonic()
+        uptime = data.get(SNMP_OID_SYSTEM_UPTIME)
+        if isinstance(uptime, int):
+            if self._rebooted(uptime, now):
+                _LOGGER.info("Agent restarted, uptime went back to %d", uptime)
+                self._reset()
+                # Re-read the scalars whose support may have changed.
+                data = await self._api.get(self._baseOIDs)
+            self._uptime = (uptime, now)
+
+        if self._identity_due:
+            data.update(await self._update_identity())
+        if self._api.failover and now >= self._next_probe:
+            self._next_probe = now + SNMP_AGENT_PROBE_INTERVAL
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._api.probe_agents(self.identity.serial_number),
+                f"{DOMAIN} agent probe",
+            )
+        if GROUP_ENVIRONMENT not in self._static_rows:
+            try:
+                data.update(await self._update_probes())
+            except SnmpTimeoutError as err:
+                _LOGGER.debug("Environment probe discovery timed out: %s", err)
+            except RuntimeError as err:
+                # Agents without GETBULK fail every walk, wait for a restart.
+                _LOGGER.info("Environment probe discovery failed: %s", err)
+                self._static_rows[GROUP_ENVIRONMENT] = 0
+        return data
+
+    async def _update_probes(self) -> dict:
+        """Discover the environment probes and add their values to the scalars.
+
+        The probe tables are walked once, afterwards the probe values are
+        read with the other scalar OIDs in the same request.
+        """
+        data = await self._api.walk(
+            [
+                column.replace("index", "")
+                for column in dict.fromkeys(
+                    column
+                    for description in PROBES
+                    for column in (description.name_oid, description.value_oid)
+                )
+            ]
+        )
+
+        for oids in self.probes.values():
+            for oid in oids:
+                if oid in self._baseOIDs:
+                    self._baseOIDs.remove(oid)
+                if oid not in data and self.data.pop(oid, None) is not None:
+                    self.changed_oids.add(oid)
+
+        self.probes = {}
+        for description in PROBES:
+            prefix = description.value_oid.replace("index", "")
+            self.probes[description.value_oid] = [
+                oid for oid in data if oid.startswith(prefix)
+            ]
+            for oid in self.probes[description.value_oid]:
+                index = oid.removeprefix(prefix)
+                # Channels may be indexed below the probe, name them by probe.
+                data.setdefault(
+                    description.name_oid.replace("index", index),
+                    data.get(
+                        description.name_oid.replace("index", index.split(".")[0]),
+                        f"Probe {index}",
+                    ),
+                )
+                self._baseOIDs.append(oid)
+        self._static_rows[GROUP_ENVIRONMENT] = sum(map(len, self.probes.values()))
+        return data
+
+    async def _update_table(self, group: str) -> dict:
+        """Fetch a table, reading the static columns only on changes."""
+        count = self.data.get(TABLES[group], 0)
+        if not isinstance(count, int):
+            count = 0
+        static_columns, columns = TABLE_COLUMNS[group]
+        previous = self._rows.get(group)
+        if previous is not None and previous > count:
+            _LOGGER.debug("Table %s shrank from %d to %d", group, previous, count)
+            for index in range(count + 1, previous + 1):
+                for column in static_columns + columns:
+                    oid = column.replace("index", str(index))
+                    if self.data.pop(oid, None) is not None:
+                        self.changed_oids.add(oid)
+
+        data = {}
+        static = static_columns and self._static_rows.get(group) != count
+        if count > 0:
+            if static:
                 for result in await self._api.get_bulk(
-                    [
-                        SNMP_OID_OUTPUT_PHASE.replace("index", ""),
-                        SNMP_OID_OUTPUT_VOLTAGE.replace("index", ""),
-                        SNMP_OID_OUTPUT_CURRENT.replace("index", ""),
-                        SNMP_OID_OUTPUT_WATTS.replace("index", ""),
-                        SNMP_OID_OUTPUT_NAME.replace("index", ""),
-                        SNMP_OID_OUTPUT_LOAD.replace("index", ""),
-                    ],
-                    output_count,
+                    [column.replace("index", "") for column in static_columns],
+                    count,
+                    0,
                 ):
-                    self.data.update(result)
+                    data.update(result)
+
+            for result in await self._api.get_bulk(
+                [column.replace("index", "") for column in columns], count, 0
+            ):
+                data.update(result)
+        # The static columns are read again unless the whole table succeeded.
+        if static:
+            self._static_rows[group] = count
+        self._rows[group] = count
+        return data
+
+    async def _update_alarms(self) -> dict:
+        """Fetch the alarm table when the number of active alarms changed."""
+        count = self.data.get(SNMP_OID_ALARMS)
+        if not isinstance(count, int) or count == self._static_rows.get(GROUP_ALARMS):
+            return {}
+
+        data = {}
+        if count > 0:
+            for result in await self._api.get_bulk(
+                [
+                    column.replace("index", "")
+                    for column in (
+                        SNMP_OID_ALARM_ID,
+                        SNMP_OID_ALARM_DESCR,
+                        SNMP_OID_ALARM_TIME,
+                    )
+                ],
+                count,
+                0,
+            ):
+                data.update(result)
+        self._static_rows[GROUP_ALARMS] = count
+
+        prefix = SNMP_OID_ALARM_ID.replace("index", "")
+        alarms = {}
+        for oid, alarm_id in data.items():
+            if oid.startswith(prefix):
+                index = oid.removeprefix(prefix)
+                alarms[alarm_id] = __class__.alarm_name(
+                    str(data.get(SNMP_OID_ALARM_DESCR.replace("index", index)))
+                )
+        self._update_alarm_events(alarms)
+        return {}
+
+    @staticmethod
+    def alarm_name(descr: str) -> str:
+        """Return the name of a well known alarm or its OID."""
+        if descr.startswith(f"{SNMP_OID_WELL_KNOWN_ALARMS}."):
+            try:
+                return WellKnownAlarm(int(descr.rsplit(".", 1)[1])).name
+            except ValueError:
+                pass
+        return descr
+
+    def _update_alarm_events(self, alarms: dict[int, str]) -> None:
+        """Fire an event for every alarm raised or cleared since the last read."""
+        previous, self.alarms = self.alarms, alarms
+        self.attributes[ATTRIBUTES_ALARMS] = {"alarms": sorted(set(alarms.values()))}
+        if previous is None:
+            return
+        for alarm_id, name in previous.items():
+            if alarms.get(alarm_id) != name:
+                self._fire_alarm_event(alarm_id, name, False)
+        for alarm_id, name in alarms.items():
+            if previous.get(alarm_id) != name:
+                self._fire_alarm_event(alarm_id, name, True)
+
+    def _fire_alarm_event(self, alarm_id: int, name: str, active: bool) -> None:
+        """Fire an alarm event on the event bus."""
+        _LOGGER.debug("Alarm %d %s active: %s", alarm_id, name, active)
+        self.hass.bus.async_fire(
+            EVENT_ALARM,
+            {
+                "entry_id": self.config_entry.entry_id,
+                "alarm_id": alarm_id,
+                "alarm": name,
+                "active": active,
+            },
+        )
+
+    def indexes(self, description: SnmpEntityDescriptionMixin) -> list[str]:
+        """Return the row indexes with a value for an entity description."""
+        if description.count_oid is not None:
+            return [
+                str(index)
+                for index in range(1, self.data.get(description.count_oid, 0) + 1)
+            ]
+        if description.discovered:
+            prefix = description.value_oid.replace("index", "")
+            return [
+                oid.removeprefix(prefix)
+                for oid in self.probes.get(description.value_oid, [])
+            ]
+        if description.optional and description.value_oid not in self.data:
+            return []
+        return [""]
+
+    def _update_interval(self) -> None:
+        """Poll faster while the battery discharges."""
+        discharging = is_discharging(self.data)
+        if discharging and self._interval is None:
+            self._interval = self.update_interval
+            self.update_interval = min(
+                self.update_interval, timedelta(seconds=DISCHARGE_POLL_INTERVAL)
+            )
+        elif not discharging and self._interval is not None:
+            self.update_interval, self._interval = self._interval, None
+
+    def _convert(self) -> None:
+        """Convert the changed raw values of all described OIDs in one pass."""
+        for description in DESCRIPTIONS:
+            if description.derived:
+                continue
+            for index in self.indexes(description):
+                oid = description.value_oid.replace("index", index)
+                if oid in self.changed_oids or oid not in self.values:
+                    self.values[oid] = description.convert(self.data.get(oid))
+        # Rows and probes that disappeared are no longer indexed.
+        for oid in self.changed_oids:
+            if oid not in self.data:
+                self.values.pop(oid, None)
+
+    async def async_set(self, values: dict[str, Any], confirm: Iterable[str]) -> None:
+        """Set OIDs on the agent and read back the OIDs showing the effect.
+
+        The values of all actions within a short window are sent in one SET
+        request, a failed request fails all of them.
+        """
+        self._pending_values.update(values)
+        self._pending_confirm.update(confirm)
+        if self._set_batch is None:
+            self._set_batch = self.hass.loop.create_future()
+            self.config_entry.async_create_background_task(
+                self.hass, self._async_send_batch(self._set_batch), f"{DOMAIN} set"
+            )
+        await asyncio.shield(self._set_batch)
+
+    async def _async_send_batch(self, batch: asyncio.Future[None]) -> None:
+        """Send the pending values once the batch window closed.
+
+        The batch always gets a result, also on unexpected errors and when the
+        task is cancelled on unload, so no action waits for it forever.
+        """
+        values, confirm = self._pending_values, self._pending_confirm
+        try:
+            await asyncio.sleep(SNMP_SET_BATCH_WINDOW)
+            self._close_batch()
+            async with self._lock:
+                await self._api.set(values)
+        except asyncio.CancelledError:
+            if self._set_batch is batch:
+                self._close_batch()
+            batch.set_exception(HomeAssistantError(f"Setting {values} was cancelled"))
+            raise
+        except Exception as err:
+            batch.set_exception(HomeAssistantError(f"Setting {values} failed: {err}"))
+            return
+        batch.set_result(None)
+        await self._async_confirm(confirm)
+
+    def _close_batch(self) -> None:
+        """Collect the values of later actions in a new batch."""
+        self._pending_values = {}
+        self._pending_confirm = set()
+        self._set_batch = None
+
+    async def _async_confirm(self, oids: set[str]) -> None:
+        """Read only the OIDs affected by a SET a few times after it.
+
+        Changed values are passed to the entities right away, without
+        requesting all groups of a refresh.
+        """
+        for delay in SNMP_CONFIRM_DELAYS:
+            await asyncio.sleep(delay)
+            async with self._lock:
+                try:
+                    data = await self._api.get(list(oids))
+                except RuntimeError as err:
+                    _LOGGER.debug("Reading back %s failed: %s", oids, err)
+                    continue
+                changed = {
+                    oid for oid, value in data.items() if self.data.get(oid) != value
+                }
+                if not changed:
+                    continue
+                self.changed_oids = changed
+                self.data.update(data)
+                self._convert()
+                self.version += 1
+            self.async_update_listeners()
+
+    async def async_get(self, oids: list[str]) -> dict[str, Any]:
+        """Read OIDs outside of the request groups between two polls.
+
+        The OIDs are chosen by others, their objects are not cached.
+        """
+        async with self._lock:
+            return await self._api.get(oids, cache=False)
+
+    async def async_refresh_stale(self, max_age: float) -> None:
+        """Refresh the data if it is older than the given seconds.
+
+        All callers share one refresh, and a poll already running may make
+        it unnecessary.
+        """
+        # The task starts eagerly and may already be done when it is returned.
+        if self._stale_refresh is None or self._stale_refresh.done():
+            self._stale_refresh = self.hass.async_create_task(
+                self._async_refresh_stale(max_age)
+            )
+        await asyncio.shield(self._stale_refresh)
+
+    async def _async_refresh_stale(self, max_age: float) -> None:
+        """Wait for a running poll and refresh if the data is still too old."""
+        async with self._lock:
+            pass
+        if self.polled_at is None or time.monotonic() - self.polled_at > max_age:
+            await self.async_refresh()
+
+    async def _update_data(self) -> dict:
+        """Fetch the latest data from the source.
+
+        Every request group succeeds or fails on its own. A failed group
+        keeps its last good values and is retried with backoff, the update
+        only fails if no group could be read.
+        """
+        if self.data is None:
+            self.data = {}
+
+        start = time.monotonic()
+        self.changed_oids = set()
+        interval = self.update_interval.total_seconds()
+        fetchers = {
+            GROUP_BASE: self._update_base,
+            **{group: partial(self._update_table, group) for group in TABLES},
+            GROUP_ALARMS: self._update_alarms,
+        }
+        succeeded = 0
+        errors = []
+        for name, fetch in fetchers.items():
+            group = self.groups[name]
+            if not group.due(time.monotonic()):
+                continue
+            try:
+                data = await fetch()
+            except RuntimeError as err:
+                group.failed(time.monotonic(), interval, err)
+                errors.append(f"{name}: {err}")
+                _LOGGER.debug(
+                    "Request group %s failed %d time(s): %s",
+                    name,
+                    group.failures,
+                    err,
+                )
+                continue
+
+            self.changed_oids.update(
+                oid for oid, value in data.items() if self.data.get(oid) != value
+            )
+            self.data.update(data)
+            group.succeeded(time.monotonic(), set(data))
+            if data:
+                succeeded += 1
+
+        if not succeeded:
+            raise UpdateFailed("; ".join(errors) or "All request groups back off")
+
+        self._convert()
+        self.battery.record(self.data, self.values)
+        self.values.update(self.battery.results)
+        self._update_interval()
+        self.version += 1
+        self.polled_at = time.monotonic()
+        self.poll_duration = self.polled_at - start
+        battery_level = self.data.get(SNMP_OID_BATTERY_CAPACITY)
+        if self.attributes[ATTRIBUTES_BATTERY].get(ATTR_BATTERY_LEVEL) != battery_level:
+            self.attributes[ATTRIBUTES_BATTERY] = {ATTR_BATTERY_LEVEL: battery_level}
 
-            return self.data  # noqa: TRY300
+        return self.data
 
-        except RuntimeError as err:
-            raise UpdateFailed(err) from err
+    async def _async_setup(self) -> None:
+        """Load the stored battery history."""
+        await self.battery.async_load()
 
     async def _async_update_data(self) -> dict:
         """Fetch the latest data from the source."""
-        return await self._update_data()
+        async with self._lock:
+            return await self._update_data()
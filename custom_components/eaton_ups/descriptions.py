@@ -0,0 +1,502 @@
+"""Entity descriptions for Eaton UPS entities."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntityDescription,
+)
+from homeassistant.components.button import ButtonEntityDescription
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.components.switch import SwitchDeviceClass, SwitchEntityDescription
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfElectricCurrent,
+    UnitOfElectricPotential,
+    UnitOfPower,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+
+from .const import (
+    ATTRIBUTES_ALARMS,
+    ATTRIBUTES_BATTERY,
+    DERIVED_BATTERY_CAPACITY_TREND,
+    DERIVED_BATTERY_HEALTH,
+    DERIVED_BATTERY_REFERENCE_RUNTIME,
+    DERIVED_BATTERY_TIME_TO_EMPTY,
+    SNMP_OID_ALARMS,
+    SNMP_OID_BATTERY_ABM_STATUS,
+    SNMP_OID_BATTERY_AGED,
+    SNMP_OID_BATTERY_CAPACITY,
+    SNMP_OID_BATTERY_FAILURE,
+    SNMP_OID_BATTERY_LAST_REPLACED,
+    SNMP_OID_BATTERY_LOW_CAPACITY,
+    SNMP_OID_BATTERY_NOT_PRESENT,
+    SNMP_OID_BATTERY_REMAINING,
+    SNMP_OID_BATTERY_TEST,
+    SNMP_OID_BATTERY_TEST_STATUS,
+    SNMP_OID_BATTERY_VOLTAGE,
+    SNMP_OID_ENV_AMBIENT_HUMIDITY,
+    SNMP_OID_ENV_AMBIENT_TEMP,
+    SNMP_OID_INPUT_NAME,
+    SNMP_OID_INPUT_NUM_PHASES,
+    SNMP_OID_INPUT_SOURCE,
+    SNMP_OID_INPUT_STATUS,
+    SNMP_OID_INPUT_VOLTAGE,
+    SNMP_OID_OUTPUT_CURRENT,
+    SNMP_OID_OUTPUT_LOAD,
+    SNMP_OID_OUTPUT_NAME,
+    SNMP_OID_OUTPUT_NUM_PHASES,
+    SNMP_OID_OUTPUT_SOURCE,
+    SNMP_OID_OUTPUT_STATUS,
+    SNMP_OID_OUTPUT_VOLTAGE,
+    SNMP_OID_OUTPUT_WATTS,
+    SNMP_OID_RECEPTACLE_OFF_DELAY,
+    SNMP_OID_RECEPTACLE_ON_DELAY,
+    SNMP_OID_RECEPTACLE_STATUS,
+    SNMP_OID_RECEPTACLES,
+    SNMP_OID_SENSOR_HUMIDITY,
+    SNMP_OID_SENSOR_NAME,
+    SNMP_OID_SENSOR_TEMPERATURE,
+    AbmStatus,
+    BatteryTest,
+    BatteryTestStatus,
+    InputSource,
+    InputStatus,
+    OutputSource,
+    OutputStatus,
+    ReceptacleStatus,
+    SensorClass,
+)
+
+
+def parse_date(value: Any) -> date | None:
+    """Parse a date reported as mm/dd/yyyy."""
+    try:
+        return datetime.strptime(value, "%m/%d/%Y").date()
+    except ValueError, TypeError:
+        return None
+
+
+@dataclass(frozen=True, kw_only=True)
+class SnmpEntityDescriptionMixin:
+    """Describes how an Eaton UPS entity is polled, named and converted.
+
+    Entities of a table get one entity per row of ``count_oid``, entities
+    of discovered probes one per discovered OID. The ``index`` placeholder
+    of the OIDs and the name prefix is replaced by the row index. Derived
+    entities are computed by the integration, their ``value_oid`` is only
+    the key of their value.
+    """
+
+    value_oid: str
+    name_oid: str | None = None
+    name_prefix: str = ""
+    name_suffix: str = ""
+    count_oid: str | None = None
+    discovered: bool = False
+    optional: bool = False
+    derived: bool = False
+    attributes: str | None = None
+    default_value: Any = None
+    multiplier: float | None = None
+    converter: Callable[[Any], Any] | None = None
+
+    def convert(self, value: Any) -> Any:
+        """Convert a raw value into the entity value."""
+        if value is None:
+            value = self.default_value
+        if self.converter is not None:
+            return self.converter(value)
+        if self.multiplier is not None and value is not None:
+            return value * self.multiplier
+        return value
+
+
+@dataclass(frozen=True, kw_only=True)
+class SnmpSensorEntityDescription(SensorEntityDescription, SnmpEntityDescriptionMixin):
+    """Describes an Eaton UPS sensor."""
+
+    state_class: SensorStateClass | str | None = SensorStateClass.MEASUREMENT
+    default_value: Any = 0.0
+    sensor_class: SensorClass | None = None
+    changed_only: bool = False
+
+
+@dataclass(frozen=True, kw_only=True)
+class SnmpBinarySensorEntityDescription(
+    BinarySensorEntityDescription, SnmpEntityDescriptionMixin
+):
+    """Describes an Eaton UPS binary sensor."""
+
+
+@dataclass(frozen=True, kw_only=True)
+class SnmpButtonEntityDescription(ButtonEntityDescription, SnmpEntityDescriptionMixin):
+    """Describes an Eaton UPS button setting ``set_oid`` when pressed.
+
+    The ``value_oid`` shows the effect of the button, it is read back after
+    the button was pressed.
+    """
+
+    set_oid: str
+    set_value: Any
+
+
+@dataclass(frozen=True, kw_only=True)
+class SnmpSwitchEntityDescription(SwitchEntityDescription, SnmpEntityDescriptionMixin):
+    """Describes an Eaton UPS switch.
+
+    The switch is on while ``value_oid`` has one of the ``on_values``, it is
+    switched by setting the delay ``on_oid`` or ``off_oid`` to 0.
+    """
+
+    on_oid: str
+    off_oid: str
+    on_values: tuple[Any, ...]
+
+
+SENSORS: tuple[SnmpSensorEntityDescription, ...] = (
+    SnmpSensorEntityDescription(
+        key="battery_voltage",
+        value_oid=SNMP_OID_BATTERY_VOLTAGE,
+        name_prefix="Battery",
+        name_suffix="Voltage",
+        attributes=ATTRIBUTES_BATTERY,
+        device_class=SensorDeviceClass.VOLTAGE,
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        sensor_class=SensorClass.VOLTAGE,
+    ),
+    SnmpSensorEntityDescription(
+        key="battery_capacity",
+        value_oid=SNMP_OID_BATTERY_CAPACITY,
+        name_prefix="Battery",
+        name_suffix="Capacity",
+        device_class=SensorDeviceClass.BATTERY,
+        native_unit_of_measurement=PERCENTAGE,
+    ),
+    SnmpSensorEntityDescription(
+        key="battery_abm_status",
+        value_oid=SNMP_OID_BATTERY_ABM_STATUS,
+        name_prefix="Battery",
+        name_suffix="ABM Status",
+        attributes=ATTRIBUTES_BATTERY,
+        device_class=SensorDeviceClass.ENUM,
+        state_class=None,
+        translation_key="abm_status",
+        options=[abm_status.value for abm_status in AbmStatus],
+    ),
+    SnmpSensorEntityDescription(
+        key="battery_last_replaced",
+        value_oid=SNMP_OID_BATTERY_LAST_REPLACED,
+        name_prefix="Battery",
+        name_suffix="Last Replaced",
+        attributes=ATTRIBUTES_BATTERY,
+        device_class=SensorDeviceClass.DATE,
+        state_class=None,
+        default_value=None,
+        converter=parse_date,
+    ),
+    SnmpSensorEntityDescription(
+        key="battery_remaining",
+        value_oid=SNMP_OID_BATTERY_REMAINING,
+        name_prefix="Battery",
+        name_suffix="Remaining",
+        attributes=ATTRIBUTES_BATTERY,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        sensor_class=SensorClass.REMAINING,
+    ),
+    SnmpSensorEntityDescription(
+        key="battery_time_to_empty",
+        value_oid=DERIVED_BATTERY_TIME_TO_EMPTY,
+        name_prefix="Battery",
+        name_suffix="Time To Empty",
+        attributes=ATTRIBUTES_BATTERY,
+        derived=True,
+        default_value=None,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        sensor_class=SensorClass.REMAINING,
+    ),
+    SnmpSensorEntityDescription(
+        key="battery_test_status",
+        value_oid=SNMP_OID_BATTERY_TEST_STATUS,
+        name_prefix="Battery",
+        name_suffix="Test Status",
+        attributes=ATTRIBUTES_BATTERY,
+        device_class=SensorDeviceClass.ENUM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=None,
+        translation_key="battery_test_status",
+        options=[
+            battery_test_status.value for battery_test_status in BatteryTestStatus
+        ],
+    ),
+    SnmpSensorEntityDescription(
+        key="battery_health",
+        value_oid=DERIVED_BATTERY_HEALTH,
+        name_prefix="Battery",
+        name_suffix="Health",
+        derived=True,
+        default_value=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        native_unit_of_measurement=PERCENTAGE,
+    ),
+    SnmpSensorEntityDescription(
+        key="battery_capacity_trend",
+        value_oid=DERIVED_BATTERY_CAPACITY_TREND,
+        name_prefix="Battery",
+        name_suffix="Capacity Trend",
+        derived=True,
+        default_value=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        native_unit_of_measurement=f"{PERCENTAGE}/year",
+    ),
+    SnmpSensorEntityDescription(
+        key="battery_reference_runtime",
+        value_oid=DERIVED_BATTERY_REFERENCE_RUNTIME,
+        name_prefix="Battery",
+        name_suffix="Runtime At Half Load",
+        derived=True,
+        default_value=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+    ),
+    SnmpSensorEntityDescription(
+        key="input_source",
+        value_oid=SNMP_OID_INPUT_SOURCE,
+        name_prefix="Input",
+        name_suffix="Source",
+        device_class=SensorDeviceClass.ENUM,
+        state_class=None,
+        translation_key="input_source",
+        options=[input_source.value for input_source in InputSource],
+    ),
+    SnmpSensorEntityDescription(
+        key="input_status",
+        value_oid=SNMP_OID_INPUT_STATUS,
+        name_prefix="Input",
+        name_suffix="Status",
+        device_class=SensorDeviceClass.ENUM,
+        state_class=None,
+        translation_key="input_status",
+        options=[input_status.value for input_status in InputStatus],
+    ),
+    SnmpSensorEntityDescription(
+        key="output_source",
+        value_oid=SNMP_OID_OUTPUT_SOURCE,
+        name_prefix="Output",
+        name_suffix="Source",
+        device_class=SensorDeviceClass.ENUM,
+        state_class=None,
+        translation_key="output_source",
+        options=[output_source.value for output_source in OutputSource],
+    ),
+    SnmpSensorEntityDescription(
+        key="output_status",
+        value_oid=SNMP_OID_OUTPUT_STATUS,
+        name_prefix="Output",
+        name_suffix="Status",
+        device_class=SensorDeviceClass.ENUM,
+        state_class=None,
+        translation_key="output_status",
+        options=[output_status.value for output_status in OutputStatus],
+    ),
+    SnmpSensorEntityDescription(
+        key="active_alarms",
+        value_oid=SNMP_OID_ALARMS,
+        name_prefix="Active",
+        name_suffix="Alarms",
+        attributes=ATTRIBUTES_ALARMS,
+    ),
+    SnmpSensorEntityDescription(
+        key="ambient_temperature",
+        value_oid=SNMP_OID_ENV_AMBIENT_TEMP,
+        name_prefix="Environment",
+        name_suffix="Temperature",
+        optional=True,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    ),
+    SnmpSensorEntityDescription(
+        key="ambient_humidity",
+        value_oid=SNMP_OID_ENV_AMBIENT_HUMIDITY,
+        name_prefix="Environment",
+        name_suffix="Humidity",
+        optional=True,
+        device_class=SensorDeviceClass.HUMIDITY,
+        native_unit_of_measurement=PERCENTAGE,
+    ),
+    SnmpSensorEntityDescription(
+        key="input_voltage",
+        value_oid=SNMP_OID_INPUT_VOLTAGE,
+        name_oid=SNMP_OID_INPUT_NAME,
+        name_prefix="Input",
+        name_suffix="Voltage",
+        count_oid=SNMP_OID_INPUT_NUM_PHASES,
+        device_class=SensorDeviceClass.VOLTAGE,
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        entity_registry_visible_default=False,
+        sensor_class=SensorClass.VOLTAGE,
+    ),
+    SnmpSensorEntityDescription(
+        key="output_voltage",
+        value_oid=SNMP_OID_OUTPUT_VOLTAGE,
+        name_oid=SNMP_OID_OUTPUT_NAME,
+        name_prefix="Output",
+        name_suffix="Voltage",
+        count_oid=SNMP_OID_OUTPUT_NUM_PHASES,
+        device_class=SensorDeviceClass.VOLTAGE,
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        entity_registry_visible_default=False,
+        sensor_class=SensorClass.VOLTAGE,
+    ),
+    SnmpSensorEntityDescription(
+        key="output_current",
+        value_oid=SNMP_OID_OUTPUT_CURRENT,
+        name_oid=SNMP_OID_OUTPUT_NAME,
+        name_prefix="Output",
+        name_suffix="Current",
+        count_oid=SNMP_OID_OUTPUT_NUM_PHASES,
+        device_class=SensorDeviceClass.CURRENT,
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        entity_registry_visible_default=False,
+        sensor_class=SensorClass.CURRENT,
+    ),
+    SnmpSensorEntityDescription(
+        key="output_watts",
+        value_oid=SNMP_OID_OUTPUT_WATTS,
+        name_oid=SNMP_OID_OUTPUT_NAME,
+        name_prefix="Output",
+        name_suffix="Watts",
+        count_oid=SNMP_OID_OUTPUT_NUM_PHASES,
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        sensor_class=SensorClass.WATTS,
+    ),
+    SnmpSensorEntityDescription(
+        key="output_load",
+        value_oid=SNMP_OID_OUTPUT_LOAD,
+        name_oid=SNMP_OID_OUTPUT_NAME,
+        name_prefix="Output",
+        name_suffix="Load",
+        count_oid=SNMP_OID_OUTPUT_NUM_PHASES,
+        native_unit_of_measurement=PERCENTAGE,
+        sensor_class=SensorClass.LOAD,
+    ),
+    SnmpSensorEntityDescription(
+        key="receptacle_status",
+        value_oid=SNMP_OID_RECEPTACLE_STATUS,
+        name_prefix="Receptacle {index}",
+        name_suffix="Status",
+        count_oid=SNMP_OID_RECEPTACLES,
+        device_class=SensorDeviceClass.ENUM,
+        state_class=None,
+        translation_key="receptacle_status",
+        options=[receptacle_status.value for receptacle_status in ReceptacleStatus],
+        changed_only=True,
+    ),
+    SnmpSensorEntityDescription(
+        key="probe_temperature",
+        value_oid=SNMP_OID_SENSOR_TEMPERATURE,
+        name_oid=SNMP_OID_SENSOR_NAME,
+        name_prefix="Environment",
+        name_suffix="Temperature",
+        discovered=True,
+        multiplier=0.1,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    ),
+    SnmpSensorEntityDescription(
+        key="probe_humidity",
+        value_oid=SNMP_OID_SENSOR_HUMIDITY,
+        name_oid=SNMP_OID_SENSOR_NAME,
+        name_prefix="Environment",
+        name_suffix="Humidity",
+        discovered=True,
+        multiplier=0.1,
+        device_class=SensorDeviceClass.HUMIDITY,
+        native_unit_of_measurement=PERCENTAGE,
+    ),
+)
+
+BINARY_SENSORS: tuple[SnmpBinarySensorEntityDescription, ...] = (
+    SnmpBinarySensorEntityDescription(
+        key="battery_failure",
+        value_oid=SNMP_OID_BATTERY_FAILURE,
+        name_prefix="Battery",
+        name_suffix="Failure",
+        attributes=ATTRIBUTES_BATTERY,
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SnmpBinarySensorEntityDescription(
+        key="battery_not_present",
+        value_oid=SNMP_OID_BATTERY_NOT_PRESENT,
+        name_prefix="Battery",
+        name_suffix="Not Present",
+        attributes=ATTRIBUTES_BATTERY,
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SnmpBinarySensorEntityDescription(
+        key="battery_aged",
+        value_oid=SNMP_OID_BATTERY_AGED,
+        name_prefix="Battery",
+        name_suffix="Aged",
+        attributes=ATTRIBUTES_BATTERY,
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SnmpBinarySensorEntityDescription(
+        key="battery_low_capacity",
+        value_oid=SNMP_OID_BATTERY_LOW_CAPACITY,
+        name_prefix="Battery",
+        name_suffix="Low Capacity",
+        attributes=ATTRIBUTES_BATTERY,
+        device_class=BinarySensorDeviceClass.BATTERY,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+DESCRIPTIONS: tuple[SnmpEntityDescriptionMixin, ...] = (*SENSORS, *BINARY_SENSORS)
+
+BUTTONS: tuple[SnmpButtonEntityDescription, ...] = (
+    SnmpButtonEntityDescription(
+        key="battery_test",
+        value_oid=SNMP_OID_BATTERY_TEST_STATUS,
+        name_prefix="Battery",
+        name_suffix="Test",
+        optional=True,
+        set_oid=SNMP_OID_BATTERY_TEST,
+        set_value=BatteryTest.start_test.value,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+SWITCHES: tuple[SnmpSwitchEntityDescription, ...] = (
+    SnmpSwitchEntityDescription(
+        key="receptacle",
+        value_oid=SNMP_OID_RECEPTACLE_STATUS,
+        name_prefix="Receptacle {index}",
+        name_suffix="Power",
+        count_oid=SNMP_OID_RECEPTACLES,
+        on_oid=SNMP_OID_RECEPTACLE_ON_DELAY,
+        off_oid=SNMP_OID_RECEPTACLE_OFF_DELAY,
+        on_values=(ReceptacleStatus.on.value, ReceptacleStatus.pending_off.value),
+        device_class=SwitchDeviceClass.OUTLET,
+        entity_registry_enabled_default=False,
+    ),
+)
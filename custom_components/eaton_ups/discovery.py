@@ -0,0 +1,148 @@
+"""Subnet discovery of Eaton UPS network cards."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass
+from ipaddress import IPv4Network, IPv6Network
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from pysnmp.error import PySnmpError
+
+from .api import IDENTITY_OIDS, SnmpApi, detect_profile, get_serial_number
+from .const import (
+    ATTR_HOST,
+    SCAN_MAX_IN_FLIGHT,
+    SCAN_TIME_BUDGET,
+    SCAN_TIMEOUT_MAX,
+    SCAN_TIMEOUT_MIN,
+    SNMP_OID_IDENT_OBJECT_ID,
+    SNMP_OID_IDENT_PRODUCT_NAME,
+    SNMP_OID_IDENT_PRODUCT_NAME_XUPS,
+    SNMP_OID_IDENT_SYSTEM_NAME,
+    MibProfile,
+)
+
+if TYPE_CHECKING:
+    from pysnmp.hlapi.asyncio import SnmpEngine
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class DiscoveredAgent:
+    """UPS agent found by a subnet scan."""
+
+    host: str
+    identity: dict[str, Any]
+    profile: MibProfile
+
+    @property
+    def name(self) -> str:
+        """Return a display name for the agent."""
+        return str(
+            self.identity.get(
+                SNMP_OID_IDENT_PRODUCT_NAME,
+                self.identity.get(SNMP_OID_IDENT_PRODUCT_NAME_XUPS, self.host),
+            )
+        )
+
+    @property
+    def serial_number(self) -> str | None:
+        """Return the serial number reported by the agent."""
+        return get_serial_number(self.identity)
+
+
+class SubnetScanner:
+    """Sweep a network range for UPS agents with bounded concurrency."""
+
+    def __init__(
+        self,
+        snmpEngine: SnmpEngine,
+        data: Mapping[str, Any],
+        max_in_flight: int = SCAN_MAX_IN_FLIGHT,
+        budget: float = SCAN_TIME_BUDGET,
+    ) -> None:
+        """Init the SubnetScanner."""
+        self._snmpEngine = snmpEngine
+        self._data = data
+        self._max_in_flight = max_in_flight
+        self._budget = budget
+        self._srtt: float | None = None
+        self._rttvar = 0.0
+
+    @property
+    def timeout(self) -> float:
+        """Return the request timeout derived from the observed round trips."""
+        if self._srtt is None:
+            return SCAN_TIMEOUT_MAX
+        return min(
+            SCAN_TIMEOUT_MAX, max(SCAN_TIMEOUT_MIN, self._srtt + 4 * self._rttvar)
+        )
+
+    def _observe(self, rtt: float) -> None:
+        """Update the smoothed round trip time (RFC 6298)."""
+        if self._srtt is None:
+            self._srtt = rtt
+            self._rttvar = rtt / 2
+        else:
+            self._rttvar = 0.75 * self._rttvar + 0.25 * abs(self._srtt - rtt)
+            self._srtt = 0.875 * self._srtt + 0.125 * rtt
+
+    async def async_scan(
+        self, network: IPv4Network | IPv6Network
+    ) -> list[DiscoveredAgent]:
+        """Scan all hosts of the network and return the UPS agents found."""
+        hosts = iter(network.hosts())
+        found: list[DiscoveredAgent] = []
+
+        async def worker() -> None:
+            for host in hosts:
+                agent = await self._async_probe_host(str(host))
+                if agent is not None:
+                    found.append(agent)
+
+        start = time.monotonic()
+        try:
+            async with asyncio.timeout(self._budget):
+                await asyncio.gather(*(worker() for _ in range(self._max_in_flight)))
+        except TimeoutError:
+            _LOGGER.warning(
+                "Scan of %s stopped after %d seconds", network, self._budget
+            )
+
+        _LOGGER.debug(
+            "Scan of %s found %d agent(s) in %.1f seconds",
+            network,
+            len(found),
+            time.monotonic() - start,
+        )
+        return found
+
+    async def _async_probe_host(self, host: str) -> DiscoveredAgent | None:
+        """Probe a single host and return the agent if it is a UPS."""
+        api = SnmpApi(self._snmpEngine)
+        try:
+            await api.configure({**self._data, ATTR_HOST: host}, self.timeout, 0)
+
+            start = time.monotonic()
+            system = await api.get(
+                [SNMP_OID_IDENT_OBJECT_ID, SNMP_OID_IDENT_SYSTEM_NAME]
+            )
+            self._observe(time.monotonic() - start)
+            if not system:
+                return None
+
+            identity = await api.get(list(IDENTITY_OIDS))
+        except PySnmpError, RuntimeError:
+            return None
+
+        profile = detect_profile(identity)
+        if profile is None:
+            _LOGGER.debug("Ignore non UPS agent %s: %s", host, system)
+            return None
+
+        return DiscoveredAgent(host, identity, profile)
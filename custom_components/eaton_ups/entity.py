@@ -2,91 +2,92 @@
 
 from __future__ import annotations
 
-from homeassistant.const import ATTR_BATTERY_LEVEL
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import (
-    ATTR_HOST,
-    DOMAIN,
-    MANUFACTURER,
-    SNMP_OID_BATTERY_CAPACITY,
-    SNMP_OID_IDENT_FIRMWARE_VERSION,
-    SNMP_OID_IDENT_FIRMWARE_VERSION_XUPS,
-    SNMP_OID_IDENT_PART_NUMBER,
-    SNMP_OID_IDENT_PRODUCT_NAME,
-    SNMP_OID_IDENT_PRODUCT_NAME_XUPS,
-    SNMP_OID_IDENT_SERIAL_NUMBER,
-    SNMP_OID_IDENT_SERIAL_NUMBER_XUPS,
-    SNMP_OID_IDENT_SYSTEM_NAME,
-)
+from .const import DOMAIN
 from .coordinator import SnmpCoordinator
+from .descriptions import SnmpEntityDescriptionMixin
+
+
+@callback
+def async_add_described_entities(
+    entry: ConfigEntry,
+    descriptions: tuple[SnmpEntityDescriptionMixin, ...],
+    entity_class: type[SnmpEntity],
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Add the entities of the descriptions, and of rows appearing later."""
+    coordinator: SnmpCoordinator = entry.runtime_data
+    added: set[str] = set()
+
+    @callback
+    def async_add_new_entities() -> None:
+        """Add the entities of rows and probes that appeared since the last update."""
+        entities = []
+        for description in descriptions:
+            for index in coordinator.indexes(description):
+                value_oid = description.value_oid.replace("index", index)
+                if value_oid not in added:
+                    added.add(value_oid)
+                    entities.append(entity_class(coordinator, description, index))
+        if entities:
+            async_add_entities(entities)
+
+    async_add_new_entities()
+    entry.async_on_unload(coordinator.async_add_listener(async_add_new_entities))
 
 
 class SnmpEntity(CoordinatorEntity[SnmpCoordinator]):
     """Base class for Eaton UPS entities."""
 
-    _name_oid: str | None = None
-    _value_oid: str | None = None
-
-    _name_prefix: str = ""
-    _name_suffix: str = ""
+    entity_description: SnmpEntityDescriptionMixin
 
-    def __init__(self, coordinator: SnmpCoordinator, index: str = "") -> None:
+    def __init__(
+        self,
+        coordinator: SnmpCoordinator,
+        description: SnmpEntityDescriptionMixin,
+        index: str = "",
+    ) -> None:
         """Initialize a Eaton UPS entity."""
         super().__init__(coordinator)
+        self.entity_description = description
 
-        device_name = self.device_info["name"]
-        if self._name_oid is not None and index != "":
-            self._name_oid = self._name_oid.replace("index", str(index))
-            sensor_name = self.coordinator.data.get(self._name_oid)
+        self._name_prefix = description.name_prefix.format(index=index)
+        self._name_suffix = description.name_suffix
+        self._attr_device_info = coordinator.identity.device_info
+        device_name = coordinator.identity.name
+        if description.name_oid is not None and index != "":
+            sensor_name = self.coordinator.data.get(
+                description.name_oid.replace("index", index)
+            )
             self._attr_name = (
                 f"{device_name} {self._name_prefix} {sensor_name} {self._name_suffix}"
             )
         else:
             self._attr_name = f"{device_name} {self._name_prefix} {self._name_suffix}"
 
-        self._value_oid = self._value_oid.replace("index", str(index))
+        self._indexed = index != ""
+        self._value_oid = description.value_oid.replace("index", index)
         self._attr_unique_id = f"{DOMAIN}_{self.identifier}_{self._value_oid}"
 
     @property
-    def identifier(self):
-        """Return the device identifier."""
-        return self.coordinator.data.get(
-            SNMP_OID_IDENT_SERIAL_NUMBER,
-            self.coordinator.data.get(
-                SNMP_OID_IDENT_SERIAL_NUMBER_XUPS,
-                self.coordinator.config_entry.data.get(ATTR_HOST),
-            ),
-        )
+    def available(self) -> bool:
+        """Return if the value of the entity is available and recent."""
+        if self._indexed and self._value_oid not in self.coordinator.data:
+            return False
+        return super().available and not self.coordinator.is_stale(self._value_oid)
 
     @property
-    def device_info(self):
-        """Return the device_info of the device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.identifier)},
-            manufacturer=MANUFACTURER,
-            model=self.coordinator.data.get(SNMP_OID_IDENT_PART_NUMBER),
-            name=self.coordinator.data.get(
-                SNMP_OID_IDENT_SYSTEM_NAME,
-                self.coordinator.data.get(
-                    SNMP_OID_IDENT_PRODUCT_NAME,
-                    self.coordinator.data.get(SNMP_OID_IDENT_PRODUCT_NAME_XUPS),
-                ),
-            ),
-            serial_number=self.coordinator.data.get(
-                SNMP_OID_IDENT_SERIAL_NUMBER,
-                self.coordinator.data.get(SNMP_OID_IDENT_SERIAL_NUMBER_XUPS),
-            ),
-            sw_version=self.coordinator.data.get(
-                SNMP_OID_IDENT_FIRMWARE_VERSION,
-                self.coordinator.data.get(SNMP_OID_IDENT_FIRMWARE_VERSION_XUPS),
-            ),
-        )
+    def identifier(self):
+        """Return the device identifier."""
+        return self.coordinator.identity.identifier
 
     @property
     def extra_state_attributes(self):
-        """Return the state attributes."""
-        return {
-            ATTR_BATTERY_LEVEL: self.coordinator.data.get(SNMP_OID_BATTERY_CAPACITY)
-        }
+        """Return the state attributes shared with other entities."""
+        if self.entity_description.attributes is None:
+            return None
+        return self.coordinator.attributes[self.entity_description.attributes]
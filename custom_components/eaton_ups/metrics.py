@@ -0,0 +1,212 @@
+"""OpenMetrics endpoint rendering the Eaton UPS coordinator snapshots."""
+
+from __future__ import annotations
+
+import time
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.http import KEY_HASS
+
+from .const import (
+    ATTR_METRICS,
+    DATA_METRICS,
+    DOMAIN,
+    METRICS_URL,
+    SNMP_OID_INPUT_NUM_PHASES,
+    SNMP_OID_OUTPUT_NUM_PHASES,
+    SNMP_OID_RECEPTACLES,
+    SNMP_STALE_AFTER,
+)
+from .coordinator import SnmpCoordinator
+from .descriptions import DESCRIPTIONS
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+INDEX_LABELS = {
+    SNMP_OID_INPUT_NUM_PHASES: "phase",
+    SNMP_OID_OUTPUT_NUM_PHASES: "phase",
+    SNMP_OID_RECEPTACLES: "receptacle",
+}
+
+VALUE_DESCRIPTIONS = [
+    description for description in DESCRIPTIONS if description.converter is None
+]
+
+SNAPSHOT_FAMILIES = {
+    **{
+        f"{DOMAIN}_{description.key}": (
+            "gauge",
+            " ".join(
+                part.format(index="").strip()
+                for part in (description.name_prefix, description.name_suffix)
+                if part.format(index="").strip()
+            ),
+        )
+        for description in VALUE_DESCRIPTIONS
+    },
+    f"{DOMAIN}_poll_duration_seconds": ("gauge", "Duration of the last poll"),
+}
+
+# The group state also changes while polls fail, it is rendered on every scrape.
+GROUP_FAMILIES = {
+    f"{DOMAIN}_group_last_success_timestamp_seconds": (
+        "gauge",
+        "Time of the last successful request of a group",
+    ),
+    f"{DOMAIN}_group_failures": ("gauge", "Consecutive failures of a group"),
+    f"{DOMAIN}_group_stale": ("gauge", "Whether the values of a group are stale"),
+}
+
+
+def escape(value: object) -> str:
+    """Escape a label value."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def labels(**values: object) -> str:
+    """Return the label set of a sample."""
+    return (
+        "{"
+        + ",".join(f'{key}="{escape(value)}"' for key, value in values.items())
+        + "}"
+    )
+
+
+def device_labels(coordinator: SnmpCoordinator) -> dict[str, object]:
+    """Return the labels identifying the device of a coordinator."""
+    identity = coordinator.identity
+    return {"device": identity.identifier, "name": identity.name}
+
+
+def render_samples(coordinator: SnmpCoordinator) -> dict[str, list[str]]:
+    """Render the samples of one coordinator snapshot by metric family."""
+    device = device_labels(coordinator)
+    samples: dict[str, list[str]] = {family: [] for family in SNAPSHOT_FAMILIES}
+
+    for description in VALUE_DESCRIPTIONS:
+        family = samples[f"{DOMAIN}_{description.key}"]
+        label = "probe" if description.discovered else "index"
+        label = INDEX_LABELS.get(description.count_oid, label)
+        for index in coordinator.indexes(description):
+            oid = description.value_oid.replace("index", index)
+            value = coordinator.values.get(oid)
+            # Derived values are computed by the coordinator, not polled.
+            if not description.derived and oid not in coordinator.data:
+                continue
+            if not isinstance(value, int | float):
+                continue
+            row = {label: index} if index else {}
+            family.append(f"{labels(**device, **row)} {float(value)}")
+
+    if coordinator.poll_duration is not None:
+        samples[f"{DOMAIN}_poll_duration_seconds"].append(
+            f"{labels(**device)} {coordinator.poll_duration}"
+        )
+
+    return samples
+
+
+def render_group_samples(coordinator: SnmpCoordinator) -> dict[str, list[str]]:
+    """Render the samples of the request groups of one coordinator."""
+    device = device_labels(coordinator)
+    samples: dict[str, list[str]] = {family: [] for family in GROUP_FAMILIES}
+    now = time.monotonic()
+    wall = time.time()
+    for group in coordinator.groups.values():
+        group_labels = labels(**device, group=group.name)
+        age = group.age(now)
+        if age is not None:
+            samples[f"{DOMAIN}_group_last_success_timestamp_seconds"].append(
+                f"{group_labels} {wall - age}"
+            )
+        samples[f"{DOMAIN}_group_failures"].append(f"{group_labels} {group.failures}")
+        stale = age is not None and age > SNMP_STALE_AFTER
+        samples[f"{DOMAIN}_group_stale"].append(f"{group_labels} {int(stale)}")
+
+    return samples
+
+
+class SnmpMetricsView(HomeAssistantView):
+    """Serve the coordinator snapshots in the OpenMetrics format.
+
+    Value samples are rendered once per coordinator snapshot, and their part
+    of the response only when a snapshot changed, so scrapes never reach the
+    UPS. The group samples age between polls and are rendered every time.
+    """
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+    requires_auth = True
+
+    def __init__(self) -> None:
+        """Initialize the view."""
+        self._samples: dict[str, tuple[int, dict[str, list[str]]]] = {}
+        self._body: tuple[tuple, str] | None = None
+
+    def render(self, coordinators: dict[str, SnmpCoordinator]) -> bytes:
+        """Return the response body for the snapshots of the coordinators."""
+        versions = tuple(
+            (entry_id, coordinator.version)
+            for entry_id, coordinator in coordinators.items()
+        )
+        if self._body is None or self._body[0] != versions:
+            self._body = (versions, self._render_snapshots(coordinators))
+
+        lines = [self._body[1]]
+        group_samples = [
+            render_group_samples(coordinator) for coordinator in coordinators.values()
+        ]
+        for family, (metric_type, help_text) in GROUP_FAMILIES.items():
+            lines.append(f"# TYPE {family} {metric_type}")
+            lines.append(f"# HELP {family} {help_text}")
+            for samples in group_samples:
+                lines.extend(f"{family}{sample}" for sample in samples[family])
+        lines.append("# EOF\n")
+        return "\n".join(lines).encode()
+
+    def _render_snapshots(self, coordinators: dict[str, SnmpCoordinator]) -> str:
+        """Return the value families for the snapshots of the coordinators."""
+        for entry_id, coordinator in coordinators.items():
+            cached = self._samples.get(entry_id)
+            if cached is None or cached[0] != coordinator.version:
+                self._samples[entry_id] = (
+                    coordinator.version,
+                    render_samples(coordinator),
+                )
+        for entry_id in set(self._samples) - set(coordinators):
+            del self._samples[entry_id]
+
+        lines = []
+        for family, (metric_type, help_text) in SNAPSHOT_FAMILIES.items():
+            lines.append(f"# TYPE {family} {metric_type}")
+            lines.append(f"# HELP {family} {help_text}")
+            for entry_id in coordinators:
+                lines.extend(
+                    f"{family}{sample}" for sample in self._samples[entry_id][1][family]
+                )
+        return "\n".join(lines)
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the metrics of all entries with the endpoint enabled."""
+        hass: HomeAssistant = request.app[KEY_HASS]
+        coordinators = {
+            entry.entry_id: entry.runtime_data
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.state is ConfigEntryState.LOADED
+            and entry.options.get(ATTR_METRICS)
+        }
+        return web.Response(
+            body=self.render(coordinators), headers={"Content-Type": CONTENT_TYPE}
+        )
+
+
+@callback
+def async_register_metrics_view(hass: HomeAssistant) -> None:
+    """Register the metrics view once."""
+    if DATA_METRICS not in hass.data:
+        hass.data[DATA_METRICS] = SnmpMetricsView()
+        hass.http.register_view(hass.data[DATA_METRICS])
@@ -0,0 +1,334 @@
+"""Local SNMP responder answering from the Eaton UPS coordinator data."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_right
+from ipaddress import ip_address
+import logging
+import socket
+import time
+from typing import TYPE_CHECKING, Any
+
+from pysnmp.carrier.asyncio.dgram import udp, udp6
+from pysnmp.entity import config, engine
+from pysnmp.entity.rfc3413 import cmdrsp, context
+from pysnmp.proto import rfc1902, rfc1905
+from pysnmp.proto.api import v2c
+from pysnmp.smi import error as smi_error, instrum
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    ATTR_PROXY_ADDRESS,
+    ATTR_PROXY_COMMUNITY,
+    ATTR_PROXY_MAX_AGE,
+    ATTR_PROXY_PORT,
+    DOMAIN,
+    PROXY_ADDRESS_DEFAULT,
+    PROXY_COMMUNITY_DEFAULT,
+    PROXY_MAX_AGE_DEFAULT,
+    SNMP_OID_EATON_ENTERPRISE,
+    SNMP_OID_IDENT_OBJECT_ID,
+    SNMP_OID_SYSTEM_UPTIME,
+    SNMP_OID_UPS_MIB,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import SnmpCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# The types of polled values are lost when they are cast, restore the ones
+# clients rely on, all others are answered as Integer32 or OctetString.
+SYNTAX = {
+    SNMP_OID_SYSTEM_UPTIME: rfc1902.TimeTicks,
+    SNMP_OID_IDENT_OBJECT_ID: rfc1902.ObjectIdentifier,
+}
+
+# Subtrees of the OIDs that are fetched from the card when they were not polled.
+FETCH_PREFIXES = (f"{SNMP_OID_EATON_ENTERPRISE}.", f"{SNMP_OID_UPS_MIB}.")
+
+
+def encode(oid: str, value: Any) -> Any:
+    """Encode a polled value into an SNMP value."""
+    if value is None:
+        return rfc1905.noSuchInstance
+    if oid in SYNTAX:
+        return SYNTAX[oid](value)
+    if isinstance(value, int) and -(2**31) <= value < 2**31:
+        return rfc1902.Integer32(value)
+    return rfc1902.OctetString(str(value))
+
+
+class SnapshotMibInstrumController(instrum.AbstractMibInstrumController):
+    """Read the variables from the latest data of the coordinator.
+
+    GET requests also read the OIDs the responder fetched on a miss. The
+    OIDs of the data are sorted once per poll for GETNEXT and GETBULK
+    requests, which only walk the polled OIDs.
+    """
+
+    def __init__(self, responder: SnmpResponder) -> None:
+        """Initialize the controller."""
+        self._responder = responder
+        self._coordinator = responder.coordinator
+        self._version: int | None = None
+        self._names: dict[tuple[int, ...], str] = {}
+        self._oids: list[tuple[int, ...]] = []
+
+    def _index(self) -> None:
+        """Sort the OIDs of the data if it changed."""
+        if self._version == self._coordinator.version:
+            return
+        self._names = {}
+        for oid in self._coordinator.data:
+            try:
+                self._names[tuple(int(part) for part in oid.split("."))] = oid
+            except ValueError:
+                continue
+        self._oids = sorted(self._names)
+        self._version = self._coordinator.version
+
+    def _value(self, name: tuple[int, ...]) -> Any:
+        """Return the SNMP value of an OID."""
+        oid = self._names.get(name)
+        if oid is None:
+            return rfc1905.noSuchInstance
+        return encode(oid, self._coordinator.data.get(oid))
+
+    def read_variables(self, *varBinds, **context):
+        """Read MIB variables."""
+        self._index()
+        fetched = self._responder.fetched
+        result = []
+        for name, _ in varBinds:
+            oid = str(name)
+            if tuple(name) not in self._names and oid in fetched:
+                result.append((name, encode(oid, fetched[oid][0])))
+            else:
+                result.append((name, self._value(tuple(name))))
+        return result
+
+    def read_next_variables(self, *varBinds, **context):
+        """Read next MIB variables."""
+        self._index()
+        result = []
+        for name, _ in varBinds:
+            position = bisect_right(self._oids, tuple(name))
+            if position == len(self._oids):
+                result.append((name, rfc1905.endOfMibView))
+            else:
+                next_name = self._oids[position]
+                result.append((rfc1902.ObjectName(next_name), self._value(next_name)))
+        return result
+
+
+class DeferredResponderMixin:
+    """Answer a request once data older than the max age was refreshed.
+
+    The state of a deferred request is kept past ``process_pdu`` until the
+    refresh finished and the response was sent.
+    """
+
+    cbCtx: SnmpResponder
+
+    def misses(self, PDU) -> set[str]:
+        """Return the requested OIDs to fetch from the card."""
+        return set()
+
+    def handle_management_operation(self, snmpEngine, stateReference, contextName, PDU):
+        """Handle the request now or after a refresh."""
+        responder = self.cbCtx
+        misses = self.misses(PDU)
+        if responder.fresh and not misses:
+            super().handle_management_operation(
+                snmpEngine, stateReference, contextName, PDU
+            )
+            return
+        responder.deferred.add(stateReference)
+        responder.coordinator.config_entry.async_create_background_task(
+            responder.hass,
+            self._async_answer(snmpEngine, stateReference, contextName, PDU, misses),
+            f"{DOMAIN} proxy request",
+        )
+
+    def release_state_information(self, stateReference):
+        """Release the state of a request unless it waits for a refresh."""
+        if stateReference not in self.cbCtx.deferred:
+            super().release_state_information(stateReference)
+
+    async def _async_answer(
+        self, snmpEngine, stateReference, contextName, PDU, misses: set[str]
+    ):
+        """Refresh the data, fetch the misses and answer the request."""
+        responder = self.cbCtx
+        if not responder.fresh:
+            await responder.coordinator.async_refresh_stale(responder.max_age)
+        if misses:
+            await responder.async_fetch(misses)
+        responder.deferred.discard(stateReference)
+        try:
+            super().handle_management_operation(
+                snmpEngine, stateReference, contextName, PDU
+            )
+        except smi_error.SmiError as err:
+            # Answer like process_pdu does for requests it handles directly.
+            _LOGGER.debug("Proxy request failed: %s", err)
+            try:
+                errorIndex = err["idx"] + 1
+            except KeyError:
+                errorIndex = 1
+            self.send_varbinds(
+                snmpEngine,
+                stateReference,
+                self.SMI_ERROR_MAP.get(err.__class__, "genErr"),
+                errorIndex,
+                v2c.apiPDU.get_varbinds(PDU),
+            )
+        except smi_error.PySnmpError as err:
+            _LOGGER.debug("Proxy request failed: %s", err)
+        self.release_state_information(stateReference)
+
+
+class SnapshotGetResponder(DeferredResponderMixin, cmdrsp.GetCommandResponder):
+    """Answer GET requests from the coordinator data."""
+
+    def misses(self, PDU) -> set[str]:
+        """Return the requested OIDs of the UPS MIBs that were not polled."""
+        responder = self.cbCtx
+        data = responder.coordinator.data
+        return {
+            oid
+            for oid in (str(name) for name, _ in v2c.apiPDU.get_varbinds(PDU))
+            if oid not in data
+            and oid.startswith(FETCH_PREFIXES)
+            and not responder.is_fetched(oid)
+        }
+
+
+class SnapshotNextResponder(DeferredResponderMixin, cmdrsp.NextCommandResponder):
+    """Answer GETNEXT requests from the coordinator data."""
+
+
+class SnapshotBulkResponder(DeferredResponderMixin, cmdrsp.BulkCommandResponder):
+    """Answer GETBULK requests from the coordinator data."""
+
+
+class SnmpResponder:
+    """Read-only SNMP v1 and v2c agent answering from the coordinator data.
+
+    Other tools polling the same card read the values Home Assistant
+    already polled. Data older than the max age is polled again before
+    answering, all requests waiting for it share one poll. OIDs of the UPS
+    MIBs that are not polled are fetched on a miss, the misses arriving
+    while a fetch runs share the next one.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator: SnmpCoordinator) -> None:
+        """Initialize the responder."""
+        options = coordinator.config_entry.options
+        self.hass = hass
+        self.coordinator = coordinator
+        self.max_age = options.get(ATTR_PROXY_MAX_AGE, PROXY_MAX_AGE_DEFAULT)
+        self.deferred: set[int] = set()
+        self.fetched: dict[str, tuple[Any, float]] = {}
+        self._misses: set[str] = set()
+        self._fetch: asyncio.Task[None] | None = None
+        self._address = options.get(ATTR_PROXY_ADDRESS, PROXY_ADDRESS_DEFAULT)
+        self._port = options[ATTR_PROXY_PORT]
+        self._community = options.get(ATTR_PROXY_COMMUNITY, PROXY_COMMUNITY_DEFAULT)
+        self._snmpEngine: engine.SnmpEngine | None = None
+
+    @property
+    def fresh(self) -> bool:
+        """Return if the data is recent enough to answer from."""
+        polled_at = self.coordinator.polled_at
+        return polled_at is not None and time.monotonic() - polled_at <= self.max_age
+
+    def is_fetched(self, oid: str) -> bool:
+        """Return if an OID was fetched within the max age."""
+        fetched = self.fetched.get(oid)
+        return fetched is not None and time.monotonic() - fetched[1] <= self.max_age
+
+    async def async_fetch(self, oids: set[str]) -> None:
+        """Fetch OIDs that were not polled from the card."""
+        self._misses.update(oids)
+        # The task starts eagerly and may already be done when it is returned.
+        if self._fetch is None or self._fetch.done():
+            self._fetch = self.hass.async_create_task(self._async_fetch())
+        await asyncio.shield(self._fetch)
+
+    async def _async_fetch(self) -> None:
+        """Fetch the misses until no more arrive.
+
+        OIDs the card does not have are remembered as missing for the max age
+        as well, so they are not requested again by every client.
+        """
+        while self._misses:
+            oids = {oid for oid in self._misses if not self.is_fetched(oid)}
+            self._misses = set()
+            if not oids:
+                continue
+            try:
+                data = await self.coordinator.async_get(sorted(oids))
+            except RuntimeError as err:
+                _LOGGER.debug("Proxy fetch of %s failed: %s", oids, err)
+                continue
+            now = time.monotonic()
+            self.fetched = {
+                oid: fetched
+                for oid, fetched in self.fetched.items()
+                if now - fetched[1] <= self.max_age
+            }
+            for oid in oids:
+                self.fetched[oid] = (data.get(oid), now)
+
+    def _create_engine(self) -> engine.SnmpEngine:
+        """Create the engine, which loads its MIBs from disk."""
+        snmpEngine = engine.SnmpEngine()
+        config.add_v1_system(snmpEngine, f"{DOMAIN}-proxy", self._community)
+        return snmpEngine
+
+    async def async_start(self) -> None:
+        """Start answering on the configured address and port."""
+        ipv6 = ip_address(self._address).version == 6
+        sock = socket.socket(
+            socket.AF_INET6 if ipv6 else socket.AF_INET, socket.SOCK_DGRAM
+        )
+        try:
+            sock.bind((self._address, self._port))
+        except OSError as err:
+            sock.close()
+            _LOGGER.error(
+                "SNMP proxy can not listen on %s port %d: %s",
+                self._address,
+                self._port,
+                err,
+            )
+            return
+
+        snmpEngine = await self.hass.async_add_executor_job(self._create_engine)
+        transport = udp6.Udp6AsyncioTransport if ipv6 else udp.UdpAsyncioTransport
+        config.add_transport(
+            snmpEngine,
+            udp6.DOMAIN_NAME if ipv6 else udp.DOMAIN_NAME,
+            transport(loop=self.hass.loop).open_server_mode(sock=sock),
+        )
+        snmpContext = context.SnmpContext(snmpEngine)
+        snmpContext.unregister_context_name(b"")
+        snmpContext.register_context_name(b"", SnapshotMibInstrumController(self))
+        for responder in (
+            SnapshotGetResponder,
+            SnapshotNextResponder,
+            SnapshotBulkResponder,
+        ):
+            responder(snmpEngine, snmpContext, self)
+        self._snmpEngine = snmpEngine
+        _LOGGER.debug("SNMP proxy listening on %s port %d", self._address, self._port)
+
+    def close(self) -> None:
+        """Stop answering."""
+        if self._snmpEngine is not None:
+            self._snmpEngine.close_dispatcher()
+            self._snmpEngine = None
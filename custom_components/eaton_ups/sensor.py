@@ -2,58 +2,25 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+from datetime import timedelta
+import time
 
-from homeassistant.components.sensor import (
-    SensorDeviceClass,
-    SensorEntity,
-    SensorStateClass,
-)
+from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    PERCENTAGE,
-    EntityCategory,
-    UnitOfElectricCurrent,
-    UnitOfElectricPotential,
-    UnitOfPower,
-    UnitOfTime,
-)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util.dt import get_time_zone
 
 from .const import (
-    SNMP_OID_BATTERY_ABM_STATUS,
-    SNMP_OID_BATTERY_CAPACITY,
-    SNMP_OID_BATTERY_CURRENT,
-    SNMP_OID_BATTERY_LAST_REPLACED,
-    SNMP_OID_BATTERY_REMAINING,
-    SNMP_OID_BATTERY_TEST_STATUS,
-    SNMP_OID_BATTERY_VOLTAGE,
-    SNMP_OID_INPUT_CURRENT,
-    SNMP_OID_INPUT_NAME,
-    SNMP_OID_INPUT_NUM_PHASES,
-    SNMP_OID_INPUT_SOURCE,
-    SNMP_OID_INPUT_STATUS,
-    SNMP_OID_INPUT_VOLTAGE,
-    SNMP_OID_INPUT_WATTS,
-    SNMP_OID_OUTPUT_CURRENT,
-    SNMP_OID_OUTPUT_LOAD,
-    SNMP_OID_OUTPUT_NAME,
-    SNMP_OID_OUTPUT_NUM_PHASES,
-    SNMP_OID_OUTPUT_SOURCE,
-    SNMP_OID_OUTPUT_STATUS,
-    SNMP_OID_OUTPUT_VOLTAGE,
-    SNMP_OID_OUTPUT_WATTS,
-    AbmStatus,
-    BatteryTestStatus,
-    InputSource,
-    InputStatus,
-    OutputSource,
-    OutputStatus,
+    ATTR_DEADBAND,
+    ATTR_DEADBAND_MODE,
+    ATTR_MAX_SILENCE,
+    DEADBAND_DEFAULT,
+    MAX_SILENCE_DEFAULT,
+    DeadbandMode,
 )
 from .coordinator import SnmpCoordinator
-from .entity import SnmpEntity
+from .descriptions import SENSORS, SnmpSensorEntityDescription
+from .entity import SnmpEntity, async_add_described_entities
 
 PARALLEL_UPDATES = 0
 SCAN_INTERVAL = timedelta(seconds=60)
@@ -63,297 +30,75 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the sensors."""
-
-    coordinator = entry.runtime_data
-    entities: list[SensorEntity] = [
-        SnmpBatteryVoltageSensorEntity(coordinator),
-        # SnmpBatteryCurrentSensorEntity(coordinator),
-        SnmpBatteryCapacitySensorEntity(coordinator),
-        SnmpBatteryAbmStatusSensorEntity(coordinator),
-        SnmpBatteryLastReplacedSensorEntity(coordinator),
-        SnmpBatteryRemainingSensorEntity(coordinator),
-        SnmpBatteryTestStatusSensorEntity(coordinator),
-        SnmpInputSourceSensorEntity(coordinator),
-        SnmpInputStatusSensorEntity(coordinator),
-        SnmpOutputSourceSensorEntity(coordinator),
-        SnmpOutputStatusSensorEntity(coordinator),
-    ]
-
-    for index in range(
-        1,
-        coordinator.data.get(SNMP_OID_INPUT_NUM_PHASES, 0) + 1,
-    ):
-        entities.append(SnmpInputVoltageSensorEntity(coordinator, index))
-        # entities.append(SnmpInputCurrentSensorEntity(coordinator, index))
-        # entities.append(SnmpInputWattsSensorEntity(coordinator, index))
-
-    for index in range(
-        1,
-        coordinator.data.get(SNMP_OID_OUTPUT_NUM_PHASES, 0) + 1,
-    ):
-        entities.append(SnmpOutputVoltageSensorEntity(coordinator, index))
-        entities.append(SnmpOutputCurrentSensorEntity(coordinator, index))
-        entities.append(SnmpOutputWattsSensorEntity(coordinator, index))
-        entities.append(SnmpOutputLoadSensorEntity(coordinator, index))
-
-    async_add_entities(entities)
+    async_add_described_entities(entry, SENSORS, SnmpSensorEntity, async_add_entities)
 
 
 class SnmpSensorEntity(SnmpEntity, SensorEntity):
     """Representation of a Eaton UPS sensor."""
 
-    _attr_state_class = SensorStateClass.MEASUREMENT
+    entity_description: SnmpSensorEntityDescription
 
-    _multiplier: float | None = None
-
-    _default_value: float = 0.0
-
-    def __init__(self, coordinator: SnmpCoordinator, index: str = "") -> None:
+    def __init__(
+        self,
+        coordinator: SnmpCoordinator,
+        description: SnmpSensorEntityDescription,
+        index: str = "",
+    ) -> None:
         """Initialize a Eaton UPS sensor."""
-        super().__init__(coordinator, index)
-        self._attr_native_value = self.coordinator.data.get(
-            self._value_oid, self._default_value
-        )
-        if self._multiplier is not None:
-            self._attr_native_value *= self._multiplier
+        super().__init__(coordinator, description, index)
+        self._attr_native_value = self.coordinator.values.get(self._value_oid)
+
+        options = self.coordinator.config_entry.options
+        self._deadband = 0.0
+        self._max_silence = 0
+        if description.sensor_class is not None:
+            self._deadband = options.get(
+                f"{description.sensor_class}_{ATTR_DEADBAND}", DEADBAND_DEFAULT
+            )
+            self._max_silence = options.get(
+                f"{description.sensor_class}_{ATTR_MAX_SILENCE}", MAX_SILENCE_DEFAULT
+            )
+        self._deadband_percent = options.get(ATTR_DEADBAND_MODE) == DeadbandMode.PERCENT
+        self._written_at: float | None = None
+        self._written_available: bool | None = None
+
+    def _is_significant(self, value, available: bool) -> bool:
+        """Return if a new value differs enough from the written one to record.
+
+        Values inside the deadband are dropped until the max silence has
+        passed since the last write. Availability changes always count.
+        """
+        if not self._deadband or self._written_at is None:
+            return True
+        if available != self._written_available:
+            return True
+        if time.monotonic() - self._written_at >= self._max_silence:
+            return True
+        previous = self._attr_native_value
+        if not isinstance(value, int | float) or not isinstance(previous, int | float):
+            return value != previous
+        threshold = self._deadband
+        if self._deadband_percent:
+            threshold = abs(previous) * self._deadband / 100
+        return abs(value - previous) > threshold
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._attr_native_value = self.coordinator.data.get(
-            self._value_oid, self._default_value
-        )
-        if self._multiplier is not None:
-            self._attr_native_value *= self._multiplier
+        available = self.available
+        if (
+            self.entity_description.changed_only
+            and self._value_oid not in self.coordinator.changed_oids
+            and available == self._written_available
+        ):
+            return
+
+        value = self.coordinator.values.get(self._value_oid)
+        if not self._is_significant(value, available):
+            return
+
+        self._attr_native_value = value
+        self._written_at = time.monotonic()
+        self._written_available = available
 
         super().async_write_ha_state()
-
-
-class SnmpBatterySensorEntity(SnmpSensorEntity):
-    """Representation of a Eaton UPS battery sensor."""
-
-    _name_prefix = "Battery"
-
-
-class SnmpBatteryVoltageSensorEntity(SnmpBatterySensorEntity):
-    """Representation of a Eaton UPS battery voltage sensor."""
-
-    _attr_device_class = SensorDeviceClass.VOLTAGE
-    _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
-
-    _name_suffix = "Voltage"
-    _value_oid = SNMP_OID_BATTERY_VOLTAGE
-
-
-class SnmpBatteryCurrentSensorEntity(SnmpBatterySensorEntity):
-    """Representation of a Eaton UPS battery current sensor."""
-
-    _attr_device_class = SensorDeviceClass.CURRENT
-    _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
-
-    _name_suffix = "Current"
-    _value_oid = SNMP_OID_BATTERY_CURRENT
-
-
-class SnmpBatteryCapacitySensorEntity(SnmpBatterySensorEntity):
-    """Representation of a Eaton UPS battery watts sensor."""
-
-    _attr_device_class = SensorDeviceClass.BATTERY
-    _attr_native_unit_of_measurement = PERCENTAGE
-
-    _name_suffix = "Capacity"
-    _value_oid = SNMP_OID_BATTERY_CAPACITY
-
-
-class SnmpBatteryAbmStatusSensorEntity(SnmpBatterySensorEntity):
-    """Representation of a Eaton UPS battery abm status sensor."""
-
-    _attr_device_class = SensorDeviceClass.ENUM
-    _attr_state_class = None
-    _attr_translation_key = "abm_status"
-    _attr_options = [abm_status.value for abm_status in AbmStatus]
-
-    _name_suffix = "ABM Status"
-    _value_oid = SNMP_OID_BATTERY_ABM_STATUS
-
-
-class SnmpBatteryLastReplacedSensorEntity(SnmpBatterySensorEntity):
-    """Representation of a Eaton UPS battery last replaced sensor."""
-
-    _attr_device_class = SensorDeviceClass.DATE
-    _attr_state_class = None
-
-    _name_suffix = "Last Replaced"
-    _value_oid = SNMP_OID_BATTERY_LAST_REPLACED
-
-    @property
-    def native_value(self) -> date | None:
-        """Return the value reported by the sensor."""
-        try:
-            return (
-                datetime.strptime(self._attr_native_value, "%m/%d/%Y")
-                .replace(tzinfo=get_time_zone(self.coordinator.hass.config.time_zone))
-                .date()
-            )
-        except ValueError:
-            return None
-
-
-class SnmpBatteryRemainingSensorEntity(SnmpBatterySensorEntity):
-    """Representation of a Eaton UPS battery last replaced sensor."""
-
-    _attr_device_class = SensorDeviceClass.DURATION
-    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
-
-    _name_suffix = "Remaining"
-    _value_oid = SNMP_OID_BATTERY_REMAINING
-
-
-class SnmpBatteryTestStatusSensorEntity(SnmpBatterySensorEntity):
-    """Representation of a Eaton UPS battery test status sensor."""
-
-    _attr_device_class = SensorDeviceClass.ENUM
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_state_class = None
-    _attr_translation_key = "battery_test_status"
-    _attr_options = [
-        battery_test_status.value for battery_test_status in BatteryTestStatus
-    ]
-
-    _name_suffix = "Test Status"
-    _value_oid = SNMP_OID_BATTERY_TEST_STATUS
-
-
-class SnmpInputSensorEntity(SnmpSensorEntity):
-    """Representation of a Eaton UPS input sensor."""
-
-    _name_oid = SNMP_OID_INPUT_NAME
-    _name_prefix = "Input"
-
-
-class SnmpInputVoltageSensorEntity(SnmpInputSensorEntity):
-    """Representation of a Eaton UPS input voltage sensor."""
-
-    _attr_device_class = SensorDeviceClass.VOLTAGE
-    _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
-    _attr_entity_registry_visible_default = False
-
-    _name_suffix = "Voltage"
-    _value_oid = SNMP_OID_INPUT_VOLTAGE
-
-
-class SnmpInputCurrentSensorEntity(SnmpInputSensorEntity):
-    """Representation of a Eaton UPS input current sensor."""
-
-    _attr_device_class = SensorDeviceClass.CURRENT
-    _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
-    _attr_entity_registry_visible_default = False
-
-    _name_suffix = "Current"
-    _value_oid = SNMP_OID_INPUT_CURRENT
-
-
-class SnmpInputWattsSensorEntity(SnmpInputSensorEntity):
-    """Representation of a Eaton UPS input watts sensor."""
-
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_native_unit_of_measurement = UnitOfPower.WATT
-
-    _name_suffix = "Watts"
-    _value_oid = SNMP_OID_INPUT_WATTS
-
-
-class SnmpInputSourceSensorEntity(SnmpInputSensorEntity):
-    """Representation of a Eaton UPS input source sensor."""
-
-    _attr_device_class = SensorDeviceClass.ENUM
-    _attr_state_class = None
-    _attr_translation_key = "input_source"
-    _attr_options = [input_source.value for input_source in InputSource]
-
-    _name_suffix = "Source"
-    _value_oid = SNMP_OID_INPUT_SOURCE
-
-
-class SnmpInputStatusSensorEntity(SnmpInputSensorEntity):
-    """Representation of a Eaton UPS input status sensor."""
-
-    _attr_device_class = SensorDeviceClass.ENUM
-    _attr_state_class = None
-    _attr_translation_key = "input_status"
-    _attr_options = [input_status.value for input_status in InputStatus]
-
-    _name_suffix = "Status"
-    _value_oid = SNMP_OID_INPUT_STATUS
-
-
-class SnmpOutputSensorEntity(SnmpSensorEntity):
-    """Representation of a Eaton UPS output sensor."""
-
-    _name_oid = SNMP_OID_OUTPUT_NAME
-    _name_prefix = "Output"
-
-
-class SnmpOutputVoltageSensorEntity(SnmpOutputSensorEntity):
-    """Representation of a Eaton UPS output voltage sensor."""
-
-    _attr_device_class = SensorDeviceClass.VOLTAGE
-    _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
-    _attr_entity_registry_visible_default = False
-
-    _name_suffix = "Voltage"
-    _value_oid = SNMP_OID_OUTPUT_VOLTAGE
-
-
-class SnmpOutputCurrentSensorEntity(SnmpOutputSensorEntity):
-    """Representation of a Eaton UPS output current sensor."""
-
-    _attr_device_class = SensorDeviceClass.CURRENT
-    _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
-    _attr_entity_registry_visible_default = False
-
-    _name_suffix = "Current"
-    _value_oid = SNMP_OID_OUTPUT_CURRENT
-
-
-class SnmpOutputWattsSensorEntity(SnmpOutputSensorEntity):
-    """Representation of a Eaton UPS output watts sensor."""
-
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_native_unit_of_measurement = UnitOfPower.WATT
-
-    _name_suffix = "Watts"
-    _value_oid = SNMP_OID_OUTPUT_WATTS
-
-
-class SnmpOutputLoadSensorEntity(SnmpOutputSensorEntity):
-    """Representation of a Eaton UPS output watts sensor."""
-
-    _attr_native_unit_of_measurement = PERCENTAGE
-
-    _name_suffix = "Load"
-    _value_oid = SNMP_OID_OUTPUT_LOAD
-
-
-class SnmpOutputSourceSensorEntity(SnmpOutputSensorEntity):
-    """Representation of a Eaton UPS output source sensor."""
-
-    _attr_device_class = SensorDeviceClass.ENUM
-    _attr_state_class = None
-    _attr_translation_key = "output_source"
-    _attr_options = [output_source.value for output_source in OutputSource]
-
-    _name_suffix = "Source"
-    _value_oid = SNMP_OID_OUTPUT_SOURCE
-
-
-class SnmpOutputStatusSensorEntity(SnmpOutputSensorEntity):
-    """Representation of a Eaton UPS output status sensor."""
-
-    _attr_device_class = SensorDeviceClass.ENUM
-    _attr_state_class = None
-    _attr_translation_key = "output_status"
-    _attr_options = [output_status.value for output_status in OutputStatus]
-
-    _name_suffix = "Status"
-    _value_oid = SNMP_OID_OUTPUT_STATUS
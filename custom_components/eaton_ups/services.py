@@ -0,0 +1,81 @@
+"""Services of the Eaton UPS integration."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    ATTR_DELAY,
+    ATTR_RESTART_DELAY,
+    DOMAIN,
+    SERVICE_CANCEL_SHUTDOWN,
+    SERVICE_SHUTDOWN,
+    SNMP_OID_CONTROL_OUTPUT_OFF_DELAY,
+    SNMP_OID_CONTROL_OUTPUT_ON_DELAY,
+    SNMP_OID_OUTPUT_STATUS,
+)
+from .coordinator import SnmpCoordinator
+
+SHUTDOWN_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_DELAY): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(ATTR_RESTART_DELAY): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
+CANCEL_SHUTDOWN_SCHEMA = vol.Schema({vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+
+def get_coordinator(hass: HomeAssistant, call: ServiceCall) -> SnmpCoordinator:
+    """Return the coordinator of the config entry of a service call."""
+    entry = hass.config_entries.async_get_entry(call.data[ATTR_CONFIG_ENTRY_ID])
+    if entry is None or entry.domain != DOMAIN:
+        raise ServiceValidationError(
+            f"No Eaton UPS config entry {call.data[ATTR_CONFIG_ENTRY_ID]}"
+        )
+    if entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(f"{entry.title} is not loaded")
+    return entry.runtime_data
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services."""
+
+    async def async_shutdown(call: ServiceCall) -> None:
+        """Turn the output off after a delay, and on again after another one."""
+        values = {SNMP_OID_CONTROL_OUTPUT_OFF_DELAY: call.data[ATTR_DELAY]}
+        if ATTR_RESTART_DELAY in call.data:
+            values[SNMP_OID_CONTROL_OUTPUT_ON_DELAY] = (
+                call.data[ATTR_DELAY] + call.data[ATTR_RESTART_DELAY]
+            )
+        await get_coordinator(hass, call).async_set(
+            values, [SNMP_OID_OUTPUT_STATUS, *values]
+        )
+
+    async def async_cancel_shutdown(call: ServiceCall) -> None:
+        """Abort a pending shutdown and restart."""
+        values = {
+            SNMP_OID_CONTROL_OUTPUT_OFF_DELAY: 0,
+            SNMP_OID_CONTROL_OUTPUT_ON_DELAY: 0,
+        }
+        await get_coordinator(hass, call).async_set(
+            values, [SNMP_OID_OUTPUT_STATUS, *values]
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SHUTDOWN, async_shutdown, schema=SHUTDOWN_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CANCEL_SHUTDOWN,
+        async_cancel_shutdown,
+        schema=CANCEL_SHUTDOWN_SCHEMA,
+    )
@@ -0,0 +1,198 @@
+"""Long-term statistics of the Eaton UPS measurements."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+import math
+from typing import Any
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN, STATISTICS_CHUNK_SIZE
+from .coordinator import SnmpCoordinator
+from .descriptions import SENSORS, SnmpSensorEntityDescription
+
+STORAGE_VERSION = 1
+
+STATISTIC_DESCRIPTIONS = [
+    description for description in SENSORS if description.sensor_class is not None
+]
+
+
+@dataclass(slots=True)
+class HourlyAggregate:
+    """Mean, minimum and maximum of the samples of one hour."""
+
+    start: datetime
+    count: int = 0
+    total: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def as_list(self) -> list[Any]:
+        """Return the aggregate to store."""
+        return [self.start.isoformat(), self.count, self.total, self.min, self.max]
+
+    @classmethod
+    def from_list(cls, stored: list[Any]) -> HourlyAggregate:
+        """Create the aggregate from its stored list."""
+        start, count, total, minimum, maximum = stored
+        return cls(dt_util.parse_datetime(start), count, total, minimum, maximum)
+
+    def data(self) -> StatisticData:
+        """Return the statistic row of the hour."""
+        return StatisticData(
+            start=self.start,
+            mean=self.total / self.count,
+            min=self.min,
+            max=self.max,
+        )
+
+
+class SnmpStatistics:
+    """Aggregate every polled sample into external hourly statistics.
+
+    Long-term statistics have a resolution of one hour, so the samples are
+    not stored individually but folded into the mean, minimum and maximum
+    of their hour. Finished hours are imported in chunks per statistic.
+    The aggregates of the current hour are stored, so a restart continues
+    them and the full hour replaces the part imported on unload.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator: SnmpCoordinator) -> None:
+        """Initialize the statistics."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._metadata: dict[str, StatisticMetaData] = {}
+        self._current: dict[str, HourlyAggregate] = {}
+        self._pending: dict[str, list[StatisticData]] = {}
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}.{coordinator.config_entry.entry_id}.statistics",
+        )
+
+    async def async_load(self) -> None:
+        """Load the aggregates of the previous run.
+
+        Aggregates of a past hour are imported with the next sample of their
+        statistic, which registers its metadata.
+        """
+        if (stored := await self._store.async_load()) is not None:
+            self._current = {
+                statistic_id: HourlyAggregate.from_list(aggregate)
+                for statistic_id, aggregate in stored["current"].items()
+            }
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the aggregates to store."""
+        return {
+            "current": {
+                statistic_id: aggregate.as_list()
+                for statistic_id, aggregate in self._current.items()
+            }
+        }
+
+    @staticmethod
+    def _hour(now: datetime) -> datetime:
+        """Return the start of the hour of a point in time."""
+        return now.replace(minute=0, second=0, microsecond=0)
+
+    def _statistic_id(
+        self, description: SnmpSensorEntityDescription, index: str
+    ) -> str:
+        """Return the statistic id of a value and register its metadata."""
+        identity = self._coordinator.identity
+        statistic_id = (
+            f"{DOMAIN}:{slugify(f'{identity.identifier}_{description.key}_{index}')}"
+        )
+        if statistic_id not in self._metadata:
+            name = description.name_prefix.format(index=index)
+            if description.name_oid is not None and index != "":
+                name += " " + str(
+                    self._coordinator.data.get(
+                        description.name_oid.replace("index", index)
+                    )
+                )
+            self._metadata[statistic_id] = StatisticMetaData(
+                has_sum=False,
+                mean_type=StatisticMeanType.ARITHMETIC,
+                name=" ".join(
+                    filter(None, (identity.name, name, description.name_suffix))
+                ),
+                source=DOMAIN,
+                statistic_id=statistic_id,
+                unit_class=None,
+                unit_of_measurement=description.native_unit_of_measurement,
+            )
+        return statistic_id
+
+    @callback
+    def async_record(self) -> None:
+        """Add the values of the latest successful poll."""
+        coordinator = self._coordinator
+        if not coordinator.last_update_success:
+            return
+
+        hour = self._hour(dt_util.utcnow())
+        for description in STATISTIC_DESCRIPTIONS:
+            for index in coordinator.indexes(description):
+                oid = description.value_oid.replace("index", index)
+                value = coordinator.values.get(oid)
+                if (
+                    oid not in coordinator.data
+                    or coordinator.is_stale(oid)
+                    or not isinstance(value, int | float)
+                ):
+                    continue
+                statistic_id = self._statistic_id(description, index)
+                aggregate = self._current.get(statistic_id)
+                if aggregate is None or aggregate.start != hour:
+                    if aggregate is not None:
+                        self._pending.setdefault(statistic_id, []).append(
+                            aggregate.data()
+                        )
+                    aggregate = self._current[statistic_id] = HourlyAggregate(hour)
+                aggregate.add(value)
+
+        if self._pending:
+            self._import()
+        self._store.async_delay_save(self._data_to_save, 60)
+
+    @callback
+    def async_flush(self) -> None:
+        """Import the finished hours and the samples of the current hour."""
+        for statistic_id, aggregate in self._current.items():
+            if statistic_id in self._metadata:
+                self._pending.setdefault(statistic_id, []).append(aggregate.data())
+        self._import()
+        self._store.async_delay_save(self._data_to_save, 0)
+
+    def _import(self) -> None:
+        """Import the pending rows in chunks."""
+        for statistic_id, rows in self._pending.items():
+            for start in range(0, len(rows), STATISTICS_CHUNK_SIZE):
+                async_add_external_statistics(
+                    self._hass,
+                    self._metadata[statistic_id],
+                    rows[start : start + STATISTICS_CHUNK_SIZE],
+                )
+        self._pending.clear()
@@ -0,0 +1,57 @@
+"""Support for Eaton UPS switches."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.switch import SwitchEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .coordinator import SnmpCoordinator
+from .descriptions import SWITCHES, SnmpSwitchEntityDescription
+from .entity import SnmpEntity, async_add_described_entities
+
+# Switching several switches runs in parallel to be set in one request.
+PARALLEL_UPDATES = 0
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the switches."""
+    async_add_described_entities(entry, SWITCHES, SnmpSwitchEntity, async_add_entities)
+
+
+class SnmpSwitchEntity(SnmpEntity, SwitchEntity):
+    """Representation of a Eaton UPS switch."""
+
+    entity_description: SnmpSwitchEntityDescription
+
+    def __init__(
+        self,
+        coordinator: SnmpCoordinator,
+        description: SnmpSwitchEntityDescription,
+        index: str = "",
+    ) -> None:
+        """Initialize a Eaton UPS switch."""
+        super().__init__(coordinator, description, index)
+        self._on_oid = description.on_oid.replace("index", index)
+        self._off_oid = description.off_oid.replace("index", index)
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return true if the switch is on."""
+        value = self.coordinator.data.get(self._value_oid)
+        if value is None:
+            return None
+        return value in self.entity_description.on_values
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the switch on without delay."""
+        await self.coordinator.async_set({self._on_oid: 0}, [self._value_oid])
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the switch off without delay."""
+        await self.coordinator.async_set({self._off_oid: 0}, [self._value_oid])
@@ -0,0 +1,103 @@
+"""Worker thread for CPU heavy SNMP processing."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_WORKER
+
+if TYPE_CHECKING:
+    from pysnmp.hlapi.asyncio import SnmpEngine
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class SnmpWorker:
+    """Run SNMP requests on a dedicated thread with its own loop and engine.
+
+    Message encoding, USM authentication and encryption then happen on the
+    worker thread and the caller's event loop only awaits the results.
+    """
+
+    def __init__(self) -> None:
+        """Init the SnmpWorker."""
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._snmpEngine: SnmpEngine | None = None
+        self._users = 0
+        self.ready: asyncio.Future[None] | None = None
+
+    @property
+    def snmpEngine(self) -> SnmpEngine:
+        """Return the SNMP engine owned by the worker thread."""
+        return self._snmpEngine
+
+    def start(self) -> None:
+        """Start the worker thread and wait until it is ready."""
+        ready = threading.Event()
+
+        def run() -> None:
+            from pysnmp.hlapi.asyncio import SnmpEngine
+
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._snmpEngine = SnmpEngine()
+            self._loop.call_soon(ready.set)
+            self._loop.run_forever()
+            self._snmpEngine.close_dispatcher()
+            self._loop.run_until_complete(asyncio.sleep(0))
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="eaton_ups_snmp", daemon=True)
+        self._thread.start()
+        ready.wait()
+        _LOGGER.debug("Started SNMP worker thread")
+
+    def stop(self) -> None:
+        """Stop the worker thread."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = None
+            _LOGGER.debug("Stopped SNMP worker thread")
+
+    def acquire(self) -> None:
+        """Register a user of the worker."""
+        self._users += 1
+
+    def release(self) -> bool:
+        """Unregister a user of the worker and return if it is unused."""
+        self._users -= 1
+        return self._users <= 0
+
+    async def async_run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run the coroutine on the worker loop and return its result."""
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coro, self._loop)
+        )
+
+
+async def async_get_worker(hass: HomeAssistant) -> SnmpWorker:
+    """Return the shared worker, starting it on first use."""
+    worker: SnmpWorker | None = hass.data.get(DATA_WORKER)
+    if worker is None:
+        worker = hass.data[DATA_WORKER] = SnmpWorker()
+        worker.ready = hass.async_add_executor_job(worker.start)
+    worker.acquire()
+    await worker.ready
+    return worker
+
+
+async def async_release_worker(hass: HomeAssistant, worker: SnmpWorker) -> None:
+    """Release the shared worker, stopping it when no entry uses it anymore."""
+    if worker.release():
+        hass.data.pop(DATA_WORKER, None)
+        await hass.async_add_executor_job(worker.stop)
@@ -0,0 +1 @@
+"""Tests for the Eaton UPS integration."""
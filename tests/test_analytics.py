@@ -0,0 +1,134 @@
+"""Test the battery aging analytics."""
+
+import math
+
+import pytest
+
+from custom_components.eaton_ups.analytics import (
+    SECONDS_PER_DAY,
+    TimeToEmptyEstimator,
+    fit_aging,
+    summarize_discharge,
+)
+from custom_components.eaton_ups.const import (
+    DERIVED_BATTERY_CAPACITY_TREND,
+    DERIVED_BATTERY_HEALTH,
+    DERIVED_BATTERY_REFERENCE_RUNTIME,
+)
+
+
+def test_summarize_discharge() -> None:
+    """Test a linear discharge is reduced to its start, load and runtime."""
+    samples = [
+        [1000 + t, 50 if t % 120 else 40, 100 - t / 60] for t in range(0, 660, 60)
+    ]
+
+    started, load, runtime = summarize_discharge(samples)
+
+    assert started == 1000
+    assert load == pytest.approx(sum(sample[1] for sample in samples) / len(samples))
+    assert runtime == pytest.approx(6000)
+
+
+@pytest.mark.parametrize(
+    "samples",
+    [
+        [[0, 50, 100], [60, 50, 90]],
+        [[0, 50, 100], [600, 50, 98]],
+        [[0, 50, 90], [300, 50, 95], [600, 50, 100]],
+        [[0, 0, 100], [300, 0, 95], [600, 0, 90]],
+    ],
+    ids=["too_short", "too_small_drop", "rising", "no_load"],
+)
+def test_summarize_discharge_ignored(samples: list[list[float]]) -> None:
+    """Test discharges without a usable capacity slope are ignored."""
+    assert summarize_discharge(samples) is None
+
+
+def test_fit_aging_single_event() -> None:
+    """Test one discharge scales its runtime inversely to the load."""
+    result = fit_aging([[0, 25, 1000]], 0)
+
+    assert result == {
+        DERIVED_BATTERY_REFERENCE_RUNTIME: 500,
+        DERIVED_BATTERY_HEALTH: None,
+        DERIVED_BATTERY_CAPACITY_TREND: None,
+    }
+
+
+@pytest.mark.parametrize("runtimes", [(800, 1000), (1000, 800)])
+def test_fit_aging_short_span(runtimes: tuple[int, int]) -> None:
+    """Test discharges close together do not extrapolate a fade."""
+    events = [[0, 50, runtimes[0]], [3600, 50, runtimes[1]]]
+
+    result = fit_aging(events, 7200)
+
+    assert result[DERIVED_BATTERY_REFERENCE_RUNTIME] == round(math.sqrt(800 * 1000))
+    assert result[DERIVED_BATTERY_HEALTH] is None
+    assert result[DERIVED_BATTERY_CAPACITY_TREND] is None
+
+
+def test_fit_aging_fade() -> None:
+    """Test the fade of discharges spanning months."""
+    events = [
+        [day * SECONDS_PER_DAY, 50, 1000 * 0.999**day] for day in (0, 60, 120, 180)
+    ]
+
+    result = fit_aging(events, 180 * SECONDS_PER_DAY)
+
+    assert result[DERIVED_BATTERY_REFERENCE_RUNTIME] == round(1000 * 0.999**180)
+    assert result[DERIVED_BATTERY_HEALTH] == pytest.approx(100 * 0.999**180, abs=0.1)
+    assert result[DERIVED_BATTERY_CAPACITY_TREND] == pytest.approx(
+        100 * (0.999**365 - 1), abs=0.1
+    )
+
+
+def test_fit_aging_load_exponent() -> None:
+    """Test discharges at different loads fit the load exponent."""
+    events = [[0, load, 50000 * load**-1.2] for load in (20, 40, 80)]
+
+    result = fit_aging(events, 0)
+
+    assert result[DERIVED_BATTERY_REFERENCE_RUNTIME] == round(50000 * 50**-1.2)
+    assert result[DERIVED_BATTERY_HEALTH] is None
+
+
+def test_fit_aging_bounded() -> None:
+    """Test an implausible fade does not overflow."""
+    events = [[0, 50, 10], [30 * SECONDS_PER_DAY, 50, 10**8]]
+
+    result = fit_aging(events, 10000 * SECONDS_PER_DAY)
+
+    assert result[DERIVED_BATTERY_HEALTH] > 100
+    assert result[DERIVED_BATTERY_CAPACITY_TREND] > 100
+
+
+def test_time_to_empty_seeded() -> None:
+    """Test the estimate of the card seeds the rate until the first change."""
+    estimator = TimeToEmptyEstimator()
+
+    assert estimator.update(0, 100, 50, 3000) == 3000
+    assert estimator.update(30, 100, 50, 3000) == 3000
+
+    # The observed rate predicts 5940 seconds and is blended in.
+    estimate = estimator.update(60, 99, 50, 3000)
+    assert 3000 < estimate < 5940
+
+
+def test_time_to_empty_observed() -> None:
+    """Test the rate is measured between capacity changes."""
+    estimator = TimeToEmptyEstimator()
+
+    assert estimator.update(0, 100, 50, None) is None
+    assert estimator.update(60, 99, 50, None) == 5940
+    assert estimator.update(120, 99, 0, None) is None
+
+
+def test_time_to_empty_reset() -> None:
+    """Test a reset forgets the rate of the previous discharge."""
+    estimator = TimeToEmptyEstimator()
+    estimator.update(0, 100, 50, 3000)
+
+    estimator.reset()
+
+    assert estimator.update(0, 100, 50, None) is None